@@ -0,0 +1,203 @@
+"""
+    Artefatos - COTEFÁCIL
+    ---------------------
+    Captura de diagnóstico dos registros com falha.
+
+    Quando um registro falha, são capturados a imagem da tela, o código-fonte da página e o rastro das etapas
+    executadas (resultado de cada campo). Nada é capturado nos registros com sucesso, para não reduzir a vazão.
+    A captura em si é feita na thread do registro, enquanto a página ainda mostra a falha; a compressão e a gravação
+    em disco ficam para uma thread em segundo plano, de modo que a sessão volta ao próximo registro sem esperar o disco.
+
+    Cada falha gera um arquivo 'registro-<índice>.zip' com 'tela.png', 'pagina.html', 'url.txt' e 'etapas.json'.
+    O total gravado por execução é limitado, contando também as capturas que ainda aguardam gravação; depois do limite,
+    novas falhas continuam registradas nos resultados, mas sem artefatos. A fila de gravação também é limitada: em uma
+    sequência de falhas mais rápida que o disco, as novas capturas são descartadas (e contadas) em vez de acumuladas
+    na memória, e nenhuma captura é feita quando ela já seria descartada.
+
+
+    Exemplo de uso:
+    ---------------
+        with coletar_artefatos("artefatos", limite_mb=100):
+            executar_lote("registros.jsonl", "resultados.jsonl")
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import io
+import json
+import os
+import queue
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from colorama import Fore, Style
+
+
+"""
+    COLETOR
+    -------
+"""
+
+_FIM = object()
+
+
+class ColetorArtefatos:
+    """
+        Coletor de artefatos
+        --------------------
+        Recebe as capturas das falhas e as grava, comprimidas, em uma thread em segundo plano.
+        Pode ser usado por várias sessões ao mesmo tempo.
+
+        Parâmetros: Pasta dos artefatos, limite total da execução em MB (opcional),
+                    número máximo de capturas aguardando gravação (opcional).
+    """
+
+    def __init__(self, pasta: str, limite_mb: float = 100, fila_maxima: int = 8):
+        self.pasta = pasta
+        self.limite = int(limite_mb * 2**20)
+        self.gravados = 0
+        self.descartados = 0
+        self._bytes = 0
+        self._pendentes = 0
+        self._trava = threading.Lock()
+        self._fila = queue.Queue(maxsize=fila_maxima)
+        os.makedirs(pasta, exist_ok=True)
+        self._thread = threading.Thread(target=self._gravar, daemon=True)
+        self._thread.start()
+
+    def _descartar(self, tamanho: int = 0):
+        with self._trava:
+            self._pendentes -= tamanho
+            self.descartados += 1
+
+    def _sem_espaco(self) -> bool:
+        with self._trava:
+            return self._bytes + self._pendentes >= self.limite or self._fila.full()
+
+    def capturar(self, navegador, resultado):
+        """
+            Captura da falha
+            ----------------
+            Captura a tela, o código-fonte da página e o rastro das etapas do registro e envia para gravação.
+            Um erro na captura (por exemplo, um navegador que deixou de responder) não interrompe a execução;
+            o que tiver sido capturado é gravado mesmo assim. Com o limite atingido ou a fila cheia, a falha é apenas
+            contada como descartada, sem captura.
+
+            Parâmetros: Navegador, ResultadoRegistro com falha.
+        """
+        if self._sem_espaco():
+            self._descartar()
+            return
+
+        etapas = dict(resultado.como_dict(), capturado_em=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        arquivos = {}
+        for nome, capturar in (("tela.png", navegador.get_screenshot_as_png),
+                               ("pagina.html", lambda: navegador.page_source.encode("utf-8")),
+                               ("url.txt", lambda: navegador.current_url.encode("utf-8"))):
+            try:
+                arquivos[nome] = capturar()
+            except Exception as e:
+                etapas.setdefault("erros_captura", {})[nome] = str(e)
+        arquivos["etapas.json"] = json.dumps(etapas, ensure_ascii=False, indent=2).encode("utf-8")
+
+        tamanho = sum(len(dados) for dados in arquivos.values())
+        with self._trava:
+            if self._bytes + self._pendentes + tamanho > self.limite:
+                self.descartados += 1
+                return
+            self._pendentes += tamanho
+        try:
+            self._fila.put_nowait((resultado.indice, arquivos, tamanho))
+        except queue.Full:
+            self._descartar(tamanho)
+
+    def _gravar(self):
+        while True:
+            item = self._fila.get()
+            if item is _FIM:
+                return
+            indice, arquivos, tamanho = item
+            try:
+                conteudo = io.BytesIO()
+                with zipfile.ZipFile(conteudo, "w", zipfile.ZIP_DEFLATED) as arquivo_zip:
+                    for nome, dados in arquivos.items():
+                        arquivo_zip.writestr(nome, dados)
+                dados = conteudo.getvalue()
+
+                with self._trava:
+                    self._bytes += len(dados)
+                    self.gravados += 1
+                with open(os.path.join(self.pasta, f"registro-{indice}.zip"), "wb") as arquivo:
+                    arquivo.write(dados)
+            except Exception as e:
+                print(f"{Fore.YELLOW}\nErro ao gravar os artefatos do registro {indice}:{Style.RESET_ALL} {e}")
+            finally:
+                with self._trava:
+                    self._pendentes -= tamanho
+
+    def encerrar(self):
+        """
+            Encerramento
+            ------------
+            Aguarda a gravação das capturas pendentes e encerra a thread de gravação.
+
+            Não exige parâmetros.
+        """
+        self._fila.put(_FIM)
+        self._thread.join()
+
+
+"""
+    COLETOR ATIVO
+    -------------
+"""
+
+_coletor = None
+
+
+def capturar_falha(navegador, resultado):
+    """
+        Captura de falha
+        ----------------
+        Envia o registro ao coletor ativo quando ele falhou. Sem coletor ativo ou com sucesso, não faz nada.
+
+        Parâmetros: Navegador, ResultadoRegistro.
+    """
+    coletor = _coletor
+    if coletor is not None and resultado.status == "falha":
+        coletor.capturar(navegador, resultado)
+
+
+@contextmanager
+def coletar_artefatos(pasta: str = None, limite_mb: float = 100):
+    """
+        Coleta de artefatos
+        -------------------
+        Ativa um ColetorArtefatos durante o bloco e aguarda a gravação das capturas ao final, mesmo em caso de erro.
+        Sem pasta, o bloco é executado sem coleta.
+
+            Exemplo:
+
+                with coletar_artefatos("artefatos"):
+                    executar_paralelo("registros.jsonl", "resultados.jsonl", sessoes=8)
+
+        Parâmetros: Pasta dos artefatos (opcional), limite total da execução em MB (opcional).
+    """
+    global _coletor
+    if not pasta:
+        yield None
+        return
+    coletor = ColetorArtefatos(pasta, limite_mb)
+    _coletor = coletor
+    try:
+        yield coletor
+    finally:
+        _coletor = None
+        coletor.encerrar()
+        if coletor.gravados or coletor.descartados:
+            print(f"{Fore.YELLOW}\nArtefatos de falha:{Style.RESET_ALL} {coletor.gravados} gravados em '{pasta}', "
+                  f"{coletor.descartados} descartados pelo limite de {limite_mb} MB.")
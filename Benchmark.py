@@ -0,0 +1,164 @@
+"""
+    Benchmark - COTEFÁCIL
+    ---------------------
+    Mede a vazão (registros por segundo) do fluxo de cadastro contra as páginas locais do ServidorLocal,
+    sem acesso à rede, para que os números possam ser comparados entre versões do código.
+
+    O benchmark gera registros válidos, inicia o servidor local, abre um Chrome sem interface gráfica e executa
+    o lote em cada modo de preenchimento solicitado. As mensagens das funções do formulário são descartadas
+    durante a medição, para que o tempo de escrita no terminal não interfira no resultado.
+
+
+    Exemplo de uso:
+    ---------------
+        python Benchmark.py --registros 50
+        python Benchmark.py --registros 50 --modos fiel rapido --relatorio benchmark.json
+        python Benchmark.py --registros 50 --perfil leve
+        python Benchmark.py --registros 50 --pular-login
+        python Benchmark.py --registros 50 --minimo 2.5   -> código de saída 1 se algum modo ficar abaixo de 2,5 registros/s
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from colorama import Fore, Style
+import Lote
+import TesteAutomatizado
+from Formulario import LISTA_HOBBIES, LISTA_IDIOMAS, LISTA_SKILLS
+from Metricas import ColetorMetricas, adicionar_observador, remover_observador
+from Navegador import PERFIS, criar_navegador
+from ServidorLocal import iniciar_servidor
+
+
+"""
+    REGISTROS
+    ---------
+"""
+
+def gerar_registros(quantidade: int) -> list:
+    """
+        Geração de registros
+        --------------------
+        Gera registros válidos e determinísticos para o benchmark.
+
+        Parâmetro: Quantidade de registros.
+    """
+    generos = ["Feminino", "Masculino"]
+    return [
+        {
+            "email_login": f"usuario{i}@email.com",
+            "nome": f"Nome{i}",
+            "sobrenome": f"Sobrenome{i}",
+            "endereco": f"Rua {i}, Centro",
+            "email": f"usuario{i}@email.com",
+            "telefone": f"{i % 10**10:010d}",
+            "genero": generos[i % len(generos)],
+            "hobbies": [LISTA_HOBBIES[i % len(LISTA_HOBBIES)]],
+            "idiomas": [LISTA_IDIOMAS[i % len(LISTA_IDIOMAS)]],
+            "skill": LISTA_SKILLS[i % len(LISTA_SKILLS)],
+            "pais": "Brasil",
+            "ano": 1916 + i % 100,
+            "mes": 1 + i % 12,
+            "dia": 1 + i % 28,
+            "senha": f"Senha{i:03d}",
+        }
+        for i in range(quantidade)
+    ]
+
+
+"""
+    MEDIÇÃO
+    -------
+"""
+
+def medir_modo(navegador, entrada: str, modo: str, pular_login: bool = False) -> dict:
+    """
+        Medição de um modo
+        ------------------
+        Executa o lote no modo informado e retorna a vazão e o resumo das etapas.
+
+        Parâmetros: Navegador, arquivo de registros, modo de preenchimento, pular o login (opcional).
+    """
+    coletor = ColetorMetricas()
+    adicionar_observador(coletor)
+    saida = entrada + f".{modo}.resultados.jsonl"
+    try:
+        navegador.get(TesteAutomatizado.pagina_inicial(pular_login))
+        inicio = time.perf_counter()
+        with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+            resumo = Lote.executar_lote(entrada, saida, navegador=navegador, modo=modo, pular_login=pular_login)
+        duracao = time.perf_counter() - inicio
+    finally:
+        remover_observador(coletor)
+
+    registros = resumo["ok"] + resumo["falha"]
+    return {
+        "modo": modo,
+        "registros": registros,
+        "falhas": resumo["falha"],
+        "duracao": round(duracao, 3),
+        "registros_por_segundo": round(registros / duracao, 3) if duracao else 0.0,
+        "etapas": coletor.resumo(),
+    }
+
+
+def main(argumentos=None) -> int:
+    """
+        Execução do benchmark
+        ---------------------
+        Lê os argumentos da linha de comando, executa os modos solicitados e exibe a vazão de cada um.
+        Retorna 1 quando algum registro falha ou quando a vazão fica abaixo do mínimo informado.
+
+        Parâmetro: Lista de argumentos (opcional; por padrão, sys.argv).
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do fluxo de cadastro contra as páginas locais.")
+    parser.add_argument("--registros", type=int, default=20, help="quantidade de registros por modo")
+    parser.add_argument("--modos", nargs="+", choices=sorted(Lote.MODOS), default=["fiel"], help="modos de preenchimento medidos")
+    parser.add_argument("--relatorio", help="arquivo JSON com a vazão e o resumo das etapas de cada modo")
+    parser.add_argument("--perfil", choices=sorted(PERFIS), default="headless", help="perfil de inicialização do Chrome")
+    parser.add_argument("--pular-login", action="store_true", help="começa cada registro direto na tela de cadastro")
+    parser.add_argument("--minimo", type=float, help="vazão mínima aceita, em registros por segundo")
+    args = parser.parse_args(argumentos)
+
+    servidor, url_base = iniciar_servidor()
+    url_original = TesteAutomatizado.url
+    TesteAutomatizado.url = url_base + "Index.html"
+    navegador = criar_navegador(PERFIS[args.perfil])
+
+    try:
+        with tempfile.TemporaryDirectory() as pasta:
+            entrada = os.path.join(pasta, "registros.jsonl")
+            with open(entrada, "w", encoding="utf-8") as arquivo:
+                for registro in gerar_registros(args.registros):
+                    arquivo.write(json.dumps(registro) + "\n")
+            medicoes = [medir_modo(navegador, entrada, modo, args.pular_login) for modo in args.modos]
+    finally:
+        navegador.quit()
+        servidor.shutdown()
+        TesteAutomatizado.url = url_original
+
+    codigo = 0
+    for medicao in medicoes:
+        cor = Fore.GREEN
+        if medicao["falhas"] or (args.minimo is not None and medicao["registros_por_segundo"] < args.minimo):
+            cor, codigo = Fore.RED, 1
+        print(f"{cor}{medicao['modo']:>8}:{Style.RESET_ALL} {medicao['registros_por_segundo']:.2f} registros/s "
+              f"({medicao['registros']} registros em {medicao['duracao']:.2f} s, {medicao['falhas']} falhas)")
+
+    if args.relatorio:
+        with open(args.relatorio, "w", encoding="utf-8") as arquivo:
+            json.dump({"medicoes": medicoes}, arquivo, ensure_ascii=False, indent=2)
+    return codigo
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+    Espera - COTEFÁCIL
+    ------------------
+    Gerenciador de espera dos elementos do formulário.
+
+    Antes, cada campo criava um novo WebDriverWait(navegador, 10) e consultava o navegador no intervalo padrão
+    de 0,5 s. Como todos os campos da tela de cadastro aparecem juntos, o gerenciador aguarda uma única vez até que o
+    formulário 'basicBootstrapForm' esteja presente e, a partir daí, guarda os elementos já localizados até o fim do
+    registro. Um elemento só é localizado de novo quando o navegador informa que ele deixou de existir na página
+    (StaleElementReferenceException), por exemplo, após um recarregamento.
+
+    As ações sobre os elementos seguem a política de novas tentativas informada (módulo Retentativa), e nenhuma
+    espera ultrapassa o orçamento de tempo do registro em andamento.
+
+    Cada navegador tem o seu próprio gerenciador, obtido por espera(navegador); por isso, sessões paralelas não
+    compartilham elementos. As execuções em lote chamam reiniciar_espera() no início de cada registro.
+
+
+    Exemplo de uso:
+    ---------------
+        gerenciador = espera(navegador)
+        gerenciador.aguardar_formulario()
+        gerenciador.usar((By.ID, "yearbox"), EC.visibility_of_element_located, lambda elemento: elemento.send_keys("1990"))
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import threading
+import weakref
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException
+from Retentativa import repetir, tempo_restante
+
+
+"""
+    CONFIGURAÇÕES
+    -------------
+    TEMPO_LIMITE: Tempo máximo de espera por um elemento, em segundos (o mesmo dos antigos WebDriverWait).
+    INTERVALO: Intervalo entre as consultas ao navegador, em segundos (o padrão do Selenium é 0,5 s).
+    FORMULARIO: Localizador do formulário da tela de cadastro.
+"""
+
+TEMPO_LIMITE = 10
+INTERVALO = 0.05
+FORMULARIO = (By.ID, "basicBootstrapForm")
+
+
+class GerenciadorEspera:
+    """
+        Gerenciador de espera
+        ---------------------
+        Localiza os elementos de um navegador com espera explícita e guarda os elementos localizados até reiniciar().
+
+        Parâmetros: Navegador, tempo limite (opcional), intervalo entre consultas (opcional).
+    """
+
+    def __init__(self, navegador, tempo_limite: float = TEMPO_LIMITE, intervalo: float = INTERVALO):
+        self._navegador = weakref.ref(navegador)
+        self._tempo_limite = tempo_limite
+        self._intervalo = intervalo
+        self._elementos = {}
+        self._formulario = False
+
+    def _aguardar(self, condicao, tempo_limite: float = None):
+        tempo_limite = tempo_restante(tempo_limite or self._tempo_limite)
+        return WebDriverWait(self._navegador(), tempo_limite, poll_frequency=self._intervalo).until(condicao)
+
+    def reiniciar(self):
+        """
+            Reinício
+            --------
+            Descarta os elementos guardados e a confirmação do formulário, como no início de um novo registro.
+
+            Não exige parâmetros.
+        """
+        self._elementos.clear()
+        self._formulario = False
+
+    def aguardar_formulario(self, localizar_todos=None):
+        """
+            Espera do formulário
+            --------------------
+            Aguarda até que o formulário de cadastro esteja presente. Depois da primeira confirmação, retorna imediatamente.
+            Com uma função de localização, os elementos que ela retornar ({localizador: elemento}) são guardados logo
+            após a confirmação, sem uma espera por elemento.
+
+            Parâmetro: Função sem argumentos que localiza os elementos do formulário (opcional).
+        """
+        if not self._formulario:
+            self._aguardar(EC.presence_of_element_located(FORMULARIO))
+            self._formulario = True
+            if localizar_todos is not None:
+                self._elementos.update(localizar_todos())
+
+    def elemento(self, localizador: tuple, condicao=EC.presence_of_element_located, tempo_limite: float = None):
+        """
+            Localização do elemento
+            -----------------------
+            Retorna o elemento guardado ou, na primeira vez, aguarda a condição e guarda o elemento encontrado.
+
+            Parâmetros: Localizador (By, valor), condição do módulo expected_conditions (opcional; por padrão, presença),
+                        tempo limite da espera em segundos (opcional; por padrão, o do gerenciador).
+        """
+        elemento = self._elementos.get(localizador)
+        if elemento is None:
+            elemento = self._aguardar(condicao(localizador), tempo_limite)
+            self._elementos[localizador] = elemento
+        return elemento
+
+    def usar(self, localizador: tuple, condicao, acao, politica=None):
+        """
+            Uso do elemento
+            ---------------
+            Executa a ação com o elemento e retorna o resultado da ação.
+            Nas falhas passageiras, a ação é repetida conforme a política; se o elemento guardado não existir mais
+            na página, ele é descartado e localizado de novo na tentativa seguinte.
+
+            Parâmetros: Localizador (By, valor), condição do módulo expected_conditions, função que recebe o elemento,
+                        política de novas tentativas (opcional; por padrão, a política 'padrao' do módulo Retentativa).
+        """
+        def tentar():
+            try:
+                return acao(self.elemento(localizador, condicao, politica.espera_elemento if politica else None))
+            except StaleElementReferenceException:
+                self._elementos.pop(localizador, None)
+                raise
+
+        return repetir(tentar, politica)
+
+
+"""
+    GERENCIADORES POR NAVEGADOR
+    ---------------------------
+"""
+
+_gerenciadores = weakref.WeakKeyDictionary()
+_trava = threading.Lock()
+
+
+def espera(navegador) -> GerenciadorEspera:
+    """
+        Gerenciador do navegador
+        ------------------------
+        Retorna o gerenciador de espera do navegador, criando-o na primeira chamada.
+
+        Parâmetro: Navegador.
+    """
+    with _trava:
+        gerenciador = _gerenciadores.get(navegador)
+        if gerenciador is None:
+            gerenciador = _gerenciadores[navegador] = GerenciadorEspera(navegador)
+        return gerenciador
+
+
+def reiniciar_espera(navegador):
+    """
+        Reinício da espera
+        ------------------
+        Descarta os elementos guardados do navegador, caso ele já tenha um gerenciador.
+
+        Parâmetro: Navegador.
+    """
+    with _trava:
+        gerenciador = _gerenciadores.get(navegador)
+    if gerenciador is not None:
+        gerenciador.reiniciar()
@@ -0,0 +1,517 @@
+"""
+    Formulário - COTEFÁCIL
+    ----------------------
+    Esquema declarativo dos campos das telas de login e de cadastro e o motor genérico que o executa.
+
+    Cada campo é descrito uma única vez, com o nome, a chave do registro, o tipo de componente, os localizadores,
+    os validadores e as mensagens exibidas no terminal. As funções preencher_* e selecionar_* do Teste Automatizado
+    apenas chamam executar_campo() com o campo correspondente.
+
+
+    TIPOS DE COMPONENTE:
+    --------------------
+    'texto': Campos de texto; o mesmo valor é inserido em cada localizador (por exemplo, senha e confirmação).
+    'radio': Radio button; o valor do registro é convertido para o valor do elemento pelas opções do campo.
+    'checkbox': Um checkbox por valor da lista.
+    'select': Campo '<select>'; com 'criar_opcao', a opção é adicionada ao select quando não existe.
+    'multiselect': Componente 'multi-select' de idiomas; abre a lista e clica em cada opção.
+    'data': Três selects (ano, mês e dia).
+    'arquivo': Seletor de arquivos.
+    'botao': Botão de envio, sem valor.
+
+
+    VALIDAÇÃO:
+    ----------
+    As expressões regulares são compiladas e as listas de opções convertidas em frozenset uma única vez, na definição
+    do esquema. A função validar_registro() aplica todos os validadores a um registro sem acessar o navegador.
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import asyncio
+import functools
+import re
+from dataclasses import dataclass
+from colorama import Fore, Style
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
+from Resultado import registrar_resultado, executar_etapas, executar_etapas_async
+from Espera import espera
+from Retentativa import politica, verificar_orcamento
+from Localizadores import localizadores_fixos, montar_registro, resolver_todos
+
+
+"""
+    OPÇÕES E FORMATOS
+    -----------------
+"""
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}$'
+TELEFONE_PATTERN = r'^\d{10}$'
+SENHA_PATTERN = r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)[A-Za-z\d]{8,}$'
+
+LISTA_HOBBIES = ["Cricket", "Movies", "Hockey"]
+
+LISTA_IDIOMAS = ['Arabic', 'Bulgarian', 'Catalan', 'Croatian', 'Czech', 'Danish', 'Dutch', 'English', 'Estonian', 'Filipino', 
+                 'Finnish', 'French', 'German', 'Greek','Hebrew', 'Hindi', 'Hungarian', 'Icelandic', 'Indonesian', 'Italian', 
+                 'Japanese', 'Korean', 'Latvian', 'Lithuanian', 'Malay', 'Norwegian', 'Persian', 'Polish', 'Portuguese', 'Romanian', 
+                 'Russian', 'Serbian', 'Spanish', 'Swedish', 'Thai', 'Turkish', 'Ukrainian', 'Urdu', 'Vietnamese']
+
+LISTA_SKILLS = ['Adobe InDesign', 'Adobe Photoshop', 'Analytics', 'Android', 'APIs', 'Art Design', 'AutoCAD', 'Backup Management', 'C', 'C++', 'Certifications', 
+                'Client Server', 'Client Support', 'Configuration', 'Content Management', 'Content Management Systems (CMS)', 'Corel Draw', 'Corel Word Perfect', 
+                'CSS', 'Data Analytics', 'Desktop Publishing', 'Design', 'Diagnostics', 'Documentation', 'End User Support', 'Email', 'Engineering', 'Excel', 
+                'FileMaker Pro', 'Fortran HTML', 'Implementation', 'Installation', 'Internet', 'iOS', 'iPhone', 'Linux', 'Java', 'JavaScript', 'Mac', 'Matlab', 
+                'Maya', 'Micrisoft Excel', 'Microsoft', 'Microsoft Office', 'Microsoft Outlook', 'Microsoft Publisher', 'Microsoft Word', 'Microsoft Visual', 
+                'Mobile', 'MySQL', 'Networks', 'Open Source Software', 'Oracle', 'Perl', 'PHP', 'Presentations', 'Processing', 'Programming', 'PT Modeler', 
+                'Python', 'QuickBooks', 'Ruby', 'Shade', 'Software', 'Spreadsheet', 'SQL', 'Support', 'System Administration', 'Tech Support', 'Troubleshooting', 
+                'Unix', 'UI / UX', 'Page Design', 'Windows', 'Word Processing', 'XML', 'XHTML']
+
+MESES = {1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June", 7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"}
+
+GENEROS = {"Feminino": "FeMale", "Masculino": "Male"}
+
+
+"""
+    VALIDADORES
+    -----------
+    Cada validador recebe o valor do campo e lança ValueError com a mensagem exibida ao usuário.
+"""
+
+def formato(padrao: str, mensagem: str):
+    """
+        Validador de formato
+        --------------------
+        Compila a expressão regular uma única vez e valida o valor contra ela.
+
+        Parâmetros: Expressão regular, mensagem de erro.
+    """
+    compilado = re.compile(padrao)
+
+    def validar(valor):
+        if not compilado.match(valor):
+            raise ValueError(mensagem)
+    return validar
+
+
+def opcao(opcoes, mensagem: str):
+    """
+        Validador de opção única
+        ------------------------
+        Valida que o valor pertence às opções do campo. A mensagem pode usar '{valor}'.
+
+        Parâmetros: Opções válidas, mensagem de erro.
+    """
+    opcoes = frozenset(opcoes)
+
+    def validar(valor):
+        if valor not in opcoes:
+            raise ValueError(mensagem.format(valor=valor))
+    return validar
+
+
+def opcoes_lista(opcoes, mensagem: str, agrupar: bool = False):
+    """
+        Validador de lista de opções
+        ----------------------------
+        Valida que todos os itens da lista pertencem às opções do campo.
+        Sem agrupar, o erro cita o primeiro item inválido ('{valor}'); agrupando, cita todos ('{valores}').
+
+        Parâmetros: Opções válidas, mensagem de erro, agrupar os itens inválidos na mensagem (opcional).
+    """
+    opcoes = frozenset(opcoes)
+
+    def validar(valores):
+        invalidos = [valor for valor in valores if valor not in opcoes]
+        if invalidos:
+            if agrupar:
+                raise ValueError(mensagem.format(valores=", ".join(invalidos)))
+            raise ValueError(mensagem.format(valor=invalidos[0]))
+    return validar
+
+
+def validar_data(valor):
+    """
+        Validador de data
+        -----------------
+        Valida o ano (1916 a 2015), o mês (1 a 12) e o dia (1 a 31).
+
+        Parâmetro: Tupla (ano, mês, dia).
+    """
+    ano, mes, dia = valor
+    if not all(isinstance(item, int) and not isinstance(item, bool) for item in valor):
+        raise ValueError("Insira o ano, o mês e o dia como números inteiros.")
+    if not (1916 <= ano <= 2015):
+        raise ValueError("Insira um ano entre 1916 e 2015.")
+    if not (1 <= mes <= 12):
+        raise ValueError("Insira um mês entre 1 e 12.")
+    if not (1 <= dia <= 31):
+        raise ValueError("Insira um dia entre 1 e 31.")
+
+
+"""
+    ESQUEMA
+    -------
+"""
+
+@dataclass(frozen=True)
+class Campo:
+    """
+        Campo do formulário
+        -------------------
+        nome: Nome do campo nos resultados e nas métricas.
+        tipo: Tipo de componente (ver início do módulo).
+        localizadores: Localizadores (By, valor) originais. Em 'radio' e 'checkbox', o valor contém '{}',
+                       substituído pelo valor do elemento.
+        seletores: Seletores CSS equivalentes, usados no modo rápido e, como ID ou CSS, no modo fiel (módulo Localizadores).
+                   Usam atributos estáveis do elemento (id, placeholder, type, value) em vez da posição na página.
+        chaves: Chaves do registro que formam o valor do campo.
+        rotulo, acao: Compõem a mensagem de sucesso ("Nome 'Ana' inserido com sucesso.").
+        erro: Complemento da mensagem de erro genérica ("Erro ao inserir o nome").
+        vazio: Mensagem para valor vazio; sem mensagem, o campo é opcional.
+        validadores: Validadores aplicados, em ordem, após a verificação de valor vazio.
+        opcoes: Conversão do valor do registro para o valor do elemento ('radio').
+        criar_opcao: Em 'select', adiciona a opção quando ela não existe.
+        exibir_valor: Exibe o valor na mensagem de sucesso (desativado para a senha e a imagem).
+        pagina: 'login' ou 'cadastro'.
+    """
+    nome: str
+    tipo: str
+    localizadores: tuple
+    seletores: tuple = ()
+    chaves: tuple = ()
+    rotulo: str = ""
+    acao: str = "inserido"
+    erro: str = ""
+    vazio: str = None
+    validadores: tuple = ()
+    opcoes: dict = None
+    criar_opcao: bool = False
+    exibir_valor: bool = True
+    pagina: str = "cadastro"
+
+    def valor(self, registro: dict):
+        """
+            Valor do campo
+            --------------
+            Retorna o valor do campo no registro: o valor da chave ou, com várias chaves, a tupla dos valores.
+
+            Parâmetro: Registro com os dados do usuário.
+        """
+        if len(self.chaves) == 1:
+            return registro.get(self.chaves[0])
+        return tuple(registro.get(chave) for chave in self.chaves)
+
+
+def _xpath(caminho: str) -> tuple:
+    return (By.XPATH, caminho)
+
+
+def _id(identificador: str) -> tuple:
+    return (By.ID, identificador)
+
+
+ESQUEMA = (
+    Campo("login", "texto", (_id("email"),), ("#email",), ("email_login",),
+          rotulo="E-mail", erro="inserir o e-mail", vazio="O campo de e-mail não pode estar vazio.",
+          validadores=(formato(EMAIL_PATTERN, "Formato inválido. Exemplo de uso: usuario@email.com"),), pagina="login"),
+    Campo("confirmar_login", "botao", (_id("enterimg"),), ("#enterimg",),
+          rotulo="Login executado", erro="executar o clique", pagina="login"),
+    Campo("nome", "texto", (_xpath('//*[@id="basicBootstrapForm"]/div[1]/div[1]/input'),),
+          ("input[placeholder='First Name']",), ("nome",),
+          rotulo="Nome", erro="inserir o nome", vazio="O campo de nome não pode estar vazio."),
+    Campo("sobrenome", "texto", (_xpath('//*[@id="basicBootstrapForm"]/div[1]/div[2]/input'),),
+          ("input[placeholder='Last Name']",), ("sobrenome",),
+          rotulo="Sobrenome", erro="inserir o sobrenome", vazio="O campo de sobrenome não pode estar vazio."),
+    Campo("endereco", "texto", (_xpath('//*[@id="basicBootstrapForm"]/div[2]/div/textarea'),),
+          ("#basicBootstrapForm textarea",), ("endereco",),
+          rotulo="Endereço", erro="inserir o endereço", vazio="O campo de endereço não pode estar vazio."),
+    Campo("email", "texto", (_xpath('//*[@id="eid"]/input'),), ("#eid input[type='email']",), ("email",),
+          rotulo="E-mail", erro="inserir o e-mail", vazio="O campo de e-mail não pode estar vazio.",
+          validadores=(formato(EMAIL_PATTERN, "Formato inválido. Exemplo de uso: 'usuario@email.com'"),)),
+    Campo("telefone", "texto", (_xpath('//*[@id="basicBootstrapForm"]/div[4]/div/input'),),
+          ("#basicBootstrapForm input[type='tel']",), ("telefone",),
+          rotulo="Telefone", erro="inserir o telefone", vazio="O campo de telefone não pode estar vazio.",
+          validadores=(formato(TELEFONE_PATTERN, "Formato inválido. Insira 10 dígitos."),)),
+    Campo("genero", "radio", (_xpath("//input[@type='radio' and @value='{}']"),), ("input[type='radio'][value='{}']",), ("genero",),
+          rotulo="Gênero", acao="selecionado", erro="inserir o gênero", vazio="O campo de gênero não pode estar vazio.",
+          validadores=(opcao(GENEROS, "Gênero '{valor}' inválido. Selecione 'Feminino' ou 'Masculino'."),), opcoes=GENEROS),
+    Campo("hobbies", "checkbox", (_xpath("//input[@type='checkbox' and @value='{}']"),), ("input[type='checkbox'][value='{}']",), ("hobbies",),
+          rotulo="Hobbie", acao="selecionado", erro="inserir o hobbie", vazio="O campo de hobbies não pode estar vazio.",
+          validadores=(opcoes_lista(LISTA_HOBBIES, "O hobbie '{valor}' não é válido."),)),
+    Campo("idiomas", "multiselect", (_xpath('//*[@id="msdd"]'), _xpath('//*[@id="basicBootstrapForm"]/div[7]/div/multi-select/div[2]/ul')),
+          ("#msdd", "multi-select ul"), ("idiomas",),
+          rotulo="Idioma", acao="selecionado", erro="inserir o idioma",
+          validadores=(opcoes_lista(LISTA_IDIOMAS, "Idiomas inválidos: {valores}.", agrupar=True),)),
+    Campo("skill", "select", (_id("Skills"),), ("#Skills",), ("skill",),
+          rotulo="Skill", acao="selecionada", erro="inserir a skill", vazio="O campo de skill não pode estar vazio.",
+          validadores=(opcao(LISTA_SKILLS, "A skill '{valor}' não é válida."),)),
+    Campo("pais", "select", (_id("countries"),), ("#countries",), ("pais",),
+          rotulo="País", acao="selecionado", erro="inserir o país", vazio="O campo de país não pode estar vazio.", criar_opcao=True),
+    Campo("data", "data", (_id("yearbox"), _xpath('//*[@id="basicBootstrapForm"]/div[11]/div[2]/select'), _id("daybox")),
+          ("#yearbox", "select[placeholder='Month']", "#daybox"), ("ano", "mes", "dia"),
+          rotulo="Data", acao="inserida", erro="inserir a data", vazio="Os campos de ano, mês e dia não podem estar vazios.",
+          validadores=(validar_data,)),
+    Campo("imagem", "arquivo", (_id("imagesrc"),), ("#imagesrc",), ("imagem",),
+          rotulo="Imagem", acao="inserida", erro="inserir a imagem", exibir_valor=False),
+    Campo("senha", "texto", (_id("firstpassword"), _id("secondpassword")), ("#firstpassword", "#secondpassword"), ("senha",),
+          rotulo="Senha", acao="inserida", erro="inserir a senha", vazio="O campo de senha não pode estar vazio.", exibir_valor=False,
+          validadores=(formato(SENHA_PATTERN, "Formato inválido. A senha deve conter 8 caracteres incluindo ao menos uma letra minúscula, uma maiúscula e um número."),)),
+    Campo("cadastro", "botao", (_id("submitbtn"),), ("#submitbtn",),
+          rotulo="\n\nFormulário preenchido", erro="executar o clique"),
+)
+
+CAMPOS = {campo.nome: campo for campo in ESQUEMA}
+CAMPOS_LOGIN = tuple(campo for campo in ESQUEMA if campo.pagina == "login")
+CAMPOS_CADASTRO = tuple(campo for campo in ESQUEMA if campo.pagina == "cadastro")
+
+LOCALIZADORES = montar_registro(ESQUEMA)
+FIXOS = localizadores_fixos(ESQUEMA)
+
+
+"""
+    VALIDAÇÃO DO REGISTRO
+    ---------------------
+"""
+
+def _vazio(valor) -> bool:
+    if isinstance(valor, tuple):
+        return any(item is None or item == "" for item in valor)
+    return not valor
+
+
+def validar_campo(campo: Campo, valor):
+    """
+        Validação de um campo
+        ---------------------
+        Verifica se o valor obrigatório foi informado e aplica os validadores do campo.
+        Lança ValueError com a mensagem do primeiro erro encontrado.
+
+        Parâmetros: Campo do esquema, valor do campo.
+    """
+    if _vazio(valor):
+        if campo.vazio:
+            raise ValueError(campo.vazio)
+        return
+    for validador in campo.validadores:
+        validador(valor)
+
+
+def validar_registro(registro: dict, campos=ESQUEMA):
+    """
+        Validação do registro
+        ---------------------
+        Aplica a validação de cada campo ao registro, sem acessar o navegador.
+        Lança ValueError com a mensagem do primeiro campo inválido.
+
+        Parâmetros: Registro com os dados do usuário, campos validados (opcional; por padrão, todo o esquema).
+    """
+    for campo in campos:
+        if campo.chaves:
+            validar_campo(campo, campo.valor(registro))
+
+
+"""
+    MOTOR
+    -----
+    Uma função por tipo de componente, todas com a mesma assinatura (navegador, campo, valor).
+    Os elementos são obtidos pelo gerenciador de espera do navegador (módulo Espera): o formulário de cadastro é
+    aguardado uma única vez por registro, e cada elemento é localizado uma vez e reutilizado.
+    Os localizadores usados são os preferidos do módulo Localizadores (ID ou CSS), e os elementos fixos da tela de
+    cadastro são localizados juntos, em uma única consulta, assim que o formulário é confirmado.
+    Cada ação sobre um elemento segue a política de novas tentativas do tipo de componente (módulo Retentativa), e um
+    campo iniciado depois do fim do orçamento de tempo do registro falha sem acessar o navegador.
+"""
+
+def _sucesso(campo: Campo, valor=None):
+    if campo.tipo == "botao":
+        print(f"{Fore.GREEN}\n{campo.rotulo} com sucesso.")
+    elif campo.exibir_valor:
+        print(f"{Fore.GREEN}\n{campo.rotulo}{Style.RESET_ALL} '{valor}' {Fore.GREEN}{campo.acao} com sucesso.")
+    else:
+        print(f"{Fore.GREEN}\n{campo.rotulo} {campo.acao} com sucesso.")
+
+
+def _esperar(navegador, campo: Campo, condicao, localizador: tuple, acao):
+    return espera(navegador).usar(localizador, condicao, acao, politica(campo.tipo))
+
+
+def _formatar(localizador: tuple, valor: str) -> tuple:
+    return (localizador[0], localizador[1].format(valor))
+
+
+def _preencher_texto(navegador, campo: Campo, valor):
+    for localizador in LOCALIZADORES[campo.nome]:
+        _esperar(navegador, campo, EC.visibility_of_element_located, localizador, lambda elemento: elemento.send_keys(valor))
+    _sucesso(campo, valor)
+
+
+def _marcar_radio(navegador, campo: Campo, valor):
+    localizador = _formatar(LOCALIZADORES[campo.nome][0], campo.opcoes[valor])
+    _esperar(navegador, campo, EC.element_to_be_clickable, localizador, lambda elemento: elemento.click())
+    _sucesso(campo, valor)
+
+
+def _marcar_checkbox(navegador, campo: Campo, valores):
+    def marcar(checkbox):
+        if checkbox.is_selected():
+            raise ValueError(f"O {campo.rotulo.lower()} '{valor}' já estava selecionado.")
+        checkbox.click()
+
+    for valor in valores:
+        _esperar(navegador, campo, EC.element_to_be_clickable, _formatar(LOCALIZADORES[campo.nome][0], valor), marcar)
+        _sucesso(campo, valor)
+
+
+def _selecionar(navegador, campo: Campo, valor):
+    if campo.criar_opcao:
+        _esperar(navegador, campo, EC.visibility_of_element_located, LOCALIZADORES[campo.nome][0], lambda select: navegador.execute_script(
+            "var select = arguments[0], opcao = document.createElement('option');"
+            "opcao.text = arguments[1]; opcao.value = arguments[1];"
+            "select.add(opcao); select.value = arguments[1];",
+            select, valor,
+        ))
+    else:
+        _esperar(navegador, campo, EC.presence_of_element_located, LOCALIZADORES[campo.nome][0], lambda select: Select(select).select_by_value(valor))
+    _sucesso(campo, valor)
+
+
+def _selecionar_multiplos(navegador, campo: Campo, valores):
+    if not valores:
+        return
+    _esperar(navegador, campo, EC.presence_of_element_located, LOCALIZADORES[campo.nome][0], lambda elemento: elemento.click())
+    _esperar(navegador, campo, EC.visibility_of_element_located, LOCALIZADORES[campo.nome][1], lambda lista: lista)
+    for valor in valores:
+        def clicar(opcao_lista):
+            navegador.execute_script("arguments[0].scrollIntoView()", opcao_lista)
+            opcao_lista.click()
+
+        _esperar(navegador, campo, EC.element_to_be_clickable, (By.LINK_TEXT, valor), clicar)
+        _sucesso(campo, valor)
+
+
+def _preencher_data(navegador, campo: Campo, valor):
+    ano, mes, dia = valor
+    localizador_ano, localizador_mes, localizador_dia = LOCALIZADORES[campo.nome]
+    _esperar(navegador, campo, EC.presence_of_element_located, localizador_ano, lambda select: navegador.execute_script("arguments[0].click();", select))
+    _esperar(navegador, campo, EC.visibility_of_element_located, localizador_ano, lambda select: select.send_keys(str(ano), Keys.RETURN))
+    _esperar(navegador, campo, EC.visibility_of_element_located, localizador_mes, lambda select: Select(select).select_by_visible_text(MESES[mes]))
+    _esperar(navegador, campo, EC.visibility_of_element_located, localizador_dia, lambda select: Select(select).select_by_value(str(dia)))
+    _sucesso(campo, f"{dia}/{mes}/{ano}")
+
+
+def _enviar_arquivo(navegador, campo: Campo, valor):
+    if not valor:
+        return
+    _esperar(navegador, campo, EC.visibility_of_element_located, LOCALIZADORES[campo.nome][0], lambda elemento: elemento.send_keys(f"{valor}"))
+    _sucesso(campo, valor)
+
+
+def _clicar(navegador, campo: Campo, valor=None):
+    _esperar(navegador, campo, EC.element_to_be_clickable, LOCALIZADORES[campo.nome][0], lambda elemento: elemento.click())
+    _sucesso(campo)
+
+
+ACOES = {
+    "texto": _preencher_texto,
+    "radio": _marcar_radio,
+    "checkbox": _marcar_checkbox,
+    "select": _selecionar,
+    "multiselect": _selecionar_multiplos,
+    "data": _preencher_data,
+    "arquivo": _enviar_arquivo,
+    "botao": _clicar,
+}
+
+
+def _executar(campo: Campo, navegador, valor=None):
+    try:
+        validar_campo(campo, valor)
+        verificar_orcamento()
+        if campo.pagina == "cadastro":
+            espera(navegador).aguardar_formulario(lambda: resolver_todos(navegador, FIXOS))
+        ACOES[campo.tipo](navegador, campo, valor)
+
+    except ValueError as e:
+        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
+        raise
+    except NoSuchElementException as e:
+        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
+        raise
+    except Exception as e:
+        print(f"{Fore.RED}\nErro ao {campo.erro}:{Style.RESET_ALL} {e}")
+        raise
+    print("_" * 60)
+
+
+_EXECUTORES = {campo.nome: registrar_resultado(campo.nome)(functools.partial(_executar, campo)) for campo in ESQUEMA}
+
+
+def executar_campo(navegador, campo, valor=None):
+    """
+        Execução de um campo
+        --------------------
+        Valida o valor e executa a ação do tipo de componente do campo, exibindo as mensagens no terminal.
+        Retorna um ResultadoCampo.
+
+            Exemplo: executar_campo(navegador, "nome", "Ana")
+
+        Parâmetros: Navegador, campo (objeto Campo ou nome do campo), valor (dispensado nos botões).
+    """
+    nome = campo if isinstance(campo, str) else campo.nome
+    return _EXECUTORES[nome](navegador, valor)
+
+
+def preencher_registro(navegador, registro: dict, campos=ESQUEMA) -> list:
+    """
+        Preenchimento do registro
+        -------------------------
+        Executa os campos em ordem com os valores do registro e interrompe a sequência no primeiro campo com falha.
+        Retorna a lista de ResultadoCampo dos campos executados.
+
+        Parâmetros: Navegador, registro com os dados do usuário, campos executados (opcional; por padrão, todo o esquema).
+    """
+    return executar_etapas(
+        functools.partial(executar_campo, navegador, campo, campo.valor(registro) if campo.chaves else None)
+        for campo in campos
+    )
+
+
+"""
+    EXECUÇÃO ASSÍNCRONA
+    -------------------
+    O Selenium não possui cliente assíncrono: cada campo continua sendo executado pelo motor acima, em uma thread
+    separada (asyncio.to_thread), para que um único laço de eventos mantenha várias sessões ocupadas ao mesmo tempo.
+"""
+
+async def executar_campo_async(navegador, campo, valor=None):
+    """
+        Execução de um campo (assíncrona)
+        ---------------------------------
+        Versão aguardável de executar_campo(). Retorna um ResultadoCampo.
+
+            Exemplo: resultado = await executar_campo_async(navegador, "nome", "Ana")
+
+        Parâmetros: Navegador, campo (objeto Campo ou nome do campo), valor (dispensado nos botões).
+    """
+    return await asyncio.to_thread(executar_campo, navegador, campo, valor)
+
+
+async def preencher_registro_async(navegador, registro: dict, campos=ESQUEMA) -> list:
+    """
+        Preenchimento do registro (assíncrono)
+        --------------------------------------
+        Versão aguardável de preencher_registro(): cada campo é uma etapa aguardada separadamente.
+        Retorna a lista de ResultadoCampo dos campos executados.
+
+        Parâmetros: Navegador, registro com os dados do usuário, campos executados (opcional; por padrão, todo o esquema).
+    """
+    return await executar_etapas_async(
+        functools.partial(executar_campo_async, navegador, campo, campo.valor(registro) if campo.chaves else None)
+        for campo in campos
+    )
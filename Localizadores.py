@@ -0,0 +1,182 @@
+"""
+    Localizadores - COTEFÁCIL
+    -------------------------
+    Registro dos localizadores preferidos de cada campo do formulário.
+
+    O esquema do módulo Formulario guarda os localizadores originais, em grande parte XPaths absolutos e posicionais
+    ('//*[@id="basicBootstrapForm"]/div[11]/div[2]/select'), e os seletores CSS equivalentes. O registro prefere
+    By.ID quando o seletor é apenas um id ('#yearbox') e By.CSS_SELECTOR nos demais casos, que o navegador resolve
+    mais rápido que um XPath e que dependem menos da posição dos elementos. Campos sem seletores CSS mantêm os
+    localizadores originais.
+
+    Ao confirmar o formulário de cadastro, todos os elementos fixos da tela são localizados com uma única chamada
+    a execute_script() e guardados no gerenciador de espera do navegador (módulo Espera) até a próxima página.
+
+
+    BENCHMARK:
+    ----------
+    Executado diretamente, o módulo compara, contra as páginas locais do ServidorLocal, o tempo para localizar todos
+    os elementos fixos da tela de cadastro com os XPaths originais, com os localizadores preferidos (um find_element()
+    por elemento) e com a consulta única em JavaScript.
+
+        python Localizadores.py --repeticoes 50
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import argparse
+import re
+import sys
+import time
+from colorama import Fore, Style
+from selenium.webdriver.common.by import By
+
+
+"""
+    REGISTRO
+    --------
+"""
+
+_SELETOR_ID = re.compile(r"^#[A-Za-z][\w-]*$")
+
+SCRIPT_LOCALIZACAO = "return arguments[0].map(function (seletor) { return document.querySelector(seletor); });"
+
+
+def localizador_css(seletor: str) -> tuple:
+    """
+        Localizador do seletor
+        ----------------------
+        Converte um seletor CSS em localizador: By.ID para seletores de um único id e By.CSS_SELECTOR nos demais.
+
+        Parâmetro: Seletor CSS.
+    """
+    if _SELETOR_ID.match(seletor):
+        return (By.ID, seletor[1:])
+    return (By.CSS_SELECTOR, seletor)
+
+
+def montar_registro(campos) -> dict:
+    """
+        Montagem do registro
+        --------------------
+        Retorna, para cada campo, a tupla dos localizadores preferidos, na mesma ordem dos localizadores originais.
+
+        Parâmetro: Campos do esquema.
+    """
+    return {
+        campo.nome: tuple(localizador_css(seletor) for seletor in campo.seletores) if campo.seletores else campo.localizadores
+        for campo in campos
+    }
+
+
+def localizadores_fixos(campos) -> dict:
+    """
+        Localizadores fixos
+        -------------------
+        Retorna {localizador preferido: seletor CSS} dos elementos da tela de cadastro que existem desde o carregamento.
+        Ficam de fora os seletores com '{}', que dependem do valor do registro, e a lista de idiomas, que só fica
+        visível após o clique no componente e continua sendo aguardada.
+
+        Parâmetro: Campos do esquema.
+    """
+    fixos = {}
+    for campo in campos:
+        if campo.pagina != "cadastro":
+            continue
+        seletores = campo.seletores[:1] if campo.tipo == "multiselect" else campo.seletores
+        for seletor in seletores:
+            if "{}" not in seletor:
+                fixos[localizador_css(seletor)] = seletor
+    return fixos
+
+
+def resolver_todos(navegador, fixos: dict) -> dict:
+    """
+        Localização em uma consulta
+        ---------------------------
+        Localiza todos os elementos com uma única chamada a execute_script() e retorna {localizador: elemento}.
+        Elementos não encontrados ficam de fora e são aguardados normalmente quando forem usados.
+
+        Parâmetros: Navegador, localizadores fixos (ver localizadores_fixos()).
+    """
+    elementos = navegador.execute_script(SCRIPT_LOCALIZACAO, list(fixos.values())) or []
+    return {localizador: elemento for localizador, elemento in zip(fixos, elementos) if elemento is not None}
+
+
+"""
+    BENCHMARK
+    ---------
+"""
+
+def _medir(funcao, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def comparar(navegador, campos, repeticoes: int = 50) -> dict:
+    """
+        Comparação dos localizadores
+        ----------------------------
+        Mede o tempo médio, em milissegundos, para localizar todos os elementos fixos da tela de cadastro já carregada:
+        com os localizadores originais, com os preferidos e com a consulta única.
+
+        Parâmetros: Navegador na tela de cadastro, campos do esquema, número de repetições (opcional).
+    """
+    registro = montar_registro(campos)
+    fixos = localizadores_fixos(campos)
+    originais = [
+        campo.localizadores[indice]
+        for campo in campos
+        for indice, seletor in enumerate(campo.seletores)
+        if localizador_css(seletor) in fixos
+    ]
+    preferidos = [localizador for nome in registro for localizador in registro[nome] if localizador in fixos]
+
+    return {
+        "elementos": len(fixos),
+        "originais_ms": round(_medir(lambda: [navegador.find_element(*loc) for loc in originais], repeticoes), 3),
+        "preferidos_ms": round(_medir(lambda: [navegador.find_element(*loc) for loc in preferidos], repeticoes), 3),
+        "consulta_unica_ms": round(_medir(lambda: resolver_todos(navegador, fixos), repeticoes), 3),
+    }
+
+
+def main(argumentos=None) -> int:
+    """
+        Execução do benchmark
+        ---------------------
+        Abre a tela de cadastro local em um Chrome sem interface gráfica e exibe o tempo de cada forma de localização.
+
+        Parâmetro: Lista de argumentos (opcional; por padrão, sys.argv).
+    """
+    from Formulario import ESQUEMA
+    from Navegador import PERFIS, criar_navegador
+    from ServidorLocal import iniciar_servidor
+
+    parser = argparse.ArgumentParser(description="Tempo de localização dos elementos da tela de cadastro.")
+    parser.add_argument("--repeticoes", type=int, default=50, help="número de repetições de cada medição")
+    parser.add_argument("--perfil", choices=sorted(PERFIS), default="headless", help="perfil de inicialização do Chrome")
+    args = parser.parse_args(argumentos)
+
+    servidor, url_base = iniciar_servidor()
+    navegador = criar_navegador(PERFIS[args.perfil])
+    try:
+        navegador.get(url_base + "Register.html")
+        medicao = comparar(navegador, ESQUEMA, args.repeticoes)
+    finally:
+        navegador.quit()
+        servidor.shutdown()
+
+    print(f"{Fore.GREEN}Elementos:{Style.RESET_ALL} {medicao['elementos']}")
+    print(f"{Fore.GREEN}{'XPaths originais':>22}:{Style.RESET_ALL} {medicao['originais_ms']:.3f} ms")
+    print(f"{Fore.GREEN}{'ID/CSS':>22}:{Style.RESET_ALL} {medicao['preferidos_ms']:.3f} ms")
+    print(f"{Fore.GREEN}{'Consulta única (JS)':>22}:{Style.RESET_ALL} {medicao['consulta_unica_ms']:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
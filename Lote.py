@@ -0,0 +1,787 @@
+"""
+    Execução em Lote - COTEFÁCIL
+    ----------------------------
+    Executa o fluxo do Teste Automatizado para vários registros de cadastro usando um único navegador.
+
+    Os registros são lidos sob demanda de um arquivo CSV ou JSONL, de modo que arquivos com milhares de linhas
+    não precisam ser carregados inteiros na memória. Entre um registro e outro, a página inicial é recarregada
+    em vez de abrir um novo Chrome, e o resultado de cada registro é gravado assim que ele termina.
+
+
+    FORMATO DOS REGISTROS:
+    ----------------------
+    Cada registro usa as mesmas chaves das variáveis de entrada do Teste Automatizado:
+
+        email_login, nome, sobrenome, endereco, email, telefone, genero, hobbies, idiomas,
+        skill, pais, ano, mes, dia, imagem (opcional), senha.
+
+    JSONL: um objeto JSON por linha; 'hobbies' e 'idiomas' são listas.
+    CSV: primeira linha com o nome das colunas; 'hobbies' e 'idiomas' separados por ';'.
+
+
+    MODOS DE PREENCHIMENTO:
+    -----------------------
+    'fiel': campo a campo, com as funções preencher_* e selecionar_* do Teste Automatizado (padrão).
+    'rapido': um único execute_script() para a maior parte dos campos (ver módulo PreenchimentoRapido).
+
+
+    RESULTADOS:
+    -----------
+    O arquivo de saída recebe uma linha JSON por registro, com o índice, o status ('ok' ou 'falha'),
+    o tempo de execução em segundos, a mensagem de erro, quando houver, e o resultado de cada campo executado.
+    Ao final, os registros com falha são listados no terminal.
+    Com uma pasta de artefatos (--artefatos), cada registro com falha também gera um arquivo compactado com a imagem
+    da tela, o código-fonte da página e o rastro das etapas (ver módulo Artefatos).
+
+
+    NOVAS TENTATIVAS:
+    -----------------
+    Falhas passageiras do navegador (elemento recriado, clique interceptado, 'yearbox' lento) são repetidas conforme
+    a política do tipo de componente, com espera exponencial limitada (ver módulo Retentativa). Com um orçamento
+    (--orcamento-registro), nenhum registro passa do tempo informado. O número de novas tentativas de cada registro
+    é gravado nos resultados ('retentativas') e o total aparece no resumo final e no relatório de métricas.
+
+
+    TELA DE LOGIN:
+    --------------
+    Com pular_login (ou --pular-login), cada registro começa direto na tela de cadastro, sem o e-mail e o clique da
+    tela de login, e a chave 'email_login' deixa de ser exigida. Sem a opção, o login continua sendo executado e é
+    medido como uma etapa própria ('tela_login'), separada da tela de cadastro ('tela_cadastro').
+
+
+    EXECUÇÃO PARALELA:
+    ------------------
+    A função executar_paralelo() distribui os registros entre várias sessões independentes do Chrome, sem interface
+    gráfica, consumidas por uma thread por sessão. Os registros são lidos do arquivo e entregues por uma fila limitada,
+    de modo que cada thread pega o próximo registro assim que termina o anterior.
+    As sessões vêm de um pool (módulo Sessoes): são abertas antes do primeiro registro, limpas e reutilizadas entre os
+    registros e, opcionalmente, recicladas após um número de registros ou um limite de memória.
+    Se o navegador de uma sessão deixar de responder, ele é reaberto; se não puder ser reaberto, a sessão é descartada
+    e as demais continuam consumindo a fila. No modo paralelo, os resultados são gravados na ordem em que terminam.
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from colorama import Fore, Style
+from selenium.common.exceptions import WebDriverException
+import TesteAutomatizado
+from Resultado import ResultadoRegistro
+from Metricas import coletar, medir, notificar
+from PreenchimentoRapido import preencher_formulario_rapido
+from Navegador import PERFIS, personalizar_perfil, resolver_driver
+from Validacao import CAMPOS_VALIDADOS, CAMPOS_VALIDADOS_CADASTRO, exibir_invalidos, resultado_invalido, separar_registros
+from Validacao import LinhaInvalida, erros_linha, validar_arquivo
+from Espera import reiniciar_espera
+from Artefatos import capturar_falha, coletar_artefatos
+from Retentativa import configurar_retentativas, orcamento_registro
+from Sessoes import PoolSessoes, navegador_ativo
+
+
+"""
+    LEITURA DOS REGISTROS
+    ---------------------
+"""
+
+CAMPOS_LISTA = ("hobbies", "idiomas")
+CAMPOS_INTEIROS = ("ano", "mes", "dia")
+
+MODOS = {
+    "fiel": TesteAutomatizado.preencher_formulario,
+    "rapido": preencher_formulario_rapido,
+}
+
+
+def normalizar_registro(registro: dict) -> dict:
+    """
+        Normalização do registro
+        ------------------------
+        Converte os valores lidos do arquivo para os tipos esperados pelas funções do formulário:
+        listas para 'hobbies' e 'idiomas' e inteiros para 'ano', 'mes' e 'dia'.
+        Um valor de data que não representa um número inteiro é mantido como texto, para que a validação informe o
+        motivo real do erro (formato ou intervalo) em vez de tratá-lo como campo vazio.
+
+        Parâmetro: Registro lido do arquivo.
+    """
+    registro = dict(registro)
+    for campo in CAMPOS_LISTA:
+        valor = registro.get(campo)
+        if isinstance(valor, str):
+            registro[campo] = [item.strip() for item in valor.split(";") if item.strip()]
+    for campo in CAMPOS_INTEIROS:
+        valor = registro.get(campo)
+        if isinstance(valor, str):
+            texto = valor.strip()
+            try:
+                registro[campo] = int(texto)
+            except ValueError:
+                registro[campo] = texto or None
+    return registro
+
+
+def ler_registros(caminho: str):
+    """
+        Leitura sob demanda
+        -------------------
+        Gera os registros de um arquivo CSV ou JSONL, um de cada vez.
+        O formato é definido pela extensão do arquivo ('.csv' ou '.jsonl').
+        Uma linha JSONL malformada ou que não contém um objeto não interrompe a leitura: no lugar do registro, é gerada
+        uma LinhaInvalida (módulo Validacao), tratada como registro inválido pela validação e pelas execuções.
+
+        Parâmetro: Caminho do arquivo de registros.
+    """
+    with open(caminho, encoding="utf-8", newline="") as arquivo:
+        if caminho.lower().endswith(".csv"):
+            for registro in csv.DictReader(arquivo):
+                yield normalizar_registro(registro)
+        else:
+            for numero, linha in enumerate(arquivo, 1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                    if not isinstance(registro, dict):
+                        raise ValueError("a linha não contém um objeto JSON")
+                except ValueError as e:
+                    yield LinhaInvalida(numero, str(e))
+                    continue
+                yield normalizar_registro(registro)
+
+
+"""
+    EXECUÇÃO
+    --------
+"""
+
+def _validar_entrada(entrada: str, validar: bool, pular_login: bool, gravar, **extras) -> set:
+    """
+        Validação prévia da entrada
+        ---------------------------
+        Percorre o arquivo inteiro antes de qualquer navegador ser aberto, grava cada registro inválido como falha e
+        retorna o conjunto dos índices inválidos, que _registros() deixa de fora na execução.
+        Sem validação, nenhum registro é lido e o conjunto retornado é vazio.
+
+        Parâmetros: Arquivo de entrada, validação prévia dos registros, pular o login, função de gravação dos resultados,
+                    campos extras do resultado gravado (opcional; por exemplo, sessao=None).
+    """
+    invalidos = set()
+    if not validar:
+        return invalidos
+    campos = CAMPOS_VALIDADOS_CADASTRO if pular_login else CAMPOS_VALIDADOS
+    for indice, _, erros in separar_registros(ler_registros(entrada), campos):
+        if erros:
+            invalidos.add(indice)
+            gravar(dict(resultado_invalido(indice, erros).como_dict(), **extras))
+    return invalidos
+
+
+def _registros(entrada: str, invalidos: set = frozenset()):
+    for indice, registro in enumerate(ler_registros(entrada)):
+        if indice not in invalidos:
+            yield indice, registro, erros_linha(registro) if isinstance(registro, LinhaInvalida) else []
+
+
+def executar_registro(navegador, registro: dict, indice: int, modo: str = "fiel", pular_login: bool = False) -> ResultadoRegistro:
+    """
+        Execução de um registro
+        -----------------------
+        Preenche o formulário com um registro e retorna um ResultadoRegistro com o resultado de cada campo.
+        Um erro fora das funções do formulário (por exemplo, um navegador que deixou de responder) também é
+        registrado no resultado, para que a falha fique restrita ao registro e o lote continue.
+        Com um coletor de artefatos ativo (módulo Artefatos), a tela e a página de um registro com falha são capturadas.
+        O preenchimento respeita o orçamento de tempo do registro definido por configurar_retentativas(), quando houver.
+
+        Os elementos guardados pelo gerenciador de espera do registro anterior são descartados antes do preenchimento.
+
+        Parâmetros: Navegador, registro, índice do registro no arquivo, modo de preenchimento ('fiel' ou 'rapido'),
+                    pular o login (opcional; o navegador já deve estar na tela de cadastro).
+    """
+    preencher = MODOS[modo]
+    reiniciar_espera(navegador)
+    resultado = ResultadoRegistro(indice)
+    inicio = time.perf_counter()
+    try:
+        with orcamento_registro():
+            resultado.campos = preencher(navegador, registro, pular_login=pular_login)
+    except Exception as e:
+        resultado.erro = str(e)
+    resultado.tempo = time.perf_counter() - inicio
+    notificar("registro", resultado.tempo, resultado.status)
+    capturar_falha(navegador, resultado)
+    return resultado
+
+
+def exibir_resumo(resumo: dict, falhas: list):
+    """
+        Resumo da execução
+        ------------------
+        Exibe o erro de cada registro com falha e, em seguida, o total de registros com sucesso e com falha e o
+        total de novas tentativas.
+
+        Parâmetros: Totais por status e de novas tentativas, lista de resultados com falha (dicionários gravados no arquivo de saída).
+    """
+    for falha in sorted(falhas, key=lambda f: f["indice"]):
+        print(f"{Fore.RED}Registro {falha['indice']}:{Style.RESET_ALL} {falha['erro']}")
+    print(f"\n{Fore.GREEN}Registros concluídos:{Style.RESET_ALL} {resumo['ok']}  {Fore.RED}Falhas:{Style.RESET_ALL} {resumo['falha']}  "
+          f"{Fore.YELLOW}Novas tentativas:{Style.RESET_ALL} {resumo['retentativas']}")
+
+
+class GravadorResultados:
+    """
+        Gravador dos resultados
+        -----------------------
+        Abre o arquivo de saída e grava cada resultado assim que ele termina, acumulando os totais por status, o total
+        de novas tentativas e a lista de falhas exibidos por exibir_resumo(). Pode ser usado por várias sessões ao mesmo tempo.
+
+            Exemplo de uso:
+
+                with GravadorResultados("resultados.jsonl") as gravador:
+                    gravador.gravar(executar_registro(navegador, registro, 0).como_dict())
+                exibir_resumo(gravador.resumo, gravador.falhas)
+
+        Parâmetro: Caminho do arquivo de saída.
+    """
+
+    def __init__(self, saida: str):
+        self.saida = saida
+        self.resumo = {"ok": 0, "falha": 0, "retentativas": 0}
+        self.falhas = []
+        self._arquivo = None
+        self._trava = threading.Lock()
+
+    def __enter__(self):
+        self._arquivo = open(self.saida, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *excecao):
+        self._arquivo.close()
+
+    def gravar(self, resultado: dict):
+        """
+            Gravação de um resultado
+            ------------------------
+            Acrescenta o resultado ao arquivo de saída, em uma linha JSON, e atualiza os totais.
+
+            Parâmetro: Resultado do registro (ResultadoRegistro.como_dict(), com a sessão quando houver).
+        """
+        with self._trava:
+            self.resumo[resultado["status"]] += 1
+            self.resumo["retentativas"] += resultado["retentativas"]
+            if resultado["status"] == "falha":
+                self.falhas.append({"indice": resultado["indice"], "erro": resultado["erro"]})
+            self._arquivo.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            self._arquivo.flush()
+
+
+def _verificar_navegador(navegador):
+    """
+        Verificação do navegador
+        ------------------------
+        Retorna o próprio navegador quando ele ainda responde. Caso contrário, fecha o navegador e retorna None,
+        para que o próximo registro abra um novo por TesteAutomatizado.obter_navegador().
+
+        Parâmetro: Navegador (ou None).
+    """
+    if navegador is not None and navegador_ativo(navegador):
+        return navegador
+    if navegador is not None:
+        print(f"{Fore.YELLOW}\nNavegador sem resposta:{Style.RESET_ALL} um novo será aberto no próximo registro.")
+        _fechar(navegador)
+    TesteAutomatizado.encerrar_navegador()
+    return None
+
+
+def executar_lote(entrada: str, saida: str, navegador=None, modo: str = "fiel", relatorio: str = None, perfil=None,
+                  validar: bool = True, pular_login: bool = False) -> dict:
+    """
+        Execução do lote
+        ----------------
+        Executa todos os registros do arquivo de entrada no mesmo navegador e grava os resultados no arquivo de saída.
+        Antes de cada registro, exceto o primeiro, a página inicial é recarregada para reiniciar o fluxo.
+        Uma falha ao abrir o navegador ou ao recarregar a página é gravada no resultado do registro e o lote continua;
+        se o navegador deixou de responder, ele é fechado e um novo é aberto no registro seguinte.
+        Pulando o login, a página inicial é a tela de cadastro (TesteAutomatizado.pagina_inicial()).
+        Com a validação prévia, o arquivo inteiro é validado antes de o navegador ser aberto, e os registros inválidos
+        são gravados como falha sem acessar o navegador.
+        Com um arquivo de relatório, os tempos de cada etapa são coletados e resumidos (ver módulo Metricas).
+        Retorna o total de registros com sucesso e com falha.
+
+        Parâmetros: Arquivo de entrada, arquivo de saída, navegador (opcional; por padrão, obter_navegador()), modo de preenchimento,
+                    arquivo de relatório de métricas (opcional, '.json' ou '.csv'),
+                    perfil do navegador (opcional; usado apenas quando o navegador ainda não existe),
+                    validação prévia dos registros (opcional; ativada por padrão), pular o login (opcional).
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo '{modo}' inválido. Selecione 'fiel' ou 'rapido'.")
+
+    with coletar(relatorio), GravadorResultados(saida) as gravador:
+        invalidos = _validar_entrada(entrada, validar, pular_login, gravador.gravar)
+        executados = 0
+        for indice, registro, erros in _registros(entrada, invalidos):
+            if erros:
+                resultado = resultado_invalido(indice, erros).como_dict()
+            else:
+                try:
+                    if executados:
+                        _recarregar(navegador, pular_login)
+                    else:
+                        navegador = navegador or TesteAutomatizado.obter_navegador(perfil, pular_login)
+                except Exception as e:
+                    resultado = ResultadoRegistro(indice, erro=f"Erro ao carregar a página inicial: {e}").como_dict()
+                    navegador = _verificar_navegador(navegador)
+                    executados = executados if navegador is not None else 0
+                else:
+                    executados += 1
+                    resultado = executar_registro(navegador, registro, indice, modo, pular_login).como_dict()
+            gravador.gravar(resultado)
+
+    exibir_resumo(gravador.resumo, gravador.falhas)
+    return gravador.resumo
+
+
+"""
+    EXECUÇÃO PARALELA
+    -----------------
+"""
+
+_FIM = object()
+
+
+def _falha_sessao(indice: int, erro: str, sessao: int = None) -> dict:
+    return dict(ResultadoRegistro(indice, erro=erro).como_dict(), sessao=sessao)
+
+
+def _recarregar(navegador, pular_login: bool = False):
+    with medir("navegacao"):
+        navegador.get(TesteAutomatizado.pagina_inicial(pular_login))
+
+
+def _fechar(navegador):
+    try:
+        navegador.quit()
+    except WebDriverException:
+        pass
+
+
+def _executar_sessao(fila: queue.Queue, pool: PoolSessoes, gravar, modo: str, pular_login: bool):
+    """
+        Trabalhador
+        -----------
+        Consome registros da fila até encontrar o marcador de fim, executando cada um em uma sessão emprestada do pool.
+        Quando o pool não tem mais sessões ativas, o trabalhador é encerrado e os registros restantes
+        são gravados como falha por _entregar().
+
+        Parâmetros: Fila de registros, pool de sessões, função de gravação dos resultados, modo de preenchimento, pular o login.
+    """
+    while True:
+        item = fila.get()
+        if item is _FIM:
+            return
+        indice, registro = item
+
+        try:
+            sessao = pool.emprestar()
+        except Exception as e:
+            gravar(_falha_sessao(indice, str(e)))
+            return
+
+        try:
+            resultado = executar_registro(sessao.navegador, registro, indice, modo, pular_login).como_dict()
+        finally:
+            pool.devolver(sessao)
+        resultado["sessao"] = sessao.numero
+        gravar(resultado)
+
+
+def _entregar(fila: queue.Queue, item, threads: list, gravar):
+    """
+        Entrega de um item na fila
+        --------------------------
+        Aguarda espaço na fila enquanto houver alguma sessão ativa.
+        Sem sessões ativas, o registro é gravado como falha em vez de bloquear a leitura do arquivo.
+
+        Parâmetros: Fila de registros, item (índice e registro, ou o marcador de fim), threads das sessões, função de gravação.
+    """
+    while any(thread.is_alive() for thread in threads):
+        try:
+            fila.put(item, timeout=1)
+            return
+        except queue.Full:
+            continue
+    if item is not _FIM:
+        gravar(_falha_sessao(item[0], "Nenhuma sessão ativa."))
+
+
+def executar_paralelo(entrada: str, saida: str, sessoes: int = 4, modo: str = "fiel", relatorio: str = None, perfil=None,
+                      validar: bool = True, registros_por_sessao: int = None, memoria_maxima: float = None,
+                      pular_login: bool = False, lancamentos: int = None) -> dict:
+    """
+        Execução paralela
+        -----------------
+        Executa os registros do arquivo de entrada em várias sessões do Chrome ao mesmo tempo e grava os resultados no arquivo de saída.
+        As sessões vêm de um PoolSessoes (módulo Sessoes), aquecido antes do primeiro registro e reutilizado entre os registros.
+        Com a validação prévia, o arquivo inteiro é validado antes do aquecimento do pool, e os registros inválidos são
+        gravados como falha e não entram na fila das sessões.
+        Com um arquivo de relatório, os tempos de cada etapa de todas as sessões são coletados e resumidos.
+        Retorna o total de registros com sucesso e com falha, somando todas as sessões.
+
+            Exemplo: executar_paralelo("registros.jsonl", "resultados.jsonl", sessoes=8, registros_por_sessao=200)
+
+        Parâmetros: Arquivo de entrada, arquivo de saída, número de sessões simultâneas, modo de preenchimento,
+                    arquivo de relatório de métricas (opcional, '.json' ou '.csv'),
+                    perfil do navegador (opcional; por padrão, 'headless'),
+                    validação prévia dos registros (opcional; ativada por padrão),
+                    registros por sessão antes da reciclagem do navegador (opcional),
+                    memória máxima da página em MB antes da reciclagem do navegador (opcional), pular o login (opcional),
+                    número máximo de navegadores abrindo ao mesmo tempo (opcional; por padrão, todos no aquecimento).
+    """
+    if sessoes < 1:
+        raise ValueError("O número de sessões deve ser maior que zero.")
+    if modo not in MODOS:
+        raise ValueError(f"Modo '{modo}' inválido. Selecione 'fiel' ou 'rapido'.")
+
+    perfil = perfil or PERFIS["headless"]
+    fila = queue.Queue(maxsize=sessoes * 2)
+
+    with coletar(relatorio), GravadorResultados(saida) as gravador:
+        gravar = gravador.gravar
+        invalidos = _validar_entrada(entrada, validar, pular_login, gravar, sessao=None)
+        with medir("resolucao_driver"):
+            caminho_driver = resolver_driver()
+
+        pool = PoolSessoes(sessoes, perfil, caminho_driver, registros_por_sessao, memoria_maxima,
+                           url=TesteAutomatizado.pagina_inicial(pular_login), lancamentos=lancamentos)
+        pool.aquecer()
+
+        threads = [
+            threading.Thread(target=_executar_sessao, args=(fila, pool, gravar, modo, pular_login), daemon=True)
+            for _ in range(sessoes)
+        ]
+        for thread in threads:
+            thread.start()
+
+        for indice, registro, erros in _registros(entrada, invalidos):
+            if erros:
+                gravar(dict(resultado_invalido(indice, erros).como_dict(), sessao=None))
+            else:
+                _entregar(fila, (indice, registro), threads, gravar)
+
+        for thread in threads:
+            _entregar(fila, _FIM, threads, gravar)
+        for thread in threads:
+            thread.join()
+        pool.encerrar()
+
+        while not fila.empty():
+            item = fila.get_nowait()
+            if item is not _FIM:
+                gravar(_falha_sessao(item[0], "Nenhuma sessão ativa."))
+
+    exibir_resumo(gravador.resumo, gravador.falhas)
+    return gravador.resumo
+
+
+"""
+    EXECUÇÃO ASSÍNCRONA
+    -------------------
+"""
+
+async def _executar_registro_async(navegador, registro: dict, indice: int, modo: str, pular_login: bool) -> ResultadoRegistro:
+    """
+        Execução de um registro (assíncrona)
+        ------------------------------------
+        Mesmo comportamento de executar_registro(). No modo fiel, cada campo é uma etapa aguardada
+        (TesteAutomatizado.preencher_formulario_async); no modo rápido, o fluxo inteiro é executado em uma thread.
+
+        Parâmetros: Navegador, registro, índice do registro no arquivo, modo de preenchimento ('fiel' ou 'rapido'), pular o login.
+    """
+    reiniciar_espera(navegador)
+    resultado = ResultadoRegistro(indice)
+    inicio = time.perf_counter()
+    try:
+        with orcamento_registro():
+            if modo == "fiel":
+                resultado.campos = await TesteAutomatizado.preencher_formulario_async(navegador, registro, pular_login)
+            else:
+                resultado.campos = await asyncio.to_thread(MODOS[modo], navegador, registro, pular_login)
+    except Exception as e:
+        resultado.erro = str(e)
+    resultado.tempo = time.perf_counter() - inicio
+    notificar("registro", resultado.tempo, resultado.status)
+    if resultado.status == "falha":
+        await asyncio.to_thread(capturar_falha, navegador, resultado)
+    return resultado
+
+
+async def _executar_emprestado_async(pool: PoolSessoes, registro: dict, indice: int, modo: str, pular_login: bool) -> dict:
+    """
+        Registro em uma sessão emprestada (assíncrona)
+        ----------------------------------------------
+        Mesmo comportamento do trabalhador de executar_paralelo(): empresta uma sessão do pool, executa o registro e a
+        devolve limpa. Sem sessões ativas no pool, o registro é retornado como falha.
+
+        Parâmetros: Pool de sessões, registro, índice do registro no arquivo, modo de preenchimento, pular o login.
+    """
+    try:
+        sessao = await asyncio.to_thread(pool.emprestar)
+    except Exception as e:
+        return _falha_sessao(indice, str(e))
+
+    try:
+        resultado = (await _executar_registro_async(sessao.navegador, registro, indice, modo, pular_login)).como_dict()
+    finally:
+        await asyncio.to_thread(pool.devolver, sessao)
+    resultado["sessao"] = sessao.numero
+    return resultado
+
+
+async def _executar_assincrono(entrada: str, invalidos: set, sessoes: int, modo: str, perfil, lancamentos: int, pular_login: bool,
+                              registros_por_sessao: int, memoria_maxima: float, gravar):
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=sessoes + 1, thread_name_prefix="sessao"))
+    with medir("resolucao_driver"):
+        caminho_driver = await asyncio.to_thread(resolver_driver)
+
+    pool = PoolSessoes(sessoes, perfil, caminho_driver, registros_por_sessao, memoria_maxima,
+                       url=TesteAutomatizado.pagina_inicial(pular_login), lancamentos=lancamentos)
+    await asyncio.to_thread(pool.aquecer)
+
+    livres = asyncio.Semaphore(sessoes)
+    tarefas = set()
+
+    async def executar_tarefa(indice: int, registro: dict):
+        try:
+            gravar(await _executar_emprestado_async(pool, registro, indice, modo, pular_login))
+        finally:
+            livres.release()
+
+    try:
+        for indice, registro, erros in _registros(entrada, invalidos):
+            if erros:
+                gravar(dict(resultado_invalido(indice, erros).como_dict(), sessao=None))
+                continue
+            await livres.acquire()
+            tarefa = asyncio.create_task(executar_tarefa(indice, registro))
+            tarefas.add(tarefa)
+            tarefa.add_done_callback(tarefas.discard)
+        await asyncio.gather(*tarefas)
+    finally:
+        await asyncio.to_thread(pool.encerrar)
+
+
+def executar_assincrono(entrada: str, saida: str, sessoes: int = 8, modo: str = "fiel", relatorio: str = None, perfil=None,
+                        validar: bool = True, lancamentos: int = 2, pular_login: bool = False,
+                        registros_por_sessao: int = None, memoria_maxima: float = None) -> dict:
+    """
+        Execução assíncrona
+        -------------------
+        Executa os registros em várias sessões do Chrome coordenadas por um único laço de eventos (asyncio).
+        As sessões vêm do mesmo PoolSessoes da execução paralela (limpas entre os registros e reabertas quando deixam
+        de responder); cada registro é uma tarefa, e no máximo uma tarefa por sessão fica em andamento.
+        As chamadas ao WebDriver continuam bloqueantes e rodam em threads (asyncio.to_thread): cada sessão ocupa uma
+        thread durante um campo inteiro, com esperas e novas tentativas (no modo rápido, durante o registro inteiro).
+        Por isso o executor padrão do laço é substituído por um com uma thread por sessão, mais uma para as chamadas do
+        próprio laço (aquecimento e encerramento do pool); com o executor padrão do asyncio, limitado pelo número de
+        núcleos, parte das sessões ficaria parada. O limite de lançamentos define quantos Chrome são abertos ao mesmo tempo.
+        Com a validação prévia, o arquivo inteiro é validado antes do aquecimento do pool, e os registros inválidos são
+        gravados como falha sem ocupar uma sessão.
+        Retorna o total de registros com sucesso e com falha, somando todas as sessões.
+
+            Exemplo: executar_assincrono("registros.jsonl", "resultados.jsonl", sessoes=16, lancamentos=4)
+
+        Parâmetros: Arquivo de entrada, arquivo de saída, número de sessões simultâneas, modo de preenchimento,
+                    arquivo de relatório de métricas (opcional, '.json' ou '.csv'),
+                    perfil do navegador (opcional; por padrão, 'headless'),
+                    validação prévia dos registros (opcional; ativada por padrão),
+                    número máximo de navegadores abrindo ao mesmo tempo (opcional), pular o login (opcional),
+                    registros por sessão antes da reciclagem do navegador (opcional),
+                    memória máxima da página em MB antes da reciclagem do navegador (opcional).
+    """
+    if sessoes < 1:
+        raise ValueError("O número de sessões deve ser maior que zero.")
+    if lancamentos < 1:
+        raise ValueError("O número de lançamentos simultâneos deve ser maior que zero.")
+    if modo not in MODOS:
+        raise ValueError(f"Modo '{modo}' inválido. Selecione 'fiel' ou 'rapido'.")
+
+    perfil = perfil or PERFIS["headless"]
+
+    with coletar(relatorio), GravadorResultados(saida) as gravador:
+        invalidos = _validar_entrada(entrada, validar, pular_login, gravador.gravar, sessao=None)
+        asyncio.run(_executar_assincrono(entrada, invalidos, sessoes, modo, perfil, lancamentos, pular_login,
+                                         registros_por_sessao, memoria_maxima, gravador.gravar))
+
+    exibir_resumo(gravador.resumo, gravador.falhas)
+    return gravador.resumo
+
+
+"""
+    LINHA DE COMANDO
+    ----------------
+"""
+
+MODOS_CLI = {"fast": "rapido", "faithful": "fiel", "rapido": "rapido", "fiel": "fiel"}
+
+
+def verificar_opcoes(sessoes: int = 1, assincrono: bool = False, lancamentos: int = None,
+                     registros_por_sessao: int = None, memoria_maxima: float = None):
+    """
+        Verificação das opções de sessão
+        --------------------------------
+        Lança ValueError quando as opções do pool de sessões (reciclagem e lançamentos simultâneos) são informadas para
+        uma execução em um único navegador, que não usa o pool e as ignoraria.
+
+        Parâmetros: Os mesmos de executar().
+    """
+    if assincrono or sessoes > 1:
+        return
+    informadas = [nome for nome, valor in (("registros por sessão", registros_por_sessao),
+                                            ("memória máxima", memoria_maxima),
+                                            ("lançamentos simultâneos", lancamentos)) if valor is not None]
+    if informadas:
+        raise ValueError(f"Opções válidas apenas com mais de uma sessão ou com a execução assíncrona: {', '.join(informadas)}.")
+
+
+def executar(entrada: str, saida: str, sessoes: int = 1, modo: str = "fiel", relatorio: str = None, perfil=None,
+             validar: bool = True, pular_login: bool = False, assincrono: bool = False, lancamentos: int = None,
+             registros_por_sessao: int = None, memoria_maxima: float = None, artefatos: str = None,
+             limite_artefatos: float = 100, tentativas: int = None, orcamento: float = None) -> dict:
+    """
+        Execução conforme a configuração
+        --------------------------------
+        Escolhe a forma de execução: assíncrona, paralela (mais de uma sessão) ou em um único navegador,
+        que é encerrado ao final. As opções do pool de sessões (reciclagem e lançamentos) valem para as execuções
+        paralela e assíncrona; no único navegador, são recusadas com ValueError. Com uma pasta de artefatos, os registros com falha têm a tela, a página e o rastro
+        das etapas gravados nela (ver módulo Artefatos). Retorna o total de registros com sucesso e com falha.
+
+        Parâmetros: Os mesmos de executar_lote(), executar_paralelo() e executar_assincrono(),
+                    pasta dos artefatos de falha (opcional), limite total dos artefatos em MB (opcional),
+                    número máximo de tentativas por ação (opcional; por padrão, o da política de cada tipo de componente),
+                    orçamento de tempo de cada registro em segundos (opcional).
+    """
+    verificar_opcoes(sessoes, assincrono, lancamentos, registros_por_sessao, memoria_maxima)
+    with configurar_retentativas(tentativas, orcamento), coletar_artefatos(artefatos, limite_artefatos):
+        if assincrono:
+            return executar_assincrono(entrada, saida, sessoes, modo, relatorio, perfil, validar=validar,
+                                       lancamentos=2 if lancamentos is None else lancamentos, pular_login=pular_login,
+                                       registros_por_sessao=registros_por_sessao, memoria_maxima=memoria_maxima)
+        if sessoes > 1:
+            return executar_paralelo(entrada, saida, sessoes, modo, relatorio, perfil, validar=validar,
+                                     registros_por_sessao=registros_por_sessao, memoria_maxima=memoria_maxima,
+                                     pular_login=pular_login, lancamentos=lancamentos)
+        try:
+            return executar_lote(entrada, saida, modo=modo, relatorio=relatorio, perfil=perfil,
+                                 validar=validar, pular_login=pular_login)
+        finally:
+            TesteAutomatizado.encerrar_navegador()
+
+
+def _saida_padrao(entrada: str) -> str:
+    return os.path.splitext(entrada)[0] + ".resultados.jsonl"
+
+
+def _perfil_cli(perfil, sessoes: int, assincrono: bool, hosts: list, diretorio_usuario: str):
+    if not hosts and not diretorio_usuario:
+        return perfil
+    perfil = perfil or PERFIS["headless" if assincrono or sessoes > 1 else "padrao"]
+    return personalizar_perfil(perfil, tuple(hosts or ()), diretorio_usuario)
+
+
+def executar_cli(argumentos=None) -> int:
+    """
+        Linha de comando
+        ----------------
+        Ponto de entrada para execuções sem acompanhamento (por exemplo, em pipelines de carga), com os subcomandos
+        'run' (execução dos registros) e 'validate' (apenas a validação prévia). Nunca aguarda uma entrada no terminal.
+        Retorna o código de saída: 0 sem falhas, 1 com algum registro com falha ou inválido.
+
+            Exemplo: python -m TesteAutomatizado run --input registros.jsonl --workers 8 --headless --mode fast --report metricas.json
+
+        Parâmetro: Lista de argumentos (opcional; por padrão, sys.argv).
+    """
+    parser = argparse.ArgumentParser(prog="python -m TesteAutomatizado", description="Teste Automatizado - COTEFÁCIL.")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    run = subcomandos.add_parser("run", help="executa os registros de um arquivo no navegador")
+    run.add_argument("--input", "--entrada", dest="entrada", required=True, help="arquivo de registros (.csv ou .jsonl)")
+    run.add_argument("--output", "--saida", dest="saida", help="arquivo de resultados (.jsonl); por padrão, <entrada>.resultados.jsonl")
+    run.add_argument("--workers", "--sessoes", dest="sessoes", type=int, default=1, help="número de sessões simultâneas do Chrome")
+    run.add_argument("--mode", "--modo", dest="modo", choices=sorted(MODOS_CLI), default="faithful",
+                     help="modo de preenchimento: 'faithful' (fiel) ou 'fast' (rapido)")
+    run.add_argument("--headless", action="store_true", help="usa o perfil 'headless' do Chrome")
+    run.add_argument("--profile", "--perfil", dest="perfil", choices=sorted(PERFIS), help="perfil de inicialização do Chrome (tem prioridade sobre --headless)")
+    run.add_argument("--allow-host", "--host-permitido", dest="hosts", action="append",
+                     help="host acrescentado aos permitidos do perfil 'leve' (pode ser repetido; '*' permite todos)")
+    run.add_argument("--user-data-dir", "--diretorio-usuario", dest="diretorio_usuario",
+                     help="diretório de dados do usuário do Chrome (cada sessão usa um subdiretório)")
+    run.add_argument("--report", "--relatorio", dest="relatorio", help="arquivo do relatório de métricas (.json ou .csv)")
+    run.add_argument("--async", "--assincrono", dest="assincrono", action="store_true", help="coordena as sessões com asyncio")
+    run.add_argument("--launches", "--lancamentos", dest="lancamentos", type=int,
+                     help="navegadores abrindo ao mesmo tempo (com --workers > 1 ou --async; na assíncrona, 2 por padrão)")
+    run.add_argument("--recycle-after", "--reciclar-apos", dest="reciclar_apos", type=int,
+                     help="registros por sessão antes de reabrir o navegador (com --workers > 1 ou --async)")
+    run.add_argument("--max-memory", "--memoria-maxima", dest="memoria_maxima", type=float,
+                     help="memória da página, em MB, acima da qual o navegador é reaberto (com --workers > 1 ou --async)")
+    run.add_argument("--skip-login", "--pular-login", dest="pular_login", action="store_true", help="abre direto a tela de cadastro")
+    run.add_argument("--artifacts", "--artefatos", dest="artefatos", help="pasta dos artefatos (tela, página e etapas) dos registros com falha")
+    run.add_argument("--artifacts-limit", "--limite-artefatos", dest="limite_artefatos", type=float, default=100,
+                     help="limite total dos artefatos da execução, em MB")
+    run.add_argument("--max-attempts", "--tentativas", dest="tentativas", type=int,
+                     help="tentativas de cada ação após falhas passageiras; por padrão, a política de cada tipo de campo")
+    run.add_argument("--record-budget", "--orcamento-registro", dest="orcamento", type=float,
+                     help="tempo máximo de cada registro, em segundos, incluindo as novas tentativas")
+    run.add_argument("--no-validation", "--sem-validacao", dest="sem_validacao", action="store_true", help="envia todos os registros ao navegador, sem a validação prévia")
+
+    validate = subcomandos.add_parser("validate", help="valida os registros de um arquivo sem abrir o navegador")
+    validate.add_argument("--input", "--entrada", dest="entrada", required=True, help="arquivo de registros (.csv ou .jsonl)")
+    validate.add_argument("--valid-output", "--validos", dest="validos", help="arquivo JSONL que recebe apenas os registros válidos")
+    validate.add_argument("--skip-login", "--pular-login", dest="pular_login", action="store_true", help="dispensa o campo 'email_login'")
+
+    args = parser.parse_args(argumentos)
+
+    if args.comando == "validate":
+        invalidos = validar_arquivo(args.entrada, args.validos, CAMPOS_VALIDADOS_CADASTRO if args.pular_login else CAMPOS_VALIDADOS)
+        exibir_invalidos(invalidos)
+        return 1 if invalidos else 0
+
+    try:
+        verificar_opcoes(args.sessoes, args.assincrono, args.lancamentos, args.reciclar_apos, args.memoria_maxima)
+    except ValueError as e:
+        run.error(str(e))
+    if args.perfil:
+        perfil = PERFIS[args.perfil]
+    else:
+        perfil = PERFIS["headless"] if args.headless else None
+    perfil = _perfil_cli(perfil, args.sessoes, args.assincrono, args.hosts, args.diretorio_usuario)
+    resumo = executar(args.entrada, args.saida or _saida_padrao(args.entrada), args.sessoes, MODOS_CLI[args.modo],
+                      args.relatorio, perfil, validar=not args.sem_validacao, pular_login=args.pular_login,
+                      assincrono=args.assincrono, lancamentos=args.lancamentos,
+                      registros_por_sessao=args.reciclar_apos, memoria_maxima=args.memoria_maxima,
+                      artefatos=args.artefatos, limite_artefatos=args.limite_artefatos,
+                      tentativas=args.tentativas, orcamento=args.orcamento)
+    return 1 if resumo["falha"] else 0
+
+
+"""
+    Exemplo de uso:
+    ---------------
+    python Lote.py run --entrada registros.jsonl --saida resultados.jsonl
+    python Lote.py run --entrada registros.jsonl --sessoes 8 --perfil leve --modo rapido --relatorio metricas.json
+    python Lote.py run --entrada registros.jsonl --sessoes 16 --assincrono --lancamentos 4
+    python Lote.py validate --entrada registros.jsonl --validos validos.jsonl
+
+    Os argumentos são os mesmos da linha de comando do Teste Automatizado (ver executar_cli()).
+"""
+if __name__ == "__main__":
+    sys.exit(executar_cli())
@@ -0,0 +1,261 @@
+"""
+    Métricas - COTEFÁCIL
+    --------------------
+    Instrumentação de tempo das etapas do Teste Automatizado.
+
+    Cada etapa da execução é medida e informada aos observadores registrados:
+
+        'resolucao_driver': resolução do caminho do ChromeDriver (módulo Navegador).
+        'inicializacao_navegador': abertura de uma sessão do Chrome.
+        'navegacao': carregamento da página inicial.
+        'tela_login', 'tela_cadastro': tempo total dos campos de cada tela; 'tela_login' não aparece quando o login é pulado.
+        Um nome por campo do formulário ('login', 'nome', ..., 'senha'), medido pelas funções preencher_* e selecionar_*.
+        'cadastro': envio do formulário.
+        'registro': tempo total de um registro nas execuções em lote.
+
+
+    OBSERVADORES:
+    -------------
+    Um observador é qualquer função que receba o nome da etapa, o tempo em segundos e o status ('ok' ou 'falha').
+    Sem observadores registrados, a medição se limita a uma leitura do relógio por etapa.
+
+        Exemplo de uso:
+
+            from Metricas import adicionar_observador
+            adicionar_observador(lambda etapa, tempo, status: print(etapa, tempo, status))
+
+    Observadores com um método retentativas(etapa, quantidade) também recebem o número de novas tentativas feitas
+    em cada etapa após falhas passageiras (ver módulo Retentativa).
+
+
+    RELATÓRIO:
+    ----------
+    O ColetorMetricas é um observador que acumula os tempos de cada etapa e gera um relatório com quantidade,
+    falhas, novas tentativas, média, p50, p95 e máximo, salvo em JSON ou CSV conforme a extensão do arquivo.
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import csv
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from colorama import Fore, Style
+
+
+"""
+    OBSERVADORES
+    ------------
+"""
+
+_observadores = []
+
+
+def adicionar_observador(observador):
+    """
+        Inclusão de observador
+        ----------------------
+        Registra uma função que será chamada ao fim de cada etapa com (etapa, tempo, status).
+
+        Parâmetro: Função observadora.
+    """
+    _observadores.append(observador)
+
+
+def remover_observador(observador):
+    """
+        Remoção de observador
+        ---------------------
+        Remove uma função registrada por adicionar_observador(), caso exista.
+
+        Parâmetro: Função observadora.
+    """
+    if observador in _observadores:
+        _observadores.remove(observador)
+
+
+def notificar(etapa: str, tempo: float, status: str = "ok"):
+    """
+        Notificação
+        -----------
+        Informa a duração de uma etapa a todos os observadores.
+        Um erro em um observador é exibido no terminal e não interrompe a execução do teste.
+
+        Parâmetros: Nome da etapa, tempo em segundos, status ('ok' ou 'falha').
+    """
+    for observador in list(_observadores):
+        try:
+            observador(etapa, tempo, status)
+        except Exception as e:
+            print(f"{Fore.YELLOW}\nErro no observador de métricas:{Style.RESET_ALL} {e}")
+
+
+def notificar_retentativas(etapa: str, quantidade: int):
+    """
+        Notificação de novas tentativas
+        -------------------------------
+        Informa o número de novas tentativas de uma etapa aos observadores que possuem o método retentativas().
+
+        Parâmetros: Nome da etapa, número de novas tentativas.
+    """
+    for observador in list(_observadores):
+        registrar = getattr(observador, "retentativas", None)
+        if registrar is None:
+            continue
+        try:
+            registrar(etapa, quantidade)
+        except Exception as e:
+            print(f"{Fore.YELLOW}\nErro no observador de métricas:{Style.RESET_ALL} {e}")
+
+
+@contextmanager
+def medir(etapa: str):
+    """
+        Medição de etapa
+        ----------------
+        Mede o bloco de código e notifica os observadores ao final.
+        Uma exceção dentro do bloco é registrada com status 'falha' e propagada normalmente.
+
+            Exemplo:
+
+                with medir("navegacao"):
+                    navegador.get(url)
+
+        Parâmetro: Nome da etapa.
+    """
+    inicio = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "falha"
+        raise
+    finally:
+        notificar(etapa, time.perf_counter() - inicio, status)
+
+
+"""
+    RELATÓRIO
+    ---------
+"""
+
+def percentil(valores: list, p: float) -> float:
+    """
+        Percentil
+        ---------
+        Retorna o percentil 'p' (0 a 100) de uma lista ordenada, pelo método do posto mais próximo.
+
+        Parâmetros: Lista ordenada de valores, percentil.
+    """
+    if not valores:
+        return 0.0
+    posto = max(1, math.ceil(p / 100 * len(valores)))
+    return valores[posto - 1]
+
+
+class ColetorMetricas:
+    """
+        Coletor de métricas
+        -------------------
+        Observador que acumula os tempos por etapa e gera o relatório da execução.
+        Pode ser usado por várias sessões ao mesmo tempo.
+
+            Exemplo de uso:
+
+                coletor = ColetorMetricas()
+                adicionar_observador(coletor)
+                ...
+                coletor.gravar("relatorio.json")
+    """
+
+    def __init__(self):
+        self._tempos = {}
+        self._falhas = {}
+        self._retentativas = {}
+        self._trava = threading.Lock()
+
+    def __call__(self, etapa: str, tempo: float, status: str):
+        with self._trava:
+            self._tempos.setdefault(etapa, []).append(tempo)
+            if status != "ok":
+                self._falhas[etapa] = self._falhas.get(etapa, 0) + 1
+
+    def retentativas(self, etapa: str, quantidade: int):
+        with self._trava:
+            self._retentativas[etapa] = self._retentativas.get(etapa, 0) + quantidade
+
+    def resumo(self) -> dict:
+        """
+            Resumo das etapas
+            -----------------
+            Retorna, para cada etapa, a quantidade de medições, as falhas, as novas tentativas e a média, o p50, o p95
+            e o máximo, em segundos.
+
+            Não exige parâmetros.
+        """
+        with self._trava:
+            tempos = {etapa: sorted(valores) for etapa, valores in self._tempos.items()}
+            falhas = dict(self._falhas)
+            retentativas = dict(self._retentativas)
+        return {
+            etapa: {
+                "quantidade": len(valores),
+                "falhas": falhas.get(etapa, 0),
+                "retentativas": retentativas.get(etapa, 0),
+                "media": round(sum(valores) / len(valores), 4),
+                "p50": round(percentil(valores, 50), 4),
+                "p95": round(percentil(valores, 95), 4),
+                "max": round(valores[-1], 4),
+            }
+            for etapa, valores in tempos.items()
+        }
+
+    def gravar(self, caminho: str):
+        """
+            Gravação do relatório
+            ---------------------
+            Salva o resumo das etapas em JSON ou, se o arquivo terminar em '.csv', em CSV (uma linha por etapa).
+
+            Parâmetro: Caminho do arquivo do relatório.
+        """
+        resumo = self.resumo()
+        with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+            if caminho.lower().endswith(".csv"):
+                escritor = csv.writer(arquivo)
+                escritor.writerow(["etapa", "quantidade", "falhas", "retentativas", "media", "p50", "p95", "max"])
+                for etapa, dados in resumo.items():
+                    escritor.writerow([etapa, dados["quantidade"], dados["falhas"], dados["retentativas"], dados["media"], dados["p50"], dados["p95"], dados["max"]])
+            else:
+                json.dump({"etapas": resumo}, arquivo, ensure_ascii=False, indent=2)
+
+
+@contextmanager
+def coletar(caminho: str = None):
+    """
+        Coleta de métricas
+        ------------------
+        Registra um ColetorMetricas durante o bloco e grava o relatório ao final, mesmo em caso de erro.
+        Sem caminho, o bloco é executado sem coleta.
+
+            Exemplo:
+
+                with coletar("relatorio.json"):
+                    executar_lote("registros.jsonl", "resultados.jsonl")
+
+        Parâmetro: Caminho do arquivo do relatório (opcional).
+    """
+    if not caminho:
+        yield None
+        return
+    coletor = ColetorMetricas()
+    adicionar_observador(coletor)
+    try:
+        yield coletor
+    finally:
+        remover_observador(coletor)
+        coletor.gravar(caminho)
@@ -0,0 +1,319 @@
+"""
+    Navegador - COTEFÁCIL
+    ---------------------
+    Camada de resolução do ChromeDriver usada pelo Teste Automatizado.
+
+    Chamar ChromeDriverManager().install() a cada execução faz a verificação de versão do Chrome e pode acessar a rede
+    antes mesmo do primeiro campo ser preenchido. Este módulo guarda em disco o caminho do driver resolvido, indexado
+    pela versão do navegador, para que as execuções seguintes resolvam o driver apenas com acesso ao sistema de arquivos.
+
+
+    ORDEM DE RESOLUÇÃO:
+    -------------------
+    1. Caminho explícito, passado como parâmetro ou pela variável de ambiente 'CHROMEDRIVER_PATH'.
+    2. Cache local, quando já existe um driver registrado para a versão instalada do Chrome.
+    3. ChromeDriverManager().install(), registrando o resultado no cache.
+    4. Sem rede, o último driver válido do cache é usado como alternativa.
+
+
+    CRIAÇÃO DO NAVEGADOR:
+    ---------------------
+    A função criar_navegador() abre uma nova sessão do Chrome com o driver resolvido e um perfil de inicialização.
+    Os perfis prontos estão em PERFIS:
+
+        'padrao': Chrome com interface gráfica e janela maximizada.
+        'headless': Chrome sem interface gráfica.
+        'leve': Sem interface gráfica, janela de 1024x768, sem imagens, CSS, fontes, extensões e hosts de terceiros,
+                com carregamento 'eager'. Indicado para execuções em lote com várias sessões por máquina.
+
+    No perfil 'leve', apenas os hosts de HOSTS_LEVE são resolvidos. Outros hosts necessários à página (por exemplo,
+    a CDN de um script) podem ser acrescentados pela variável de ambiente 'COTEFACIL_HOSTS_PERMITIDOS', separados por
+    vírgula, ou por personalizar_perfil(); o host '*' remove a restrição. O diretório de dados do usuário também pode
+    ser definido por personalizar_perfil() (na linha de comando, --user-data-dir).
+
+
+    CACHE:
+    ------
+    O cache é um arquivo JSON salvo em '~/.cache/cotefacil/chromedriver.json'.
+    O diretório pode ser alterado pela variável de ambiente 'COTEFACIL_CACHE_DIR'.
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import dataclasses
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from colorama import Fore, Style
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from Metricas import medir
+
+
+"""
+    CONFIGURAÇÕES
+    -------------
+"""
+
+VARIAVEL_DRIVER = "CHROMEDRIVER_PATH"
+VARIAVEL_CACHE = "COTEFACIL_CACHE_DIR"
+VARIAVEL_HOSTS = "COTEFACIL_HOSTS_PERMITIDOS"
+VERSAO_DESCONHECIDA = "desconhecida"
+
+
+def diretorio_cache() -> Path:
+    """
+        Diretório do cache
+        ------------------
+        Retorna o diretório onde o cache do driver é salvo.
+
+        Não exige parâmetros.
+    """
+    return Path(os.environ.get(VARIAVEL_CACHE) or Path.home() / ".cache" / "cotefacil")
+
+
+def versao_chrome() -> str:
+    """
+        Versão do Chrome
+        ----------------
+        Consulta a versão do Chrome instalado sem acessar a rede.
+        Retorna 'desconhecida' quando a versão não pode ser identificada.
+
+        Não exige parâmetros.
+    """
+    try:
+        versao = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        versao = None
+    return versao or VERSAO_DESCONHECIDA
+
+
+def ler_cache() -> dict:
+    """
+        Leitura do cache
+        ----------------
+        Retorna o conteúdo do cache no formato {versão: {'caminho': ..., 'atualizado': ...}}.
+        Um cache ausente ou corrompido é tratado como vazio.
+
+        Não exige parâmetros.
+    """
+    arquivo = diretorio_cache() / "chromedriver.json"
+    try:
+        with open(arquivo, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def salvar_cache(versao: str, caminho: str):
+    """
+        Gravação do cache
+        -----------------
+        Registra o caminho do driver para a versão informada.
+        A gravação é feita em um arquivo temporário e depois renomeada, para não corromper o cache em execuções simultâneas.
+
+        Parâmetros: Versão do Chrome, caminho do driver.
+    """
+    pasta = diretorio_cache()
+    pasta.mkdir(parents=True, exist_ok=True)
+    cache = ler_cache()
+    cache[versao] = {"caminho": caminho, "atualizado": time.time()}
+    temporario = pasta / f"chromedriver.json.{os.getpid()}.{threading.get_ident()}"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temporario, pasta / "chromedriver.json")
+
+
+def _driver_valido(caminho) -> bool:
+    return bool(caminho) and os.path.isfile(caminho)
+
+
+def resolver_driver(caminho: str = None) -> str:
+    """
+        Resolução do ChromeDriver
+        -------------------------
+        Retorna o caminho do ChromeDriver seguindo a ordem de resolução descrita no início do módulo.
+
+            Exemplo: Service(resolver_driver())
+
+        Parâmetro: Caminho explícito do driver (opcional).
+    """
+    caminho = caminho or os.environ.get(VARIAVEL_DRIVER)
+    if caminho:
+        if not _driver_valido(caminho):
+            raise FileNotFoundError(f"ChromeDriver não encontrado em '{caminho}'.")
+        return caminho
+
+    versao = versao_chrome()
+    cache = ler_cache()
+    registro = cache.get(versao)
+    if registro and _driver_valido(registro.get("caminho")):
+        return registro["caminho"]
+
+    try:
+        caminho = ChromeDriverManager().install()
+    except Exception as e:
+        validos = [r for r in cache.values() if _driver_valido(r.get("caminho"))]
+        if not validos:
+            raise
+        caminho = max(validos, key=lambda r: r.get("atualizado", 0))["caminho"]
+        print(f"{Fore.YELLOW}\nChromeDriverManager indisponível:{Style.RESET_ALL} {e}")
+        print(f"{Fore.YELLOW}Usando o driver do cache:{Style.RESET_ALL} '{caminho}'")
+        return caminho
+
+    salvar_cache(versao, caminho)
+    return caminho
+
+
+"""
+    PERFIS DE INICIALIZAÇÃO
+    -----------------------
+"""
+
+@dataclass
+class PerfilNavegador:
+    """
+        Perfil do navegador
+        -------------------
+        Configurações de inicialização do Chrome.
+
+            headless: Executa sem interface gráfica.
+            largura, altura: Tamanho fixo da janela; sem tamanho fixo, a janela com interface gráfica é maximizada.
+            bloquear_imagens: Não carrega imagens.
+            bloquear_recursos: Padrões de URL bloqueados pelo Chrome DevTools (por exemplo, '*.css' e fontes).
+            hosts_permitidos: Com valores, apenas estes hosts são resolvidos; os demais (anúncios, scripts de terceiros) são bloqueados.
+            desativar_extensoes: Inicia o Chrome sem extensões.
+            estrategia_carregamento: 'normal' aguarda todos os recursos da página; 'eager' libera o controle quando o DOM está pronto.
+            diretorio_usuario: Diretório de dados do usuário reaproveitado entre execuções (cache, cookies).
+    """
+    headless: bool = False
+    largura: int = None
+    altura: int = None
+    bloquear_imagens: bool = False
+    bloquear_recursos: tuple = ()
+    hosts_permitidos: tuple = ()
+    desativar_extensoes: bool = False
+    estrategia_carregamento: str = "normal"
+    diretorio_usuario: str = None
+
+
+HOSTS_LEVE = ("demo.automationtesting.in", "127.0.0.1", "localhost")
+
+PERFIS = {
+    "padrao": PerfilNavegador(),
+    "headless": PerfilNavegador(headless=True),
+    "leve": PerfilNavegador(
+        headless=True,
+        largura=1024,
+        altura=768,
+        bloquear_imagens=True,
+        bloquear_recursos=("*.css", "*.woff", "*.woff2", "*.ttf", "*.otf"),
+        hosts_permitidos=HOSTS_LEVE,
+        desativar_extensoes=True,
+        estrategia_carregamento="eager",
+    ),
+}
+
+
+def personalizar_perfil(perfil: PerfilNavegador, hosts: tuple = (), diretorio_usuario: str = None) -> PerfilNavegador:
+    """
+        Personalização do perfil
+        ------------------------
+        Retorna uma cópia do perfil com hosts acrescentados à lista de permitidos e, quando informado, outro diretório
+        de dados do usuário. Os hosts só valem para perfis que já restringem os hosts (como o 'leve'); o host '*'
+        remove a restrição. O perfil original, em geral um dos PERFIS, não é alterado.
+
+            Exemplo: personalizar_perfil(PERFIS["leve"], hosts=("cdnjs.cloudflare.com",), diretorio_usuario="perfis")
+
+        Parâmetros: Perfil do navegador, hosts adicionais (opcional), diretório de dados do usuário (opcional).
+    """
+    alteracoes = {}
+    if hosts and perfil.hosts_permitidos:
+        alteracoes["hosts_permitidos"] = perfil.hosts_permitidos + tuple(hosts)
+    if diretorio_usuario:
+        alteracoes["diretorio_usuario"] = diretorio_usuario
+    return dataclasses.replace(perfil, **alteracoes)
+
+
+def hosts_permitidos(perfil: PerfilNavegador) -> tuple:
+    """
+        Hosts permitidos
+        ----------------
+        Retorna os hosts resolvidos pelo Chrome no perfil, somando os da variável de ambiente 'COTEFACIL_HOSTS_PERMITIDOS'.
+        Uma tupla vazia indica que todos os hosts são permitidos.
+
+        Parâmetro: Perfil do navegador.
+    """
+    if not perfil.hosts_permitidos:
+        return ()
+    adicionais = tuple(host.strip() for host in os.environ.get(VARIAVEL_HOSTS, "").split(",") if host.strip())
+    hosts = perfil.hosts_permitidos + adicionais
+    return () if "*" in hosts else hosts
+
+
+def opcoes_chrome(perfil: PerfilNavegador, sessao: int = None):
+    """
+        Opções do Chrome
+        ----------------
+        Converte um perfil nas opções de inicialização do Chrome.
+        Em execuções com várias sessões, cada sessão recebe um subdiretório próprio em 'diretorio_usuario',
+        pois o Chrome não permite que duas instâncias usem o mesmo diretório ao mesmo tempo.
+
+        Parâmetros: Perfil do navegador, número da sessão (opcional).
+    """
+    opcoes = webdriver.ChromeOptions()
+    if perfil.headless:
+        opcoes.add_argument("--headless=new")
+    if perfil.largura and perfil.altura:
+        opcoes.add_argument(f"--window-size={perfil.largura},{perfil.altura}")
+    if perfil.bloquear_imagens:
+        opcoes.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        opcoes.add_argument("--blink-settings=imagesEnabled=false")
+    hosts = hosts_permitidos(perfil)
+    if hosts:
+        excecoes = ", ".join(f"EXCLUDE {host}" for host in hosts)
+        opcoes.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excecoes}")
+    if perfil.desativar_extensoes:
+        opcoes.add_argument("--disable-extensions")
+        opcoes.add_argument("--disable-component-extensions-with-background-pages")
+    if perfil.diretorio_usuario:
+        diretorio = Path(perfil.diretorio_usuario)
+        if sessao is not None:
+            diretorio = diretorio / f"sessao-{sessao}"
+        opcoes.add_argument(f"--user-data-dir={diretorio.resolve()}")
+    opcoes.page_load_strategy = perfil.estrategia_carregamento
+    return opcoes
+
+
+def criar_navegador(perfil: PerfilNavegador = None, caminho_driver: str = None, sessao: int = None):
+    """
+        Criação do navegador
+        --------------------
+        Abre uma nova sessão do Chrome com o perfil informado, usando o driver resolvido por resolver_driver().
+        Em execuções paralelas, recomenda-se resolver o driver uma única vez e repassar o caminho a cada sessão.
+
+            Exemplo: criar_navegador(PERFIS["leve"], caminho_driver=resolver_driver(), sessao=0)
+
+        Parâmetros: Perfil do navegador (opcional; por padrão, 'padrao'), caminho do driver (opcional), número da sessão (opcional).
+    """
+    perfil = perfil or PERFIS["padrao"]
+    opcoes = opcoes_chrome(perfil, sessao)
+    with medir("resolucao_driver"):
+        servico = Service(resolver_driver(caminho_driver))
+    with medir("inicializacao_navegador"):
+        navegador = webdriver.Chrome(service=servico, options=opcoes)
+        if perfil.bloquear_recursos:
+            navegador.execute_cdp_cmd("Network.enable", {})
+            navegador.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(perfil.bloquear_recursos)})
+        if not perfil.headless and not (perfil.largura and perfil.altura):
+            navegador.maximize_window()
+    return navegador
@@ -2,7 +2,32 @@
     Teste de Palíndromo.
         ...
         O programa Teste de Palíndromo tem como objetivo testar uma palavra de modo que ela seja igual ao ler ao contrário.
+
+    A verificação também pode ser usada sem o terminal, por outros programas e em grandes volumes de palavras.
+        ...
+        Os métodos verificar(), verificar_palavras() e entrada_valida() apenas retornam o resultado, sem input() nem print().
+        O método teste() é o modo interativo, construído sobre esses mesmos métodos.
+        O método varrer() classifica listas de palavras lidas linha a linha de um arquivo ou da entrada padrão, com uso de memória constante.
+        O método varrer_arquivo() classifica arquivos muito grandes usando todos os núcleos do processador (ver instruções ao final do arquivo).
+        O método verificar_lote() verifica milhões de palavras de uma vez com o NumPy, que é opcional: só é importado quando o método é chamado.
+"""
+import argparse
+import mmap
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
 """
+    Configuração da verificação.
+
+
+    PARES_EXTREMOS: Pares de letras comparados pelas extremidades, sem cópias, antes da cópia invertida, nas palavras longas.
+"""
+
+PARES_EXTREMOS = 16
 
 
 class Palindromo:
@@ -22,6 +47,304 @@ class Palindromo:
         """
         pass
 
+    @staticmethod
+    def verificar(palavra: str) -> bool:
+        """
+            Função para a verificação de uma palavra.
+
+
+            Retorna True quando a palavra é igual ao ler ao contrário, sem diferenciar letras maiúsculas e minúsculas.
+            Não valida a entrada e não exibe mensagens ao usuário; para a mesma validação do modo interativo, usar entrada_valida().
+                ...
+                Palavras com mais de PARES_EXTREMOS * 2 letras começam pela comparação das extremidades (verificar_extremos()), sem cópias,
+                e a maior parte das palavras que não são palíndromos é descartada logo no primeiro par de letras.
+                Apenas essa comparação inicial é feita sem cópias: a verificação completa ainda cria duas cópias da palavra (em letras minúsculas
+                e invertida), pois no Python elas são mais rápidas que percorrer a palavra inteira letra a letra.
+                Para a verificação completa sem nenhuma cópia, mais lenta, usar verificar_extremos(palavra).
+                Os tempos de cada forma de verificação podem ser comparados com comparar_verificacoes().
+                ...
+                Exemplo de uso:
+
+                    Palindromo.verificar("Arara")  # True
+
+            Parâmetro: Palavra (string).
+        """
+        if len(palavra) > PARES_EXTREMOS * 2 and not Palindromo.verificar_extremos(palavra, PARES_EXTREMOS):
+            return False
+        palavra = palavra.lower()
+        return palavra == palavra[::-1]
+
+    @staticmethod
+    def verificar_extremos(palavra: str, pares: int = None) -> bool:
+        """
+            Função para a verificação de uma palavra pelas extremidades.
+
+
+            Compara as letras das duas extremidades em direção ao centro e para na primeira diferença, sem criar a cópia invertida nem a cópia em letras minúsculas.
+            Apenas as letras diferentes de um par são convertidas para minúsculas, para a comparação sem diferenciar maiúsculas e minúsculas.
+                ...
+                Com pares, apenas os primeiros pares de letras são comparados: False indica que a palavra certamente não é um palíndromo,
+                e True indica apenas que esses pares são iguais.
+
+            Parâmetros: Palavra (string), número máximo de pares comparados (opcional; por padrão, a palavra inteira).
+        """
+        fim = len(palavra) - 1
+        limite = len(palavra) // 2 if pares is None else min(pares, len(palavra) // 2)
+        for inicio in range(limite):
+            esquerda, direita = palavra[inicio], palavra[fim - inicio]
+            if esquerda != direita and esquerda.lower() != direita.lower():
+                return False
+        return True
+
+    @staticmethod
+    def verificar_palavras(palavras):
+        """
+            Função para a verificação de várias palavras.
+
+
+            Retorna um iterador com o resultado de verificar() para cada palavra, na mesma ordem.
+            As palavras são verificadas conforme o iterador é consumido, de modo que listas grandes ou geradores não precisam estar inteiros na memória.
+                ...
+                Exemplo de uso:
+
+                    list(Palindromo.verificar_palavras(["ovo", "casa"]))  # [True, False]
+
+            Parâmetro: Iterável de palavras (strings).
+        """
+        return map(Palindromo.verificar, palavras)
+
+    @staticmethod
+    def entrada_valida(entrada: str) -> bool:
+        """
+            Função para a validação da entrada.
+
+
+            Retorna True quando a entrada é uma única palavra com caracteres alfabéticos, a mesma regra do modo interativo.
+
+            Parâmetro: Entrada (string).
+        """
+        return isinstance(entrada, str) and entrada.isalpha()
+
+    @staticmethod
+    def comparar_verificacoes(repeticoes: int = 100000) -> dict:
+        """
+            Função para a comparação dos tempos de verificação.
+
+
+            Mede o tempo médio, em nanossegundos, da cópia invertida (a forma original), da comparação pelas extremidades e de verificar(),
+            com palavras curtas e muito longas, palíndromos ou não.
+                ...
+                Palavras curtas são medidas com o número de repetições informado; as longas (200 mil letras), com um milésimo dele.
+
+            Parâmetro: Número de repetições das palavras curtas (opcional).
+        """
+        def copia_invertida(palavra):
+            palavra = palavra.lower()
+            return palavra == palavra[::-1]
+
+        palavras = {
+            "curta_palindromo": "Arara",
+            "curta_nao_palindromo": "Casa",
+            "longa_palindromo": "ab" * 50000 + "ba" * 50000,
+            "longa_nao_palindromo": "x" + "ab" * 100000,
+            "longa_diferenca_central": "ab" * 50000 + "x" + "ba" * 50000 + "y",
+        }
+        formas = {
+            "copia_invertida": copia_invertida,
+            "extremidades": Palindromo.verificar_extremos,
+            "verificar": Palindromo.verificar,
+        }
+        tempos = {}
+        for caso, palavra in palavras.items():
+            vezes = repeticoes if len(palavra) < 100 else max(1, repeticoes // 1000)
+            tempos[caso] = {}
+            for nome, forma in formas.items():
+                inicio = time.perf_counter()
+                for _ in range(vezes):
+                    forma(palavra)
+                tempos[caso][nome] = round((time.perf_counter() - inicio) / vezes * 1e9)
+        return tempos
+
+    @staticmethod
+    def verificar_lote(palavras, validar: bool = False):
+        """
+            Função para a verificação de um lote de palavras com o NumPy.
+
+
+            Retorna um array booleano do NumPy com o resultado de verificar() para cada palavra, na mesma ordem; com validar, as entradas que
+            não passam em entrada_valida() também ficam como False.
+            O caminho vetorizado é o do conteúdo de um arquivo em bytes (bytes, bytearray ou mmap), com uma palavra por linha: as palavras são
+            agrupadas pelo tamanho e, em cada grupo, todas têm a mesma largura, de modo que a letra k de todas as palavras do grupo é comparada
+            de uma vez com a letra correspondente da leitura invertida (tamanho - 1 - k).
+                ...
+                Com um iterável de strings, as palavras são verificadas por verificar() em um laço do Python: montar o buffer a partir das strings
+                custa quase o mesmo que o próprio laço, e o caminho vetorizado não compensa. O array tem sempre um resultado por palavra.
+                Com bytes, a quebra de linha final não gera uma palavra vazia e as linhas não são aparadas, ao contrário de varrer():
+                espaços e '\\r' (quebras de linha do Windows) fazem parte da palavra.
+                Letras maiúsculas e minúsculas são igualadas de forma vetorizada para os caracteres ASCII; as poucas palavras com outros
+                caracteres são verificadas individualmente, com as mesmas regras de verificar() e entrada_valida().
+                A vazão de cada forma pode ser medida com comparar_lote().
+                ...
+                Exemplo de uso:
+
+                    mascara = Palindromo.verificar_lote(["ovo", "casa", "Radar"])  # array([ True, False,  True])
+                    with open("palavras.txt", "rb") as arquivo:
+                        mascara = Palindromo.verificar_lote(arquivo.read(), validar=True)
+
+            Parâmetros: Palavras (iterável de strings ou bytes com uma palavra por linha), aplicação de entrada_valida() (opcional).
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("verificar_lote() requer o NumPy. Para instalar: pip install numpy") from None
+
+        if isinstance(palavras, str):
+            raise TypeError("verificar_lote() recebe várias palavras; para uma única palavra, usar verificar().")
+        if not isinstance(palavras, (bytes, bytearray, memoryview, mmap.mmap)):
+            verificar = Palindromo.verificar
+            if validar:
+                valida = Palindromo.entrada_valida
+                return np.fromiter((valida(palavra) and verificar(palavra) for palavra in palavras), dtype=bool)
+            return np.fromiter(map(verificar, palavras), dtype=bool)
+
+        if not len(palavras):
+            return np.ones(0, dtype=bool)
+        dados = np.frombuffer(palavras, dtype=np.uint8)
+        if dados[-1] == 10:
+            dados = dados[:-1]
+
+        quebras = np.flatnonzero(dados == 10)
+        inicios = np.concatenate(([0], quebras + 1))
+        fins = np.concatenate((quebras, [len(dados)]))
+        tamanhos = fins - inicios
+        mascara = np.ones(len(inicios), dtype=bool)
+
+        minusculas = np.arange(256, dtype=np.uint8)
+        minusculas[65:91] += 32
+        letras = minusculas[dados]
+        grupos = np.bincount(tamanhos)
+        ordem = np.argsort(tamanhos.astype(np.uint16) if len(grupos) <= 2**16 else tamanhos, kind="stable")
+        limites = np.concatenate(([0], np.cumsum(grupos)))
+        for tamanho in np.flatnonzero(grupos[2:]) + 2:
+            grupo = ordem[limites[tamanho]:limites[tamanho + 1]]
+            esquerda = inicios[grupo]
+            direita = esquerda + (tamanho - 1)
+            iguais = letras[esquerda] == letras[direita]
+            for passo in range(1, tamanho // 2):
+                iguais &= letras[esquerda + passo] == letras[direita - passo]
+            mascara[grupo] = iguais
+
+        if validar:
+            letra = ((dados | 32) - 97 < 26).astype(np.intp)
+            acumulado = np.concatenate(([0], np.cumsum(letra)))
+            mascara &= (acumulado[fins] - acumulado[inicios] == tamanhos) & (tamanhos > 0)
+
+        if dados.max() > 127:
+            for linha in np.unique(np.searchsorted(inicios, np.flatnonzero(dados > 127), side="right") - 1):
+                palavra = dados[inicios[linha]:fins[linha]].tobytes().decode("utf-8", errors="replace")
+                mascara[linha] = Palindromo.verificar(palavra) and (not validar or Palindromo.entrada_valida(palavra))
+        return mascara
+
+    @staticmethod
+    def comparar_lote(quantidade: int = 1000000) -> dict:
+        """
+            Função para a comparação da verificação em lote com a verificação palavra a palavra.
+
+
+            Gera palavras curtas aleatórias (de 1 a 12 letras, parte delas palíndromos) e mede a vazão, em palavras por segundo,
+            de verificar() em um laço do Python e de verificar_lote() a partir dos bytes de um arquivo (a melhor de três medições).
+
+            Parâmetro: Quantidade de palavras (opcional).
+        """
+        import random
+
+        gerador = random.Random(0)
+        palavras = []
+        for _ in range(quantidade):
+            metade = "".join(gerador.choice("abcdeABCDE") for _ in range(gerador.randint(1, 6)))
+            palavras.append(metade + metade[::-1][gerador.randint(0, 1):] if gerador.random() < 0.3 else metade + gerador.choice("xyz"))
+        dados = ("\n".join(palavras) + "\n").encode("utf-8")
+
+        def vazao(funcao):
+            tempos = []
+            for _ in range(3):
+                inicio = time.perf_counter()
+                funcao()
+                tempos.append(time.perf_counter() - inicio)
+            return round(quantidade / min(tempos))
+
+        return {
+            "laco_python": vazao(lambda: [Palindromo.verificar(palavra) for palavra in palavras]),
+            "lote_bytes": vazao(lambda: Palindromo.verificar_lote(dados)),
+        }
+
+    @staticmethod
+    def varrer(entrada, saida, veredictos: bool = False) -> dict:
+        """
+            Função para a varredura de uma lista de palavras.
+
+
+            Lê as palavras linha a linha de um arquivo de texto aberto (ou de sys.stdin) e grava o resultado em outro (ou em sys.stdout).
+            Apenas uma linha fica na memória por vez, de modo que listas com dezenas de milhões de palavras podem ser lidas sem carregá-las inteiras.
+                ...
+                Cada linha é uma palavra; espaços nas extremidades são ignorados, assim como as linhas em branco.
+                As linhas são validadas por entrada_valida(), a mesma regra do modo interativo.
+                Sem veredictos, apenas os palíndromos são gravados, um por linha.
+                Com veredictos, cada palavra é gravada com o resultado, separado por tabulação: 'palindromo', 'nao_palindromo' ou 'invalida'.
+
+            Retorna um dicionário com o total de palavras, de palíndromos e de entradas inválidas, o tempo em segundos e a vazão em palavras por segundo.
+                ...
+                Exemplo de uso:
+
+                    with open("palavras.txt", encoding="utf-8") as entrada, open("palindromos.txt", "w", encoding="utf-8") as saida:
+                        resumo = Palindromo.varrer(entrada, saida)
+
+            Parâmetros: Arquivo de entrada, arquivo de saída, gravação do resultado de cada palavra (opcional).
+        """
+        inicio = time.perf_counter()
+        contagem = _classificar_linhas(entrada, veredictos, saida.write)
+        saida.flush()
+        return _resumo_varredura(contagem, inicio)
+
+    @staticmethod
+    def varrer_arquivo(caminho: str, saida, veredictos: bool = False, processos: int = None, tamanho_bloco: int = 8 * 2**20) -> dict:
+        """
+            Função para a varredura de um arquivo grande em vários processos.
+
+
+            Mapeia o arquivo na memória (mmap), divide-o em blocos que terminam sempre em uma quebra de linha e verifica os blocos em um conjunto de processos.
+            Os resultados são gravados na saída na mesma ordem do arquivo, com as mesmas regras e o mesmo formato de varrer().
+                ...
+                Cada processo lê o seu bloco diretamente do mapeamento do arquivo, sem que o conteúdo passe pelo processo principal.
+                Apenas alguns blocos por processo ficam em andamento ao mesmo tempo, de modo que o uso de memória não cresce com o tamanho do arquivo.
+                O arquivo deve estar codificado em UTF-8; bytes inválidos são substituídos.
+
+            Retorna o mesmo dicionário de varrer(), com o número de processos utilizados.
+                ...
+                Exemplo de uso:
+
+                    with open("palindromos.txt", "w", encoding="utf-8") as saida:
+                        resumo = Palindromo.varrer_arquivo("corpus.txt", saida, processos=8)
+
+            Parâmetros: Caminho do arquivo de entrada, arquivo de saída, gravação do resultado de cada palavra (opcional),
+                        número de processos (opcional; por padrão, um por núcleo), tamanho aproximado de cada bloco em bytes (opcional).
+        """
+        processos = processos or os.cpu_count() or 1
+        contagem = [0, 0, 0]
+        inicio = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=processos, initializer=_abrir_mapa, initargs=(caminho,)) as executor:
+            pendentes = deque()
+            for bloco in _blocos(caminho, tamanho_bloco):
+                pendentes.append(executor.submit(_varrer_bloco, bloco, veredictos))
+                if len(pendentes) >= processos * 2:
+                    _gravar_bloco(pendentes.popleft().result(), saida, contagem)
+            while pendentes:
+                _gravar_bloco(pendentes.popleft().result(), saida, contagem)
+
+        saida.flush()
+        return dict(_resumo_varredura(contagem, inicio), processos=processos)
+
     def teste(self):
         """
             Função para a execução do teste.
@@ -32,12 +355,12 @@ class Palindromo:
             Usando uma estrutura de loop, o programa irá analisar o input de entrada.
                 ...
                 Caso a entrada contenha mais de um valor ou não seja do tipo string, o programa emite uma mensagem de erro ao usuário.
-                Ao inserir 'sair', será permitida a opção de saída ao usuário, encerrando o programa.
-                Qualquer entrada do tipo string diferente de 'sair' será aceita e o teste será inicializado.
+                Ao inserir 'sair', será permitida a opção de saída ao usuário, encerrando o teste.
+                Qualquer entrada do tipo string diferente de 'sair' será validada por entrada_valida() e o teste será inicializado.
                     ...
-                    Será gerada uma variável auxiliar que recebe a palavra inserida e a inverte, de trás para frente.
-                    Se a palavra de entrada for igual a varíavel auxiliar, o programa identifica o palíndromo e emite uma mensagem de confirmação ao usuário.
-                    Se a palavra de entrada for diferente da varíavel auxiliar, o programa desconhece o palíndromo e emite uma mensagem de negação ao usuário.
+                    A palavra é verificada por verificar(), que a compara com ela mesma invertida, de trás para frente.
+                    Se a palavra for um palíndromo, o programa emite uma mensagem de confirmação ao usuário.
+                    Caso contrário, o programa desconhece o palíndromo e emite uma mensagem de negação ao usuário.
                         
             Não exige parâmetros.
         """
@@ -45,10 +368,9 @@ class Palindromo:
             entrada = input("\nInsira uma palavra para o teste de palíndromo (ou 'sair' para encerrar o programa): ").lower()
             if entrada == 'sair':
                 print("Programa encerrado.")
-                exit()
-            if entrada.isalpha() and len(entrada.split()) == 1:
-                reverso = entrada[::-1]
-                print(f"A palavra {entrada.upper()} é um palíndromo." if entrada == reverso else f"A palavra {entrada.upper()} não é um palíndromo.")
+                return
+            if self.entrada_valida(entrada):
+                print(f"A palavra {entrada.upper()} é um palíndromo." if self.verificar(entrada) else f"A palavra {entrada.upper()} não é um palíndromo.")
             else:
                 print("Entrada inválida. Insira apenas uma palavra com caracteres alfabéticos.")
 
@@ -65,9 +387,181 @@ class Palindromo:
             palavra = Palindromo()
             palavra.teste()
         
+    Para a verificação sem o terminal, os métodos podem ser chamados diretamente na classe, sem criar uma instância.
+        ...
+        Exemplo de uso:
+
+            Palindromo.verificar("Reviver")
+            resultados = list(Palindromo.verificar_palavras(["ovo", "casa", "radar"]))
+
     Para importar a classe, deve-se criar um novo arquivo e mantê-lo no mesmo diretório do arquivo Palindromo.
         ...
         Exemplo de uso:
             
             from Palindromo import Palindromo
 """
+
+
+"""
+    Funções auxiliares da varredura.
+
+
+    Usadas por varrer() e pelos processos de varrer_arquivo(), para que as duas formas de varredura classifiquem as palavras da mesma maneira.
+    A contagem é uma lista com o total de palavras, de palíndromos e de entradas inválidas.
+"""
+
+def _classificar_linhas(linhas, veredictos: bool, gravar) -> list:
+    """
+        Função para a classificação de uma sequência de linhas.
+
+
+        Envia a gravar() o texto de cada palavra classificada e retorna a contagem das linhas.
+        O laço inteiro fica nesta função, sem uma chamada adicional por linha, pois é o trecho mais executado da varredura.
+    """
+    verificar = Palindromo.verificar
+    valida = Palindromo.entrada_valida
+    palavras = palindromos = invalidas = 0
+
+    for linha in linhas:
+        palavra = linha.strip()
+        if not palavra:
+            continue
+        palavras += 1
+        if not valida(palavra):
+            invalidas += 1
+            if veredictos:
+                gravar(f"{palavra}\tinvalida\n")
+        elif verificar(palavra):
+            palindromos += 1
+            gravar(f"{palavra}\tpalindromo\n" if veredictos else f"{palavra}\n")
+        elif veredictos:
+            gravar(f"{palavra}\tnao_palindromo\n")
+    return [palavras, palindromos, invalidas]
+
+
+def _resumo_varredura(contagem: list, inicio: float) -> dict:
+    palavras, palindromos, invalidas = contagem
+    tempo = time.perf_counter() - inicio
+    return {
+        "palavras": palavras,
+        "palindromos": palindromos,
+        "invalidas": invalidas,
+        "tempo": round(tempo, 3),
+        "palavras_por_segundo": round(palavras / tempo) if tempo > 0 else 0,
+    }
+
+
+"""
+    Funções auxiliares da varredura em vários processos.
+
+
+    Ficam fora da classe para que possam ser enviadas aos processos do conjunto.
+    Cada processo abre o seu próprio mapeamento do arquivo uma única vez, na inicialização.
+"""
+
+_mapa = None
+
+
+def _blocos(caminho: str, tamanho_bloco: int):
+    """
+        Função para a divisão do arquivo em blocos.
+
+
+        Gera os intervalos (início, fim), em bytes, de cada bloco; cada bloco termina logo após uma quebra de linha ou no fim do arquivo.
+    """
+    total = os.path.getsize(caminho)
+    if not total:
+        return
+    with open(caminho, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        inicio = 0
+        while inicio < total:
+            fim = mapa.find(b"\n", min(inicio + tamanho_bloco, total) - 1)
+            fim = total if fim == -1 else fim + 1
+            yield inicio, fim
+            inicio = fim
+
+
+def _abrir_mapa(caminho: str):
+    global _mapa
+    if os.path.getsize(caminho):
+        arquivo = open(caminho, "rb")
+        _mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _varrer_bloco(bloco: tuple, veredictos: bool):
+    """
+        Função para a verificação de um bloco, executada nos processos do conjunto.
+
+
+        Retorna o texto a ser gravado e a contagem do bloco.
+    """
+    inicio, fim = bloco
+    linhas = _mapa[inicio:fim].decode("utf-8", errors="replace").split("\n")
+    resultado = []
+    contagem = _classificar_linhas(linhas, veredictos, resultado.append)
+    return "".join(resultado), contagem
+
+
+def _gravar_bloco(resultado: tuple, saida, contagem: list):
+    texto, contagem_bloco = resultado
+    saida.write(texto)
+    for posicao, quantidade in enumerate(contagem_bloco):
+        contagem[posicao] += quantidade
+
+
+"""
+    Instruções para a varredura pelo terminal.
+
+
+    O arquivo de entrada pode ser omitido (ou informado como '-') para ler da entrada padrão; sem --saida, o resultado é gravado na saída padrão.
+    O resumo, com a vazão em palavras por segundo, é exibido na saída de erros, para não se misturar ao resultado.
+    Com --processos, o arquivo é varrido por varrer_arquivo(), em vários processos ('--processos 0' usa um processo por núcleo).
+        ...
+        Exemplo de uso:
+
+            python Palindromo.py palavras.txt --saida palindromos.txt
+            cat palavras.txt | python Palindromo.py --veredictos > resultado.tsv
+            python Palindromo.py corpus.txt --processos 0 --saida palindromos.txt
+
+    Com --benchmark, nenhum arquivo é lido: são exibidos os tempos de comparar_verificacoes() e, com o NumPy instalado, as vazões de comparar_lote().
+        ...
+        Exemplo de uso:
+
+            python Palindromo.py --benchmark
+"""
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Varredura de palíndromos em uma lista de palavras (uma por linha).")
+    parser.add_argument("entrada", nargs="?", default="-", help="arquivo de palavras; '-' ou omitido para a entrada padrão")
+    parser.add_argument("--saida", help="arquivo do resultado; por padrão, a saída padrão")
+    parser.add_argument("--veredictos", action="store_true", help="grava todas as palavras com o resultado, em vez de apenas os palíndromos")
+    parser.add_argument("--processos", type=int, help="varre o arquivo em vários processos; 0 para um processo por núcleo")
+    parser.add_argument("--benchmark", action="store_true", help="exibe os tempos de cada forma de verificação e encerra")
+    args = parser.parse_args()
+    if args.benchmark:
+        for caso, tempos in Palindromo.comparar_verificacoes().items():
+            print(f"{caso:>24}: " + "  ".join(f"{nome} {tempo} ns" for nome, tempo in tempos.items()))
+        try:
+            vazoes = Palindromo.comparar_lote()
+        except ImportError as e:
+            print(e)
+        else:
+            print(f"{'lote (palavras/s)':>24}: " + "  ".join(f"{nome} {vazao}" for nome, vazao in vazoes.items()))
+        sys.exit(0)
+    if args.processos is not None and args.entrada == "-":
+        parser.error("--processos exige um arquivo de entrada.")
+
+    entrada = sys.stdin if args.entrada == "-" or args.processos is not None else open(args.entrada, encoding="utf-8", errors="replace")
+    saida = sys.stdout if not args.saida else open(args.saida, "w", encoding="utf-8")
+    try:
+        if args.processos is not None:
+            resumo = Palindromo.varrer_arquivo(args.entrada, saida, args.veredictos, args.processos or None)
+        else:
+            resumo = Palindromo.varrer(entrada, saida, args.veredictos)
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+        if saida is not sys.stdout:
+            saida.close()
+    processos = f", {resumo['processos']} processos" if "processos" in resumo else ""
+    print(f"{resumo['palavras']} palavras, {resumo['palindromos']} palíndromos e {resumo['invalidas']} entradas inválidas "
+          f"em {resumo['tempo']} s ({resumo['palavras_por_segundo']} palavras/s{processos}).", file=sys.stderr)
@@ -0,0 +1,273 @@
+"""
+    Preenchimento Rápido - COTEFÁCIL
+    --------------------------------
+    Modo opcional de preenchimento do formulário de cadastro com um único comando execute_script().
+
+    No modo fiel (funções preencher_* e selecionar_* do Teste Automatizado), cada campo custa ao menos uma espera
+    com WebDriverWait e um send_keys() ou click(), ou seja, uma ou mais requisições ao WebDriver por campo.
+    Neste modo, os dados do registro são enviados de uma só vez a um script JavaScript que preenche os campos de texto,
+    os radio buttons de gênero, os checkboxes de hobbies, os selects 'Skills', 'countries', 'yearbox', mês e 'daybox'
+    e as senhas, disparando os eventos 'input' e 'change' de cada campo.
+
+    A estratégia é escolhida pelo tipo de componente de cada campo do esquema (módulo Formulario): os tipos em
+    TIPOS_RAPIDOS entram no script; a imagem ('arquivo'), os botões e a tela de login continuam no modo fiel,
+    pois dependem de componentes que o script não reproduz com fidelidade.
+
+
+    IDIOMAS EM LOTE:
+    ----------------
+    No modo fiel, cada idioma custa uma espera por By.LINK_TEXT, um scrollIntoView() e um clique, ou seja, três
+    requisições por idioma. Neste modo, todos os idiomas são selecionados por um único script, que clica nas opções
+    da lista do componente 'multi-select', e os itens criados em 'msdd' ('.ui-autocomplete-multiselect-item')
+    são conferidos com uma única leitura. A seleção clique a clique continua disponível no modo fiel.
+
+
+    VALIDAÇÃO:
+    ----------
+    O registro inteiro é validado antes do login, com os mesmos validadores e mensagens do modo fiel.
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import time
+from colorama import Fore, Style
+from selenium.common.exceptions import NoSuchElementException
+from Espera import espera
+from Formulario import CAMPOS, CAMPOS_CADASTRO, CAMPOS_LOGIN, ESQUEMA, MESES, executar_campo, validar_registro
+from Resultado import registrar_resultado, executar_etapas, notificar_etapa
+
+
+"""
+    SCRIPT
+    ------
+"""
+
+TIPOS_RAPIDOS = frozenset({"texto", "radio", "checkbox", "select", "data"})
+
+SCRIPT_PREENCHIMENTO = """
+var entradas = arguments[0], ausentes = [];
+
+function campo(seletor) {
+    var elemento = document.querySelector(seletor);
+    if (!elemento) { ausentes.push(seletor); }
+    return elemento;
+}
+function disparar(elemento) {
+    elemento.dispatchEvent(new Event('input', {bubbles: true}));
+    elemento.dispatchEvent(new Event('change', {bubbles: true}));
+}
+function texto(seletor, valor) {
+    var elemento = campo(seletor);
+    if (elemento) { elemento.value = valor; disparar(elemento); }
+}
+function marcar(seletor) {
+    var elemento = campo(seletor);
+    if (elemento && !elemento.checked) { elemento.click(); }
+}
+function selecionar(seletor, valor, porTexto, criarOpcao) {
+    var select = campo(seletor);
+    if (!select) { return; }
+    if (criarOpcao) {
+        var nova = document.createElement('option');
+        nova.text = valor;
+        nova.value = valor;
+        select.add(nova);
+        select.value = valor;
+        disparar(select);
+        return;
+    }
+    for (var i = 0; i < select.options.length; i++) {
+        var opcao = select.options[i];
+        if ((porTexto ? opcao.text : opcao.value) === valor) {
+            select.selectedIndex = i;
+            disparar(select);
+            return;
+        }
+    }
+    ausentes.push(seletor + ' [' + valor + ']');
+}
+
+entradas.forEach(function (entrada) {
+    var seletores = entrada.seletores, valor = entrada.valor;
+    switch (entrada.tipo) {
+        case 'texto':
+            seletores.forEach(function (seletor) { texto(seletor, valor); });
+            break;
+        case 'radio':
+            marcar(seletores[0].replace('{}', valor));
+            break;
+        case 'checkbox':
+            valor.forEach(function (item) { marcar(seletores[0].replace('{}', item)); });
+            break;
+        case 'select':
+            selecionar(seletores[0], valor, false, entrada.criarOpcao);
+            break;
+        case 'data':
+            selecionar(seletores[0], valor[0], false, false);
+            selecionar(seletores[1], valor[1], true, false);
+            selecionar(seletores[2], valor[2], false, false);
+            break;
+    }
+});
+return ausentes;
+"""
+
+
+SCRIPT_IDIOMAS = """
+var lista = document.querySelector(arguments[0]), idiomas = arguments[1], ausentes = [];
+if (!lista) { return idiomas; }
+var opcoes = {};
+lista.querySelectorAll('a').forEach(function (link) { opcoes[link.textContent.trim()] = link; });
+idiomas.forEach(function (idioma) {
+    if (opcoes[idioma]) { opcoes[idioma].click(); } else { ausentes.push(idioma); }
+});
+return ausentes;
+"""
+
+SCRIPT_ITENS_IDIOMAS = """
+return Array.prototype.map.call(
+    document.querySelectorAll(arguments[0] + ' .ui-autocomplete-multiselect-item'),
+    function (item) { return item.textContent.trim(); }
+);
+"""
+
+
+def _valor_script(campo, valor):
+    if campo.tipo == "radio":
+        return campo.opcoes[valor]
+    if campo.tipo == "data":
+        ano, mes, dia = valor
+        return [str(ano), MESES[mes], str(dia)]
+    return list(valor) if campo.tipo == "checkbox" else valor
+
+
+def montar_entradas(registro: dict) -> list:
+    """
+        Montagem das entradas
+        ---------------------
+        Converte os campos da tela de cadastro com tipo em TIPOS_RAPIDOS nas entradas do script:
+        tipo do componente, seletores CSS e valor no formato esperado pelo elemento.
+
+        Parâmetro: Registro com os dados do usuário (já validado).
+    """
+    return [
+        {"tipo": campo.tipo, "seletores": list(campo.seletores), "valor": _valor_script(campo, campo.valor(registro)),
+         "criarOpcao": campo.criar_opcao}
+        for campo in ESQUEMA
+        if campo.pagina == "cadastro" and campo.tipo in TIPOS_RAPIDOS
+    ]
+
+
+"""
+    PREENCHIMENTO
+    -------------
+"""
+
+@registrar_resultado("campos")
+def preencher_campos(navegador, registro: dict):
+    """
+        Preenchimento em uma requisição
+        -------------------------------
+        Preenche os campos da tela de cadastro com tipo em TIPOS_RAPIDOS com uma única chamada a execute_script().
+        Aguarda uma vez até que o formulário 'basicBootstrapForm' esteja presente. Retorna um ResultadoCampo.
+
+        Parâmetros: Navegador, registro com os dados do usuário.
+    """
+    try:
+        espera(navegador).aguardar_formulario()
+        ausentes = navegador.execute_script(SCRIPT_PREENCHIMENTO, montar_entradas(registro))
+        if ausentes:
+            raise NoSuchElementException(f"Elementos não encontrados: {', '.join(ausentes)}.")
+        print(Fore.GREEN + "\nCampos do formulário preenchidos com sucesso (modo rápido).")
+
+    except NoSuchElementException as e:
+        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
+        raise
+    except Exception as e:
+        print(f"{Fore.RED}\nErro ao preencher o formulário:{Style.RESET_ALL} {e}")
+        raise
+    print("_" * 60)
+
+
+@registrar_resultado("idiomas")
+def selecionar_idiomas_lote(navegador, idiomas: list):
+    """
+        Seleção dos idiomas em lote
+        ---------------------------
+        Seleciona todos os idiomas com uma única chamada a execute_script() e confere, com uma única leitura,
+        se cada idioma aparece entre os itens selecionados do componente. Retorna um ResultadoCampo.
+
+        Parâmetros: Navegador, lista de idiomas (já validada).
+    """
+    if not idiomas:
+        return
+    seletor_caixa, seletor_lista = CAMPOS["idiomas"].seletores
+    try:
+        ausentes = navegador.execute_script(SCRIPT_IDIOMAS, seletor_lista, list(idiomas))
+        if ausentes:
+            raise NoSuchElementException(f"Idiomas não encontrados na lista: {', '.join(ausentes)}.")
+        selecionados = set(navegador.execute_script(SCRIPT_ITENS_IDIOMAS, seletor_caixa) or [])
+        nao_selecionados = [idioma for idioma in idiomas if idioma not in selecionados]
+        if nao_selecionados:
+            raise ValueError(f"Idiomas não selecionados: {', '.join(nao_selecionados)}.")
+        print(f"{Fore.GREEN}\nIdiomas{Style.RESET_ALL} '{', '.join(idiomas)}' {Fore.GREEN}selecionados com sucesso (em lote).")
+
+    except NoSuchElementException as e:
+        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
+        raise
+    except Exception as e:
+        print(f"{Fore.RED}\nErro ao inserir o idioma:{Style.RESET_ALL} {e}")
+        raise
+    print("_" * 60)
+
+
+@registrar_resultado("validacao")
+def _validar(registro: dict, campos):
+    try:
+        validar_registro(registro, campos)
+    except ValueError as e:
+        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
+        raise
+
+
+def _etapas(navegador, registro: dict, campos) -> list:
+    etapas = []
+    script_incluido = False
+    for campo in campos:
+        if campo.pagina == "cadastro" and campo.tipo in TIPOS_RAPIDOS:
+            if not script_incluido:
+                etapas.append(lambda: preencher_campos(navegador, registro))
+                script_incluido = True
+        elif campo.tipo == "multiselect":
+            etapas.append(lambda campo=campo: selecionar_idiomas_lote(navegador, campo.valor(registro) or []))
+        else:
+            etapas.append(lambda campo=campo: executar_campo(navegador, campo, campo.valor(registro) if campo.chaves else None))
+    return etapas
+
+
+def preencher_formulario_rapido(navegador, registro: dict, pular_login: bool = False) -> list:
+    """
+        Fluxo completo (modo rápido)
+        ----------------------------
+        Valida o registro e executa os campos do esquema em ordem: os campos da tela de cadastro com tipo em
+        TIPOS_RAPIDOS são preenchidos juntos por preencher_campos(), no lugar do primeiro deles; os idiomas são
+        selecionados por selecionar_idiomas_lote(); os demais usam o motor do modo fiel.
+        Assim como no modo fiel, o fluxo é interrompido no primeiro campo com falha, cada tela é medida como uma etapa
+        ('tela_login' e 'tela_cadastro') e a lista de ResultadoCampo é retornada.
+
+        Parâmetros: Navegador, registro com os dados do usuário, pular o login (opcional; o navegador já deve estar na tela de cadastro).
+    """
+    telas = [("tela_cadastro", CAMPOS_CADASTRO)]
+    if not pular_login:
+        telas.insert(0, ("tela_login", CAMPOS_LOGIN))
+
+    resultados = executar_etapas([lambda: _validar(registro, [campo for _, campos in telas for campo in campos])])
+    for tela, campos in telas:
+        if not all(resultado.sucesso for resultado in resultados):
+            break
+        inicio = time.perf_counter()
+        resultados += notificar_etapa(tela, inicio, executar_etapas(_etapas(navegador, registro, campos)))
+    return resultados
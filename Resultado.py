@@ -0,0 +1,183 @@
+"""
+    Resultados - COTEFÁCIL
+    ----------------------
+    Estruturas de resultado usadas pelo Teste Automatizado.
+
+    Cada função do formulário retorna um ResultadoCampo com o nome do campo, o status ('ok' ou 'falha'),
+    o tempo de execução e a mensagem de erro, em vez de encerrar o programa com sys.exit().
+    Os resultados de um cadastro completo são reunidos em um ResultadoRegistro, permitindo que execuções em lote
+    continuem após uma falha e apresentem todos os erros ao final.
+    Cada resultado também informa quantas novas tentativas as falhas passageiras exigiram (ver módulo Retentativa).
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import functools
+import time
+from dataclasses import dataclass, field, asdict
+from Metricas import notificar, notificar_retentativas
+from Retentativa import contar_retentativas
+
+
+"""
+    ESTRUTURAS
+    ----------
+"""
+
+@dataclass
+class ResultadoCampo:
+    """
+        Resultado de um campo
+        ---------------------
+        Nome do campo, status ('ok' ou 'falha'), tempo de execução em segundos, mensagem de erro, quando houver,
+        e número de novas tentativas feitas após falhas passageiras.
+    """
+    campo: str
+    status: str
+    tempo: float
+    erro: str = None
+    retentativas: int = 0
+
+    @property
+    def sucesso(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass
+class ResultadoRegistro:
+    """
+        Resultado de um registro
+        ------------------------
+        Índice do registro, resultados de cada campo executado e tempo total em segundos.
+        O registro tem sucesso quando todos os campos executados têm sucesso.
+    """
+    indice: int
+    campos: list = field(default_factory=list)
+    tempo: float = 0.0
+    erro: str = None
+
+    @property
+    def status(self) -> str:
+        return "ok" if self.erro is None and all(c.sucesso for c in self.campos) else "falha"
+
+    @property
+    def falha(self) -> ResultadoCampo:
+        return next((c for c in self.campos if not c.sucesso), None)
+
+    def como_dict(self) -> dict:
+        """
+            Conversão para dicionário
+            -------------------------
+            Retorna o resultado no formato gravado nos arquivos de saída.
+
+            Não exige parâmetros.
+        """
+        falha = self.falha
+        erro = self.erro or (f"{falha.campo}: {falha.erro}" if falha else None)
+        return {
+            "indice": self.indice,
+            "status": self.status,
+            "tempo": round(self.tempo, 3),
+            "erro": erro,
+            "retentativas": sum(c.retentativas for c in self.campos),
+            "campos": [asdict(c) for c in self.campos],
+        }
+
+
+"""
+    EXECUÇÃO
+    --------
+"""
+
+def registrar_resultado(campo: str):
+    """
+        Registro do resultado
+        ---------------------
+        Decorador que mede o tempo da função e converte sua execução em um ResultadoCampo.
+        Uma exceção lançada pela função resulta em status 'falha', com a mensagem da exceção como erro.
+        O tempo de cada execução e as novas tentativas feitas durante ela também são informados aos observadores do
+        módulo Metricas.
+
+            Exemplo:
+
+                @registrar_resultado("nome")
+                def preencher_nome(navegador, nome): ...
+
+        Parâmetro: Nome do campo.
+    """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def executar(*args, **kwargs) -> ResultadoCampo:
+            inicio = time.perf_counter()
+            with contar_retentativas() as contador:
+                try:
+                    funcao(*args, **kwargs)
+                    status, erro = "ok", None
+                except Exception as e:
+                    status, erro = "falha", str(e).strip() or type(e).__name__
+            tempo = time.perf_counter() - inicio
+            notificar(campo, tempo, status)
+            if contador[0]:
+                notificar_retentativas(campo, contador[0])
+            return ResultadoCampo(campo, status, round(tempo, 3), erro, contador[0])
+        return executar
+    return decorador
+
+
+def notificar_etapa(etapa: str, inicio: float, resultados: list) -> list:
+    """
+        Notificação de uma etapa
+        ------------------------
+        Informa aos observadores do módulo Metricas o tempo de uma etapa formada por vários campos (por exemplo,
+        a tela de login), com status 'falha' quando algum dos campos falhou. Retorna os próprios resultados.
+
+            Exemplo:
+
+                inicio = time.perf_counter()
+                resultados = notificar_etapa("tela_login", inicio, preencher_registro(navegador, registro, CAMPOS_LOGIN))
+
+        Parâmetros: Nome da etapa, instante de início (time.perf_counter()), lista de ResultadoCampo da etapa.
+    """
+    status = "ok" if all(resultado.sucesso for resultado in resultados) else "falha"
+    notificar(etapa, time.perf_counter() - inicio, status)
+    return resultados
+
+
+def executar_etapas(etapas) -> list:
+    """
+        Execução das etapas
+        -------------------
+        Executa em ordem as funções que retornam ResultadoCampo e interrompe a sequência na primeira falha,
+        pois as etapas seguintes dependem da anterior (por exemplo, o formulário só existe após o login).
+        Retorna a lista de resultados das etapas executadas.
+
+        Parâmetro: Sequência de funções sem argumentos.
+    """
+    resultados = []
+    for etapa in etapas:
+        resultado = etapa()
+        resultados.append(resultado)
+        if not resultado.sucesso:
+            break
+    return resultados
+
+
+async def executar_etapas_async(etapas) -> list:
+    """
+        Execução das etapas (assíncrona)
+        --------------------------------
+        Mesmo comportamento de executar_etapas(), com etapas que retornam corrotinas.
+        Retorna a lista de resultados das etapas executadas.
+
+        Parâmetro: Sequência de funções sem argumentos que retornam uma corrotina.
+    """
+    resultados = []
+    for etapa in etapas:
+        resultado = await etapa()
+        resultados.append(resultado)
+        if not resultado.sucesso:
+            break
+    return resultados
@@ -0,0 +1,256 @@
+"""
+    Retentativa - COTEFÁCIL
+    -----------------------
+    Política de novas tentativas para as falhas passageiras do navegador.
+
+    Algumas falhas não indicam um erro no registro, e sim um momento ruim da página: um elemento recriado pelo
+    JavaScript entre a localização e o uso (StaleElementReferenceException), um clique interceptado por um anúncio
+    sobreposto (ElementClickInterceptedException) ou o select de ano ('yearbox') que demora a ser exibido.
+    Em vez de encerrar o registro na primeira ocorrência, cada ação sobre um elemento é repetida conforme a política
+    do tipo de componente do campo, com espera exponencial limitada entre as tentativas.
+
+    Para que as novas tentativas não transformem um registro problemático em uma execução sem fim, cada registro
+    pode ter um orçamento de tempo: as esperas dos elementos são limitadas ao tempo restante, nenhuma nova tentativa
+    é feita quando a pausa ultrapassaria o orçamento e, esgotado o orçamento, os campos seguintes falham de imediato.
+
+    O número de novas tentativas de cada campo é gravado no ResultadoCampo ('retentativas') e informado ao relatório
+    de métricas (ver módulo Metricas).
+
+
+    Exemplo de uso:
+    ---------------
+        definir_politica("botao", tentativas=5)
+        with configurar_retentativas(orcamento=60):
+            executar_lote("registros.jsonl", "resultados.jsonl")
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import dataclasses
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from colorama import Fore, Style
+from selenium.common.exceptions import (ElementClickInterceptedException, ElementNotInteractableException,
+                                        StaleElementReferenceException, TimeoutException)
+
+
+"""
+    POLÍTICAS
+    ---------
+    TRANSITORIAS: Exceções repetidas em todos os tipos de componente.
+    POLITICAS: Política de cada tipo de componente do esquema do Formulario; tipos ausentes usam a política 'padrao'.
+               No tipo 'data', a espera pelo 'yearbox' é mais curta e também é repetida, em vez de uma única espera longa.
+"""
+
+TRANSITORIAS = (StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException)
+
+
+@dataclass(frozen=True)
+class Politica:
+    """
+        Política de novas tentativas
+        ----------------------------
+        tentativas: Número máximo de execuções da ação, contando a primeira.
+        espera_inicial: Pausa antes da segunda tentativa, em segundos.
+        fator: Multiplicador da pausa a cada nova tentativa.
+        espera_maxima: Limite da pausa entre duas tentativas, em segundos.
+        espera_elemento: Tempo máximo de espera pelo elemento em cada tentativa (opcional; por padrão, o do módulo Espera).
+        excecoes: Exceções consideradas passageiras.
+    """
+    tentativas: int = 3
+    espera_inicial: float = 0.1
+    fator: float = 2.0
+    espera_maxima: float = 2.0
+    espera_elemento: float = None
+    excecoes: tuple = TRANSITORIAS
+
+    def pausa(self, tentativa: int) -> float:
+        """
+            Pausa
+            -----
+            Retorna a pausa, em segundos, após a tentativa informada (1 para a primeira).
+
+            Parâmetro: Número da tentativa que falhou.
+        """
+        return min(self.espera_maxima, self.espera_inicial * self.fator ** (tentativa - 1))
+
+
+POLITICAS = {
+    "padrao": Politica(),
+    "botao": Politica(tentativas=4, espera_inicial=0.25),
+    "radio": Politica(tentativas=4, espera_inicial=0.25),
+    "checkbox": Politica(tentativas=4, espera_inicial=0.25),
+    "data": Politica(tentativas=4, espera_inicial=0.25, espera_elemento=3, excecoes=TRANSITORIAS + (TimeoutException,)),
+}
+
+
+def politica(tipo: str) -> Politica:
+    """
+        Política do tipo
+        ----------------
+        Retorna a política do tipo de componente ou, sem política própria, a política 'padrao'.
+        Com um número de tentativas definido por configurar_retentativas(), ele substitui o da política.
+
+        Parâmetro: Tipo de componente do campo.
+    """
+    escolhida = POLITICAS.get(tipo, POLITICAS["padrao"])
+    if _tentativas is not None:
+        return dataclasses.replace(escolhida, tentativas=_tentativas)
+    return escolhida
+
+
+def definir_politica(tipo: str, **alteracoes) -> Politica:
+    """
+        Definição de política
+        ---------------------
+        Altera a política de um tipo de componente, partindo da política atual do tipo ou da 'padrao'.
+        Retorna a nova política.
+
+            Exemplo: definir_politica("data", tentativas=6, espera_elemento=2)
+
+        Parâmetros: Tipo de componente (ou 'padrao'), atributos alterados da Politica.
+    """
+    POLITICAS[tipo] = dataclasses.replace(POLITICAS.get(tipo, POLITICAS["padrao"]), **alteracoes)
+    return POLITICAS[tipo]
+
+
+"""
+    ORÇAMENTO DO REGISTRO
+    ---------------------
+    O prazo e o contador de novas tentativas ficam em variáveis de contexto: cada thread de sessão e cada tarefa
+    assíncrona tem os seus, e asyncio.to_thread() os leva para a thread que executa o campo.
+"""
+
+_prazo = ContextVar("prazo", default=None)
+_contador = ContextVar("contador", default=None)
+_orcamento = None
+_tentativas = None
+
+
+@contextmanager
+def configurar_retentativas(tentativas: int = None, orcamento: float = None):
+    """
+        Configuração das novas tentativas
+        ---------------------------------
+        Define, durante o bloco, o número de tentativas de todas as políticas e o orçamento de tempo de cada registro.
+        Valores não informados mantêm as políticas do tipo e deixam os registros sem orçamento.
+
+        Parâmetros: Número máximo de tentativas por ação (opcional), orçamento de cada registro em segundos (opcional).
+    """
+    global _orcamento, _tentativas
+    if tentativas is not None and tentativas < 1:
+        raise ValueError("O número de tentativas deve ser maior que zero.")
+    anteriores = _tentativas, _orcamento
+    _tentativas, _orcamento = tentativas, orcamento
+    try:
+        yield
+    finally:
+        _tentativas, _orcamento = anteriores
+
+
+@contextmanager
+def orcamento_registro(segundos: float = None):
+    """
+        Orçamento do registro
+        ---------------------
+        Inicia o prazo de um registro, que vale até o fim do bloco. Sem segundos, usa o orçamento definido por
+        configurar_retentativas(); sem nenhum dos dois, o registro não tem prazo.
+
+        Parâmetro: Orçamento em segundos (opcional).
+    """
+    segundos = _orcamento if segundos is None else segundos
+    token = _prazo.set(time.perf_counter() + segundos if segundos else None)
+    try:
+        yield
+    finally:
+        _prazo.reset(token)
+
+
+def tempo_restante(limite: float = None) -> float:
+    """
+        Tempo restante
+        --------------
+        Retorna o tempo restante do registro, em segundos, limitado ao valor informado.
+        Sem prazo, retorna o próprio limite (None quando não informado).
+
+        Parâmetro: Limite em segundos (opcional).
+    """
+    prazo = _prazo.get()
+    if prazo is None:
+        return limite
+    restante = max(0.0, prazo - time.perf_counter())
+    return restante if limite is None else min(limite, restante)
+
+
+def verificar_orcamento():
+    """
+        Verificação do orçamento
+        ------------------------
+        Lança TimeoutError quando o prazo do registro já terminou.
+
+        Não exige parâmetros.
+    """
+    if tempo_restante() == 0:
+        raise TimeoutError("Orçamento de tempo do registro esgotado.")
+
+
+"""
+    EXECUÇÃO
+    --------
+"""
+
+@contextmanager
+def contar_retentativas():
+    """
+        Contagem das novas tentativas
+        -----------------------------
+        Conta as novas tentativas feitas durante o bloco. O contador é uma lista com um único número.
+
+            Exemplo:
+
+                with contar_retentativas() as contador:
+                    executar_campo(navegador, "nome", "Ana")
+                print(contador[0])
+
+        Não exige parâmetros.
+    """
+    contador = [0]
+    token = _contador.set(contador)
+    try:
+        yield contador
+    finally:
+        _contador.reset(token)
+
+
+def repetir(acao, politica_acao: Politica = None):
+    """
+        Execução com novas tentativas
+        -----------------------------
+        Executa a ação e, nas exceções passageiras da política, a repete com espera exponencial limitada.
+        A última exceção é propagada quando as tentativas acabam ou quando a pausa ultrapassaria o orçamento do registro.
+        Retorna o resultado da ação.
+
+        Parâmetros: Função sem argumentos, política (opcional; por padrão, a política 'padrao').
+    """
+    politica_acao = politica_acao or politica("padrao")
+    tentativa = 1
+    while True:
+        try:
+            return acao()
+        except politica_acao.excecoes as e:
+            pausa = politica_acao.pausa(tentativa)
+            restante = tempo_restante()
+            if tentativa >= politica_acao.tentativas or (restante is not None and restante <= pausa):
+                raise
+            contador = _contador.get()
+            if contador is not None:
+                contador[0] += 1
+            print(f"{Fore.YELLOW}\nTentativa {tentativa} sem sucesso ({type(e).__name__}).{Style.RESET_ALL} "
+                  f"Nova tentativa em {pausa:.2f} s.")
+            time.sleep(pausa)
+            tentativa += 1
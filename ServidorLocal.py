@@ -0,0 +1,69 @@
+"""
+    Servidor Local - COTEFÁCIL
+    --------------------------
+    Servidor HTTP local que publica as páginas da pasta 'fixtures', réplicas das telas de login (Index) e de
+    cadastro (Register) de demo.automationtesting.in.
+
+    As páginas reproduzem os elementos usados pelo Teste Automatizado ('email', 'enterimg', 'basicBootstrapForm',
+    'msdd', 'Skills', 'countries', 'yearbox', 'daybox', 'firstpassword', 'secondpassword', 'submitbtn'),
+    na mesma ordem do site original, sem imagens, anúncios ou scripts de terceiros.
+    Assim, as medições de desempenho não dependem da rede e podem ser repetidas.
+
+
+    Exemplo de uso:
+    ---------------
+        servidor, url_base = iniciar_servidor()
+        TesteAutomatizado.url = url_base + "Index.html"
+        ...
+        servidor.shutdown()
+
+    Também pode ser executado diretamente: python ServidorLocal.py [porta]
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import functools
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+"""
+    CONFIGURAÇÕES
+    -------------
+"""
+
+PASTA_FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+class _RequisicaoSilenciosa(SimpleHTTPRequestHandler):
+    def log_message(self, formato, *args):
+        pass
+
+
+def iniciar_servidor(porta: int = 0):
+    """
+        Inicialização do servidor
+        -------------------------
+        Inicia o servidor em uma thread em segundo plano e retorna o servidor e a URL base das páginas.
+        Com a porta 0, o sistema escolhe uma porta livre.
+
+        Parâmetro: Porta do servidor (opcional).
+    """
+    requisicao = functools.partial(_RequisicaoSilenciosa, directory=str(PASTA_FIXTURES))
+    servidor = ThreadingHTTPServer(("127.0.0.1", porta), requisicao)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}/"
+
+
+if __name__ == "__main__":
+    servidor, url_base = iniciar_servidor(int(sys.argv[1]) if len(sys.argv) > 1 else 8000)
+    print(f"Servindo {PASTA_FIXTURES} em {url_base}Index.html (Ctrl+C para encerrar)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        servidor.shutdown()
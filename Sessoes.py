@@ -0,0 +1,281 @@
+"""
+    Sessões - COTEFÁCIL
+    -------------------
+    Conjunto (pool) de sessões do Chrome reutilizadas entre os registros das execuções paralelas.
+
+    Abrir um Chrome leva alguns segundos. O pool abre todas as sessões antes do primeiro registro (aquecimento) e,
+    ao fim de cada registro, em vez de fechar o navegador, apaga os cookies, limpa o localStorage e o sessionStorage
+    e volta à página inicial do fluxo. Antes de cada empréstimo, a sessão é verificada; um navegador que deixou de
+    responder é reaberto no lugar.
+
+    A abertura do Chrome pode ser limitada a alguns navegadores ao mesmo tempo (lançamentos), para que o aquecimento
+    de muitas sessões não dispute CPU e disco de uma só vez.
+
+    Para limitar o crescimento de memória em execuções longas, uma sessão é reciclada (fechada e aberta de novo, em
+    segundo plano) após um número configurável de registros ou quando a memória de JavaScript da página
+    (performance.memory) passa do limite informado.
+
+
+    Exemplo de uso:
+    ---------------
+        pool = PoolSessoes(4, PERFIS["headless"], registros_por_sessao=200, memoria_maxima=512)
+        pool.aquecer()
+        with pool.sessao() as sessao:
+            preencher_formulario(sessao.navegador, registro)
+        pool.encerrar()
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from colorama import Fore, Style
+from selenium.common.exceptions import WebDriverException
+import TesteAutomatizado
+from Metricas import medir
+from Navegador import criar_navegador
+
+SCRIPT_LIMPEZA = "window.localStorage.clear(); window.sessionStorage.clear();"
+SCRIPT_MEMORIA = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+"""
+    VERIFICAÇÕES
+    ------------
+"""
+
+def navegador_ativo(navegador) -> bool:
+    """
+        Navegador ativo
+        ---------------
+        Retorna se o navegador ainda responde aos comandos do WebDriver.
+
+        Parâmetro: Navegador.
+    """
+    try:
+        navegador.title
+        return True
+    except WebDriverException:
+        return False
+
+
+def memoria_mb(navegador) -> float:
+    """
+        Memória da página
+        -----------------
+        Retorna a memória de JavaScript em uso pela página, em MB, ou None quando o navegador não a informa.
+
+        Parâmetro: Navegador.
+    """
+    memoria = navegador.execute_script(SCRIPT_MEMORIA)
+    return memoria / 2**20 if isinstance(memoria, (int, float)) else None
+
+
+"""
+    POOL
+    ----
+"""
+
+@dataclass
+class Sessao:
+    """
+        Sessão do pool
+        --------------
+        Número da sessão (também usado no diretório de usuário do Chrome), navegador e registros executados desde a abertura.
+    """
+    numero: int
+    navegador: object = None
+    registros: int = 0
+
+
+class PoolSessoes:
+    """
+        Pool de sessões
+        ---------------
+        Mantém até 'tamanho' sessões abertas e as empresta a um registro de cada vez.
+
+        Parâmetros: Número de sessões, perfil do navegador (opcional), caminho do driver (opcional),
+                    registros por sessão antes da reciclagem (opcional), memória máxima da página em MB (opcional),
+                    página inicial das sessões (opcional; por padrão, TesteAutomatizado.url),
+                    número máximo de navegadores abrindo ao mesmo tempo (opcional; por padrão, sem limite).
+    """
+
+    def __init__(self, tamanho: int, perfil=None, caminho_driver: str = None, registros_por_sessao: int = None,
+                 memoria_maxima: float = None, url: str = None, lancamentos: int = None):
+        if tamanho < 1:
+            raise ValueError("O número de sessões deve ser maior que zero.")
+        if lancamentos is not None and lancamentos < 1:
+            raise ValueError("O número de lançamentos simultâneos deve ser maior que zero.")
+        self.tamanho = tamanho
+        self.perfil = perfil
+        self.caminho_driver = caminho_driver
+        self.registros_por_sessao = registros_por_sessao
+        self.memoria_maxima = memoria_maxima
+        self.url = url
+        self._lancamentos = threading.BoundedSemaphore(lancamentos or tamanho)
+        self._livres = queue.Queue()
+        self._vivas = 0
+        self._reciclagens = []
+        self._trava = threading.Lock()
+
+    def _abrir(self, sessao: Sessao):
+        with self._lancamentos:
+            sessao.navegador = criar_navegador(self.perfil, caminho_driver=self.caminho_driver, sessao=sessao.numero)
+        sessao.registros = 0
+        with medir("navegacao"):
+            sessao.navegador.get(self.url or TesteAutomatizado.url)
+
+    def _fechar(self, sessao: Sessao):
+        try:
+            sessao.navegador.quit()
+        except WebDriverException:
+            pass
+
+    def _perder(self, sessao: Sessao, erro: Exception):
+        with self._trava:
+            self._vivas -= 1
+        print(f"{Fore.RED}\nSessão {sessao.numero} encerrada:{Style.RESET_ALL} {erro}")
+
+    def aquecer(self) -> int:
+        """
+            Aquecimento
+            -----------
+            Abre todas as sessões antes do primeiro registro, respeitando o limite de lançamentos. Sessões que não abrirem
+            são descartadas.
+            Retorna o número de sessões abertas.
+
+            Não exige parâmetros.
+        """
+        sessoes = [Sessao(numero) for numero in range(self.tamanho)]
+        with ThreadPoolExecutor(max_workers=self.tamanho) as executor:
+            erros = list(executor.map(self._abrir_aquecimento, sessoes))
+        for sessao, erro in zip(sessoes, erros):
+            if erro is None:
+                with self._trava:
+                    self._vivas += 1
+                self._livres.put(sessao)
+            else:
+                print(f"{Fore.RED}\nSessão {sessao.numero} não iniciada:{Style.RESET_ALL} {erro}")
+        return self._vivas
+
+    def _abrir_aquecimento(self, sessao: Sessao):
+        try:
+            self._abrir(sessao)
+        except Exception as e:
+            return e
+        return None
+
+    def emprestar(self) -> Sessao:
+        """
+            Empréstimo
+            ----------
+            Retorna uma sessão livre e verificada. Um navegador sem resposta é reaberto antes do empréstimo; se não
+            puder ser reaberto, a sessão é descartada e outra é aguardada. Sem sessões ativas, lança RuntimeError.
+
+            Não exige parâmetros.
+        """
+        while True:
+            with self._trava:
+                if self._vivas <= 0:
+                    raise RuntimeError("Nenhuma sessão ativa.")
+            try:
+                sessao = self._livres.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            if navegador_ativo(sessao.navegador):
+                return sessao
+            print(f"{Fore.YELLOW}\nSessão {sessao.numero}:{Style.RESET_ALL} navegador sem resposta, reabrindo.")
+            self._fechar(sessao)
+            try:
+                self._abrir(sessao)
+            except Exception as e:
+                self._perder(sessao, e)
+                continue
+            return sessao
+
+    def devolver(self, sessao: Sessao):
+        """
+            Devolução
+            ---------
+            Limpa o estado da sessão e a devolve ao pool. Uma falha na limpeza não impede a devolução: a sessão é
+            verificada de novo no próximo empréstimo. Uma sessão que atingiu o limite de registros ou de memória
+            é reciclada em segundo plano e volta ao pool quando o novo navegador estiver pronto.
+
+            Parâmetro: Sessão emprestada.
+        """
+        sessao.registros += 1
+        try:
+            if self._esgotada(sessao):
+                reciclagem = threading.Thread(target=self._reciclar, args=(sessao,), daemon=True)
+                with self._trava:
+                    self._reciclagens.append(reciclagem)
+                reciclagem.start()
+                return
+            navegador = sessao.navegador
+            navegador.execute_script(SCRIPT_LIMPEZA)
+            navegador.delete_all_cookies()
+            with medir("navegacao"):
+                navegador.get(self.url or TesteAutomatizado.url)
+        except Exception as e:
+            print(f"{Fore.YELLOW}\nSessão {sessao.numero}:{Style.RESET_ALL} falha ao limpar o navegador ({e}).")
+        self._livres.put(sessao)
+
+    def _esgotada(self, sessao: Sessao) -> bool:
+        if self.registros_por_sessao and sessao.registros >= self.registros_por_sessao:
+            return True
+        if self.memoria_maxima:
+            memoria = memoria_mb(sessao.navegador)
+            return memoria is not None and memoria > self.memoria_maxima
+        return False
+
+    def _reciclar(self, sessao: Sessao):
+        self._fechar(sessao)
+        try:
+            self._abrir(sessao)
+        except Exception as e:
+            self._perder(sessao, e)
+            return
+        self._livres.put(sessao)
+
+    @contextmanager
+    def sessao(self):
+        """
+            Sessão emprestada
+            -----------------
+            Empresta uma sessão durante o bloco e a devolve ao final, mesmo em caso de erro.
+
+            Não exige parâmetros.
+        """
+        sessao = self.emprestar()
+        try:
+            yield sessao
+        finally:
+            self.devolver(sessao)
+
+    def encerrar(self):
+        """
+            Encerramento
+            ------------
+            Aguarda as reciclagens em andamento e fecha todas as sessões livres.
+
+            Não exige parâmetros.
+        """
+        with self._trava:
+            reciclagens, self._reciclagens = self._reciclagens, []
+        for reciclagem in reciclagens:
+            reciclagem.join()
+        while True:
+            try:
+                sessao = self._livres.get_nowait()
+            except queue.Empty:
+                break
+            self._fechar(sessao)
+        with self._trava:
+            self._vivas = 0
@@ -15,6 +15,9 @@
     ---------------------------
     O navegador é configurado usando o WebDriver do Selenium e o ChromeDriverManager para garantir a compatibilidade com a versão mais recente do Chrome.
     O Service é utilizado para gerenciar o processo de inicialização do driver do navegador.
+    O caminho do driver é resolvido pelo módulo Navegador, que mantém um cache em disco por versão do Chrome e aceita
+    um caminho explícito pela variável de ambiente 'CHROMEDRIVER_PATH'.
+    O navegador só é criado no primeiro uso, através da função obter_navegador(); importar o módulo não abre o Chrome.
 
     Para acessar uma página específica, basta definir a URL completa do site a ser automatizado.
     Para usar outro navegador, como o Firefox ou o Edge, deve-se alterar o WebDriver e as configurações correspondentes (CONSULTAR).
@@ -37,6 +40,12 @@
     Cada elemento encontrado será manipulado com uma das ações especificadas abaixo, e o terminal exibirá uma mensagem 
     de confirmação. Caso o elemento não seja encontrado ou ocorra um erro de execução das ações, o terminal exibirá uma mensagem de erro.
 
+    Os campos são descritos no esquema declarativo do módulo Formulario (localizadores, validadores e mensagens),
+    e cada função preencher_* ou selecionar_* executa o campo correspondente pelo motor genérico executar_campo().
+
+    Cada função retorna um ResultadoCampo (módulo Resultado) com o campo, o status ('ok' ou 'falha'), o tempo de execução
+    e a mensagem de erro. Uma falha não encerra o programa: o erro é registrado no resultado e o fluxo decide como continuar.
+
     
     Métodos principais utilizados:
     ------------------------------
@@ -66,18 +75,15 @@
     BIBLIOTECAS
     -----------
 """
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException
-import re
 import sys
+import time
+from urllib.parse import urljoin
 from colorama import Fore, Style, init
+from selenium.common.exceptions import WebDriverException
+from Navegador import criar_navegador
+from Formulario import CAMPOS_CADASTRO, CAMPOS_LOGIN, executar_campo, preencher_registro, preencher_registro_async
+from Metricas import medir
+from Resultado import notificar_etapa
 
 
 """
@@ -87,15 +93,60 @@ from colorama import Fore, Style, init
 
 init(autoreset=True)
 
-servico = Service(ChromeDriverManager().install())
-navegador = webdriver.Chrome(service=servico)
-navegador.maximize_window()
-
 url = "https://demo.automationtesting.in/Index.html" # Site fictício para testes automatizados.
-navegador.get(url)
 
-print(f"\n\nTeste Automatizado - {Fore.GREEN}Cotefácil\n\n")
-print("_" * 60)
+PAGINA_CADASTRO = "Register.html" # Tela de cadastro, relativa à URL da tela de login.
+
+_navegador = None
+
+
+def pagina_inicial(pular_login: bool = False) -> str:
+    """
+        Página inicial do fluxo
+        -----------------------
+        Retorna a URL da tela de login ou, pulando o login, a URL da tela de cadastro no mesmo endereço.
+
+        Parâmetro: Pular o login (opcional).
+    """
+    return urljoin(url, PAGINA_CADASTRO) if pular_login else url
+
+
+def obter_navegador(perfil=None, pular_login: bool = False):
+    """
+        Inicialização do navegador
+        --------------------------
+        Retorna o navegador da execução, criando-o apenas no primeiro uso.
+        Importar este módulo não instala o driver nem abre o Chrome: o custo de inicialização
+        só é pago quando o navegador é realmente necessário.
+
+        Parâmetros: Perfil do navegador (opcional; ver Navegador.PERFIS), abrir direto na tela de cadastro (opcional).
+                    Ambos só são usados na criação do navegador.
+    """
+    global _navegador
+    if _navegador is None:
+        _navegador = criar_navegador(perfil)
+        with medir("navegacao"):
+            _navegador.get(pagina_inicial(pular_login))
+    return _navegador
+
+
+def encerrar_navegador():
+    """
+        Encerramento do navegador
+        -------------------------
+        Fecha o navegador criado por obter_navegador(), caso exista. Um navegador que já deixou de responder é apenas
+        descartado, para que a próxima chamada a obter_navegador() abra um novo.
+
+        Não exige parâmetros.
+    """
+    global _navegador
+    if _navegador is not None:
+        try:
+            _navegador.quit()
+        except WebDriverException:
+            pass
+        finally:
+            _navegador = None
 
 
 """
@@ -114,29 +165,7 @@ def preencher_login(navegador, email_login: str):
 
         Parâmetros: Navegador, e-mail do usuário.
     """
-    try:
-        if not email_login:
-            raise ValueError("O campo de e-mail não pode estar vazio.")
-        
-        email_pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}$'
-
-        if not re.match(email_pattern, email_login):
-            raise ValueError("Formato inválido. Exemplo de uso: usuario@email.com")
-    
-        input_email = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'email')))
-        input_email.send_keys(email_login)
-        print(f"{Fore.GREEN}\nE-mail{Style.RESET_ALL} '{email_login}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o e-mail:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "login", email_login)
 
 
 def confirmar_login(navegador):
@@ -147,18 +176,7 @@ def confirmar_login(navegador):
 
         Parâmetro: Navegador.
     """
-    try:
-        enviar = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.ID, 'enterimg')))
-        enviar.click()
-        print(Fore.GREEN + "\nLogin executado com sucesso.")
-
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao executar o clique:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "confirmar_login")
 
 
 """
@@ -175,24 +193,7 @@ def preencher_nome(navegador, nome: str):
 
         Parâmetros: Navegador, nome do usuário.
     """
-    try:
-        if not nome:
-            raise ValueError("O campo de nome não pode estar vazio.")
-
-        barra_nome = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[1]/div[1]/input')))
-        barra_nome.send_keys(nome)
-        print(f"{Fore.GREEN}\nNome{Style.RESET_ALL} '{nome}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o nome:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "nome", nome)
 
 
 def preencher_sobrenome(navegador, sobrenome: str):
@@ -204,24 +205,7 @@ def preencher_sobrenome(navegador, sobrenome: str):
 
         Parâmetros: Navegador, sobrenome do usuário.
     """
-    try: 
-        if not sobrenome:
-            raise ValueError("O campo de sobrenome não pode estar vazio.")
-
-        barra_sobrenome = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[1]/div[2]/input')))
-        barra_sobrenome.send_keys(sobrenome)
-        print(f"{Fore.GREEN}\nSobrenome{Style.RESET_ALL} '{sobrenome}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o sobrenome:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "sobrenome", sobrenome)
 
 
 def preencher_endereco(navegador, endereco: str):
@@ -233,24 +217,7 @@ def preencher_endereco(navegador, endereco: str):
 
         Parâmetros: Navegador, endereço do usuário.
     """
-    try:
-        if not endereco:
-            raise ValueError("O campo de endereço não pode estar vazio.")    
-    
-        barra_endereco = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[2]/div/textarea')))
-        barra_endereco.send_keys(endereco)
-        print(f"{Fore.GREEN}\nEndereço{Style.RESET_ALL} '{endereco}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o endereço:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "endereco", endereco)
 
 
 def preencher_email(navegador, email: str):
@@ -264,29 +231,7 @@ def preencher_email(navegador, email: str):
 
         Parâmetros: Navegador, e-mail do usuário.
     """
-    try:
-        if not email:
-            raise ValueError("O campo de e-mail não pode estar vazio.")
-    
-        email_pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z]{2,}$'
-
-        if not re.match(email_pattern, email_login):
-            raise ValueError("\nFormato inválido. Exemplo de uso: 'usuario@email.com'")
-
-        barra_email = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="eid"]/input')))
-        barra_email.send_keys(email)
-        print(f"{Fore.GREEN}\nE-mail{Style.RESET_ALL} '{email}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o e-mail:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "email", email)
 
 
 def preencher_telefone(navegador, telefone: str):
@@ -298,29 +243,7 @@ def preencher_telefone(navegador, telefone: str):
 
         Parâmetros: Navegador, número de telefone do usuário.
     """
-    try:
-        if not telefone:
-            raise ValueError("O campo de telefone não pode estar vazio.")
-        
-        telefone_pattern = r'^\d{10}$'
-
-        if not re.match(telefone_pattern, telefone):
-            raise ValueError("\nFormato inválido. Insira 10 dígitos.")
-
-        barra_telefone = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[4]/div/input')))
-        barra_telefone.send_keys(telefone)
-        print(f"{Fore.GREEN}\nTelefone{Style.RESET_ALL} '{telefone}' {Fore.GREEN}inserido com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o telefone:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "telefone", telefone)
 
 
 def selecionar_genero(navegador, genero: str):
@@ -334,31 +257,7 @@ def selecionar_genero(navegador, genero: str):
             
         Parâmetros: Navegador, gênero do usuário.
     """
-    try:
-        if not genero:
-            raise ValueError("O campo de gênero não pode estar vazio.")
-
-        if genero == "Feminino":
-            feminino = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.XPATH, "//input[@type='radio' and @value='FeMale']")))
-            feminino.click()
-            print(f"{Fore.GREEN}\nGênero{Style.RESET_ALL} '{genero}' {Fore.GREEN}selecionado com sucesso.")
-        elif genero == "Masculino":
-            masculino = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.XPATH, "//input[@type='radio' and @value='Male']")))
-            masculino.click()
-            print(f"{Fore.GREEN}\nGênero{Style.RESET_ALL} '{genero}' {Fore.GREEN}selecionado com sucesso.")
-        else:
-            raise ValueError(f"Gênero '{genero}' inválido. Selecione 'Feminino' ou 'Masculino'.")
-        
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o gênero:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "genero", genero)
 
 
 def selecionar_hobbie(navegador, hobbies: list[str]):
@@ -370,33 +269,7 @@ def selecionar_hobbie(navegador, hobbies: list[str]):
             
         Parâmetros: Navegador, hobbies do usuário.
     """
-    lista_hobbies = ["Cricket", "Movies", "Hockey"]
-    try:
-        if not hobbies:
-            raise ValueError("O campo de hobbies não pode estar vazio.")
-
-        for hobbie in hobbies:
-            if hobbie not in lista_hobbies:
-                raise ValueError(f"O hobbie '{hobbie}' não é válido.")
-                
-            hobby_checkbox = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.XPATH, f"//input[@type='checkbox' and @value='{hobbie}']")))
-
-            if not hobby_checkbox.is_selected():
-                hobby_checkbox.click()
-                print(f"{Fore.GREEN}\nHobbie{Style.RESET_ALL} '{hobbie}' {Fore.GREEN}selecionado com sucesso.")
-            else:
-                raise ValueError(f"O hobbie '{hobbie}' já estava selecionado.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o hobbie:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "hobbies", hobbies)
 
 
 def selecionar_idiomas(navegador, idiomas: list[str]):
@@ -408,35 +281,7 @@ def selecionar_idiomas(navegador, idiomas: list[str]):
         
         Parâmetros: Navegador, idiomas do usuário.
     """
-    lista_idiomas = ['Arabic', 'Bulgarian', 'Catalan', 'Croatian', 'Czech', 'Danish', 'Dutch', 'English', 'Estonian', 'Filipino', 
-                     'Finnish', 'French', 'German', 'Greek','Hebrew', 'Hindi', 'Hungarian', 'Icelandic', 'Indonesian', 'Italian', 
-                     'Japanese', 'Korean', 'Latvian', 'Lithuanian', 'Malay', 'Norwegian', 'Persian', 'Polish', 'Portuguese', 'Romanian', 
-                     'Russian', 'Serbian', 'Spanish', 'Swedish', 'Thai', 'Turkish', 'Ukrainian', 'Urdu', 'Vietnamese']
-    try:
-        idiomas_invalidos = [idioma for idioma in idiomas if idioma not in lista_idiomas]
-
-        if idiomas_invalidos:
-            raise ValueError(f"Idiomas inválidos: {', '.join(idiomas_invalidos)}.")
-
-        navegador.find_element(By.XPATH, '//*[@id="msdd"]').click()
-        WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[7]/div/multi-select/div[2]/ul')))
-
-        for idioma in idiomas:
-            opcao = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.LINK_TEXT, idioma)))
-            navegador.execute_script("arguments[0].scrollIntoView()", opcao)
-            opcao.click()
-            print(f"{Fore.GREEN}\nIdioma{Style.RESET_ALL} '{idioma}' {Fore.GREEN}selecionado com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o idioma:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "idiomas", idiomas)
 
 
 def selecionar_skill(navegador, skill: str):
@@ -448,37 +293,7 @@ def selecionar_skill(navegador, skill: str):
 
         Parâmetros: Navegador, skills do usuário.
     """
-    lista_skills = ['Adobe InDesign', 'Adobe Photoshop', 'Analytics', 'Android', 'APIs', 'Art Design', 'AutoCAD', 'Backup Management', 'C', 'C++', 'Certifications', 
-                    'Client Server', 'Client Support', 'Configuration', 'Content Management', 'Content Management Systems (CMS)', 'Corel Draw', 'Corel Word Perfect', 
-                    'CSS', 'Data Analytics', 'Desktop Publishing', 'Design', 'Diagnostics', 'Documentation', 'End User Support', 'Email', 'Engineering', 'Excel', 
-                    'FileMaker Pro', 'Fortran HTML', 'Implementation', 'Installation', 'Internet', 'iOS', 'iPhone', 'Linux', 'Java', 'JavaScript', 'Mac', 'Matlab', 
-                    'Maya', 'Micrisoft Excel', 'Microsoft', 'Microsoft Office', 'Microsoft Outlook', 'Microsoft Publisher', 'Microsoft Word', 'Microsoft Visual', 
-                    'Mobile', 'MySQL', 'Networks', 'Open Source Software', 'Oracle', 'Perl', 'PHP', 'Presentations', 'Processing', 'Programming', 'PT Modeler', 
-                    'Python', 'QuickBooks', 'Ruby', 'Shade', 'Software', 'Spreadsheet', 'SQL', 'Support', 'System Administration', 'Tech Support', 'Troubleshooting', 
-                    'Unix', 'UI / UX', 'Page Design', 'Windows', 'Word Processing', 'XML', 'XHTML']
-
-    try:
-        if not skill:
-            raise ValueError("O campo de skill não pode estar vazio.")
-        
-        if skill not in lista_skills:
-            raise ValueError(f"A skill '{skill}' não é válida.")
-
-        skills = WebDriverWait(navegador, 10).until(EC.presence_of_element_located((By.ID, "Skills")))
-        select = Select(skills)
-        select.select_by_value(skill)
-        print(f"{Fore.GREEN}\nSkill{Style.RESET_ALL} '{skill}' {Fore.GREEN}selecionada com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir a skill:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "skill", skill)
 
 
 def selecionar_pais(navegador, pais: str):
@@ -491,31 +306,7 @@ def selecionar_pais(navegador, pais: str):
 
         Parâmetros: Navegador, país do usuário.
     """
-    try:
-        if not pais:
-            raise ValueError("O campo de país não pode estar vazio.")
-    
-        WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, "countries")))
-        navegador.execute_script(
-            "var select = document.getElementById('countries');"
-            "var option = document.createElement('option');"
-            f"option.text = '{pais}';"
-            f"option.value = '{pais}';"
-            "select.add(option);"
-            f"select.value = '{pais}';"
-        )
-        print(f"{Fore.GREEN}\nPaís{Style.RESET_ALL} '{pais}' {Fore.GREEN}selecionado com sucesso.")
-    
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir o país:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "pais", pais)
 
 
 def preencher_data(navegador, ano: int, mes: int, dia: int):
@@ -531,42 +322,7 @@ def preencher_data(navegador, ano: int, mes: int, dia: int):
 
         Parâmetros: Navegador, ano, mês e dia do nascimento do usuário.
     """
-    try: 
-        if not (ano, mes, dia):
-            raise ValueError("Os campos de ano, mês e dia não podem estar vazios.")
-        
-        if not (1916 <= ano <= 2015):
-            raise ValueError("Insira um ano entre 1916 e 2015.")
-        if not (1 <= mes <= 12):
-            raise ValueError("Insira um mês entre 1 e 12.")
-        if not (1 <= dia <= 31):
-            raise ValueError("Insira um dia entre 1 e 31.")
-        
-        navegador.execute_script("document.getElementById('yearbox').click();")
-        barra_ano = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'yearbox')))
-        barra_ano.send_keys(str(ano), Keys.RETURN)
-
-        barra_mes = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.XPATH, '//*[@id="basicBootstrapForm"]/div[11]/div[2]/select')))
-        select = Select(barra_mes)
-        meses = {1: "January", 2: "February", 3: "March", 4: "April", 5: "May", 6: "June", 7: "July", 8: "August", 9: "September", 10: "October", 11: "November", 12: "December"}
-        select.select_by_visible_text(meses[mes])
-
-        barra_dia = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'daybox')))
-        select = Select(barra_dia)
-        select.select_by_value(str(dia))
-
-        print(f"{Fore.GREEN}\nData{Style.RESET_ALL} '{dia}/{mes}/{ano}' {Fore.GREEN}inserida com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir a data:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "data", (ano, mes, dia))
 
 
 def inserir_imagem(navegador, imagem: str):
@@ -578,21 +334,7 @@ def inserir_imagem(navegador, imagem: str):
 
         Parâmetros: Navegador, imagem do usuário.
     """
-    try:
-        if not imagem:
-            return
-
-        botao_imagem = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'imagesrc')))
-        caminho_imagem = f"{imagem}"
-        botao_imagem.send_keys(caminho_imagem)
-        print(Fore.GREEN + "\nImagem inserida com sucesso.")
-
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir a imagem:{Style.RESET_ALL} {e}")
-    print("_" * 60)
+    return executar_campo(navegador, "imagem", imagem)
 
 
 def preencher_senha(navegador, senha: str):
@@ -604,32 +346,7 @@ def preencher_senha(navegador, senha: str):
 
         Parâmetros: Navegador, senha do usuário.
     """
-    try:
-        if not senha:
-            raise ValueError("O campo de senha não pode estar vazio.")
-        
-        senha_pattern = r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)[A-Za-z\d]{8,}$'
-
-        if not re.match(senha_pattern, senha):
-            raise ValueError("Formato inválido. A senha deve conter 8 caracteres incluindo ao menos uma letra minúscula, uma maiúscula e um número.")
-        
-        barra_senha = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'firstpassword')))
-        barra_senha.send_keys(senha)
-
-        barra_confirmação = WebDriverWait(navegador, 10).until(EC.visibility_of_element_located((By.ID, 'secondpassword')))
-        barra_confirmação.send_keys(senha)
-        print(Fore.GREEN + "\nSenha inserida com sucesso.")
-
-    except ValueError as e:
-        print(f"{Fore.RED}\nErro de entrada:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao inserir a senha:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "senha", senha)
 
 
 def confirmar_cadastro(navegador):
@@ -640,137 +357,143 @@ def confirmar_cadastro(navegador):
 
         Parâmetro: Navegador.
     """
-    try:
-        botao = WebDriverWait(navegador, 10).until(EC.element_to_be_clickable((By.ID, 'submitbtn')))
-        botao.click()
-        print(Fore.GREEN + "\n\n\nFormulário preenchido com sucesso.")
-
-    except NoSuchElementException as e:
-        print(f"{Fore.RED}\nErro ao localizar o elemento:{Style.RESET_ALL} {e}")
-        sys.exit()
-    except Exception as e:
-        print(f"{Fore.RED}\nErro ao executar o clique:{Style.RESET_ALL} {e}")
-        sys.exit()
-    print("_" * 60)
+    return executar_campo(navegador, "cadastro")
+
+
+def preencher_formulario(navegador, registro: dict, pular_login: bool = False) -> list:
+    """
+        Fluxo completo
+        --------------
+        Executa o login e preenche o formulário de cadastro com os dados de um registro.
+        As chaves do registro têm os mesmos nomes das variáveis de entrada listadas nas instruções de uso
+        ('email_login', 'nome', 'sobrenome', ..., 'senha'). A chave 'imagem' é opcional.
+        O fluxo é interrompido no primeiro campo com falha. Retorna a lista de ResultadoCampo dos campos executados.
+
+        Cada tela é medida como uma etapa ('tela_login' e 'tela_cadastro'). Pulando o login, o navegador já deve estar
+        na tela de cadastro (ver pagina_inicial()) e a chave 'email_login' é dispensada.
+
+        Parâmetros: Navegador, registro com os dados do usuário, pular o login (opcional).
+    """
+    resultados = []
+    if not pular_login:
+        inicio = time.perf_counter()
+        resultados = notificar_etapa("tela_login", inicio, preencher_registro(navegador, registro, CAMPOS_LOGIN))
+        if not all(resultado.sucesso for resultado in resultados):
+            return resultados
+    inicio = time.perf_counter()
+    return resultados + notificar_etapa("tela_cadastro", inicio, preencher_registro(navegador, registro, CAMPOS_CADASTRO))
+
+
+async def preencher_formulario_async(navegador, registro: dict, pular_login: bool = False) -> list:
+    """
+        Fluxo completo (assíncrono)
+        ---------------------------
+        Versão aguardável de preencher_formulario(), em que cada campo (login, nome, ..., cadastro) é uma etapa aguardada.
+        Usada pela execução assíncrona do módulo Lote.
+
+        Parâmetros: Navegador, registro com os dados do usuário, pular o login (opcional).
+    """
+    resultados = []
+    if not pular_login:
+        inicio = time.perf_counter()
+        resultados = notificar_etapa("tela_login", inicio, await preencher_registro_async(navegador, registro, CAMPOS_LOGIN))
+        if not all(resultado.sucesso for resultado in resultados):
+            return resultados
+    inicio = time.perf_counter()
+    return resultados + notificar_etapa("tela_cadastro", inicio, await preencher_registro_async(navegador, registro, CAMPOS_CADASTRO))
 
 
 """
     INSTRUÇÕES DE USO
     -----------------
     Inserir um tipo de valor para cada variável criada.
-    Para cada função, inserir a variável como argumento.
+    Ao executar o arquivo, a função main() abre o navegador e chama cada função com a variável correspondente como argumento.
+    Importar o módulo não abre o navegador: as funções podem ser usadas individualmente, recebendo o navegador como parâmetro.
+
+        Exemplo de uso:
+
+            from TesteAutomatizado import obter_navegador, preencher_login
+
+            navegador = obter_navegador()
+            preencher_login(navegador, "usuario@email.com")
 """
 
 """
     Exemplo de uso:
     ---------------
     email_login = "usuario@email.com" -> tipo string (str)
-    preencher_login(navegador, email_login)
 """
 email_login = ""
-preencher_login(navegador, email_login)
-confirmar_login(navegador)
-
 
 """
     Exemplo de uso:
     ---------------
     nome = "Nome do usuário" -> tipo string (str)
-    preencher_nome(navegador, nome)
 """
 nome = ""
-preencher_nome(navegador, nome) 
-
 
 """
     Exemplo de uso:
     ---------------
     sobrenome = "Sobrenome do usuário" -> tipo string (str)
-    preencher_sobrenome(navegador, sobrenome)
 """
 sobrenome = ""
-preencher_sobrenome(navegador, sobrenome) 
-
 
 """
     Exemplo de uso:
     ---------------
     endereco = "Endereço do usuário" -> tipo string (str)
-    preencher_endereco(navegador, endereco)
 """
 endereco = ""
-preencher_endereco(navegador, endereco) 
-
 
 """
     Exemplo de uso:
     ---------------
     email = "usuario@email.com" -> tipo string (str)
-    preencher_email(navegador, email)
 """
 email = ""
-preencher_email(navegador, email) 
-
 
 """
     Exemplo de uso:
     ---------------
     telefone = "0123456789" -> tipo string (str)
-    preencher_telefone(navegador, telefone)
 """
 telefone = ""
-preencher_telefone(navegador, telefone) 
-
 
 """
     Exemplo de uso:
     ---------------
     genero = "Gênero do usuário" -> tipo string (str)
-    preencher_genero(navegador, genero)
 """
 genero = ""
-selecionar_genero(navegador, genero) 
-
 
 """
     Exemplo de uso:
     ---------------
-    hobbie = ["Hobbie do usuário"] -> tipo lista (list)
-    selecionar_hobbie(navegador, hobbie)
+    hobbies = ["Hobbie do usuário"] -> tipo lista (list)
 """
 hobbies = [""]
-selecionar_hobbie(navegador, hobbies)
-
 
 """
     Exemplo de uso:
     ---------------
     idiomas = ["Idiomas do usuário"] -> tipo lista (list)
-    selecionar_idiomas(navegador, idiomas)
 """
 idiomas = [""]
-selecionar_idiomas(navegador, idiomas)
-
 
 """
     Exemplo de uso:
     ---------------
     skill = "Skill do usuário" -> tipo string (str)
-    selecionar_skill(navegador, skill)
 """
 skill = ""
-selecionar_skill(navegador, skill) 
-
 
 """
     Exemplo de uso:
     ---------------
     pais = "País do usuário" -> tipo string (str)
-    selecionar_pais(navegador, pais)
 """
 pais = ""
-selecionar_pais(navegador, pais)
-
 
 """
     Exemplo de uso:
@@ -778,40 +501,86 @@ selecionar_pais(navegador, pais)
     ano = Ano de nascimento do usuário -> tipo inteiro (int)
     mes = Mês de nascimento do usuário -> tipo inteiro (int)
     dia = Dia de nascimento do usuário -> tipo inteiro (int)
-    preencher_data(navegador, ano, mes, dia)
 """
 ano = None
 mes = None
 dia = None
-preencher_data(navegador, ano, mes, dia)
-
 
 """
     Exemplo de uso:
     ---------------
     imagem = "C:\\Users\\usuario\\pasta\\imagem.jpg" -> tipo string (str)
-    inserir_imagem(navegador, imagem)
 """
 imagem = ""
-inserir_imagem(navegador, imagem)
-
 
 """
     Exemplo de uso:
     ---------------
     senha = "Senha123" -> tipo string (str)
-    preencher_senha(navegador, senha)
 """
 senha = ""
-preencher_senha(navegador, senha)
-confirmar_cadastro(navegador)
+
+"""
+    Exemplo de uso:
+    ---------------
+    pular_login = True -> abre direto a tela de cadastro, sem preencher a tela de login -> tipo booleano (bool)
+"""
+pular_login = False
+
+
+def main():
+    """
+        Execução do teste
+        -----------------
+        Abre o navegador e preenche o formulário completo com as variáveis definidas acima.
+        Retorna o código de saída: 0 sem falhas, 1 com algum campo com falha.
+
+        Não exige parâmetros.
+    """
+    navegador = obter_navegador(pular_login=pular_login)
+
+    print(f"\n\nTeste Automatizado - {Fore.GREEN}Cotefácil\n\n")
+    print("_" * 60)
+
+    resultados = preencher_formulario(navegador, {
+        "email_login": email_login, "nome": nome, "sobrenome": sobrenome, "endereco": endereco,
+        "email": email, "telefone": telefone, "genero": genero, "hobbies": hobbies,
+        "idiomas": idiomas, "skill": skill, "pais": pais, "ano": ano, "mes": mes, "dia": dia,
+        "imagem": imagem, "senha": senha,
+    }, pular_login=pular_login)
+
+    falhas = [r for r in resultados if not r.sucesso]
+    for falha in falhas:
+        print(f"{Fore.RED}\nCampo '{falha.campo}' com falha:{Style.RESET_ALL} {falha.erro}")
+
+    """
+        Para encerrar automaticamente, usar:
+
+            encerrar_navegador()
+
+        Para encerrar manualmente, clicar no botão 'Enter' no input a seguir.
+        Sem um terminal interativo (por exemplo, em um pipeline), o navegador é encerrado sem aguardar a tecla.
+    """
+    if sys.stdin is not None and sys.stdin.isatty():
+        print(input("\nPara encerrar o programa manualmente, aperte a tecla 'Enter'."))
+    encerrar_navegador()
+    return 1 if falhas else 0
 
 
 """
-    Para encerrar automaticamente, usar:
+    LINHA DE COMANDO
+    ----------------
+    Sem argumentos, o programa executa main() com as variáveis acima.
+    Com argumentos, a execução é configurada pela linha de comando (ver Lote.executar_cli()), sem editar as variáveis
+    e sem aguardar nenhuma tecla; o código de saída é 1 quando algum registro falha.
 
-        navegador.quit()
+        Exemplo de uso:
 
-    Para encerrar manualmente, clicar no botão 'Enter' no input a seguir.
+            python -m TesteAutomatizado run --input registros.jsonl --workers 8 --headless --mode fast --report metricas.json
+            python -m TesteAutomatizado validate --input registros.jsonl
 """
-print(input("\nPara encerrar o programa manualmente, aperte a tecla 'Enter'."))
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from Lote import executar_cli
+        sys.exit(executar_cli(sys.argv[1:]))
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""
+    Validação - COTEFÁCIL
+    ---------------------
+    Etapa de validação dos registros, executada antes de qualquer acesso ao navegador.
+
+    Cada registro é verificado com os validadores do esquema do módulo Formulario, que já são compilados uma única vez
+    (expressões regulares) e usam frozenset para as listas de opções. Diferente das funções do formulário, que param
+    no primeiro erro, aqui todos os erros de todos os registros são reunidos, para que o arquivo inteiro possa ser
+    corrigido de uma só vez. Nas execuções em lote, apenas os registros válidos chegam aos navegadores.
+
+
+    Exemplo de uso:
+    ---------------
+        python Validacao.py registros.jsonl
+        python Validacao.py registros.csv --validos validos.jsonl
+"""
+
+
+"""
+    BIBLIOTECAS
+    -----------
+"""
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from colorama import Fore, Style
+from Formulario import CAMPOS_CADASTRO, ESQUEMA, validar_campo
+from Resultado import ResultadoCampo, ResultadoRegistro
+
+CAMPOS_VALIDADOS = tuple(campo for campo in ESQUEMA if campo.chaves)
+CAMPOS_VALIDADOS_CADASTRO = tuple(campo for campo in CAMPOS_CADASTRO if campo.chaves)
+
+
+"""
+    VALIDAÇÃO
+    ---------
+"""
+
+@dataclass
+class LinhaInvalida:
+    """
+        Linha inválida
+        --------------
+        Linha do arquivo de registros que não pôde ser lida como registro (por exemplo, um JSON malformado ou que não
+        é um objeto). É gerada no lugar do registro por Lote.ler_registros() e tratada como registro inválido.
+    """
+    linha: int
+    erro: str
+
+
+def erros_registro(registro: dict, campos=CAMPOS_VALIDADOS) -> list:
+    """
+        Erros do registro
+        -----------------
+        Aplica a validação dos campos e retorna a lista de (campo, mensagem) dos campos inválidos.
+        Uma lista vazia indica um registro válido.
+
+        Parâmetros: Registro com os dados do usuário, campos validados (opcional; por padrão, todos os campos com valor).
+    """
+    erros = []
+    for campo in campos:
+        try:
+            validar_campo(campo, campo.valor(registro))
+        except (ValueError, TypeError) as e:
+            erros.append((campo.nome, str(e)))
+    return erros
+
+
+def resultado_invalido(indice: int, erros: list) -> ResultadoRegistro:
+    """
+        Resultado de registro inválido
+        ------------------------------
+        Monta o ResultadoRegistro de um registro recusado na validação, com uma falha por campo inválido e tempo zero.
+        A mensagem de erro do registro reúne os erros de todos os campos.
+
+        Parâmetros: Índice do registro, lista de (campo, mensagem).
+    """
+    return ResultadoRegistro(
+        indice,
+        [ResultadoCampo(campo, "falha", 0.0, mensagem) for campo, mensagem in erros],
+        erro="; ".join(f"{campo}: {mensagem}" for campo, mensagem in erros),
+    )
+
+
+def separar_registros(registros, campos=CAMPOS_VALIDADOS):
+    """
+        Separação dos registros
+        -----------------------
+        Gera (índice, registro, erros) para cada registro, na ordem de leitura.
+        Registros válidos têm a lista de erros vazia; uma LinhaInvalida tem um único erro, com o número da linha.
+
+        Parâmetros: Sequência de registros (por exemplo, Lote.ler_registros()), campos validados (opcional).
+    """
+    for indice, registro in enumerate(registros):
+        if isinstance(registro, LinhaInvalida):
+            yield indice, registro, erros_linha(registro)
+        else:
+            yield indice, registro, erros_registro(registro, campos)
+
+
+def erros_linha(linha: LinhaInvalida) -> list:
+    """
+        Erros da linha
+        --------------
+        Retorna a lista de (campo, mensagem) de uma linha que não pôde ser lida, no mesmo formato de erros_registro().
+
+        Parâmetro: LinhaInvalida.
+    """
+    return [("arquivo", f"linha {linha.linha}: {linha.erro}")]
+
+
+def validar_arquivo(entrada: str, validos: str = None, campos=CAMPOS_VALIDADOS) -> list:
+    """
+        Validação do arquivo
+        --------------------
+        Valida todos os registros do arquivo e retorna a lista de (índice, erros) dos registros inválidos.
+        Com um arquivo de válidos, os registros sem erros são gravados nele em JSONL, prontos para a execução em lote.
+
+        Parâmetros: Arquivo de registros (.csv ou .jsonl), arquivo de registros válidos (opcional), campos validados (opcional).
+    """
+    from Lote import ler_registros
+
+    invalidos = []
+    arquivo_validos = open(validos, "w", encoding="utf-8") if validos else None
+    try:
+        for indice, registro, erros in separar_registros(ler_registros(entrada), campos):
+            if erros:
+                invalidos.append((indice, erros))
+            elif arquivo_validos:
+                arquivo_validos.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    finally:
+        if arquivo_validos:
+            arquivo_validos.close()
+    return invalidos
+
+
+def exibir_invalidos(invalidos: list):
+    """
+        Exibição dos registros inválidos
+        --------------------------------
+        Exibe cada registro inválido com todos os seus erros.
+
+        Parâmetro: Lista de (índice, erros) retornada por validar_arquivo().
+    """
+    for indice, erros in invalidos:
+        print(f"{Fore.RED}\nRegistro {indice}:{Style.RESET_ALL}")
+        for campo, mensagem in erros:
+            print(f"    {campo}: {mensagem}")
+    print(f"\n{Fore.RED if invalidos else Fore.GREEN}Registros inválidos:{Style.RESET_ALL} {len(invalidos)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Validação dos registros antes da execução no navegador.")
+    parser.add_argument("entrada", help="arquivo de registros (.csv ou .jsonl)")
+    parser.add_argument("--validos", help="arquivo JSONL que recebe apenas os registros válidos")
+    args = parser.parse_args()
+
+    invalidos = validar_arquivo(args.entrada, args.validos)
+    exibir_invalidos(invalidos)
+    sys.exit(1 if invalidos else 0)
@@ -0,0 +1,158 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def registro_valido():
+    return {
+        "email_login": "ana@email.com", "nome": "Ana", "sobrenome": "Silva", "endereco": "Rua 1",
+        "email": "ana@email.com", "telefone": "0123456789", "genero": "Feminino", "hobbies": ["Movies"],
+        "idiomas": ["English"], "skill": "Python", "pais": "Brasil", "ano": 1990, "mes": 5, "dia": 3,
+        "senha": "Senha123",
+    }
+
+
+class NavegadorFalso:
+    """
+        Navegador falso
+        ---------------
+        Substitui o Chrome nos testes do pool e das execuções em lote: registra as páginas abertas, as limpezas e o
+        encerramento, e deixa de responder quando 'ativo' é False.
+    """
+
+    def __init__(self):
+        self.paginas = []
+        self.scripts = []
+        self.limpezas = 0
+        self.ativo = True
+        self.encerrado = False
+        self.memoria = None
+
+    @property
+    def title(self):
+        if not self.ativo:
+            from selenium.common.exceptions import WebDriverException
+            raise WebDriverException("navegador sem resposta")
+        return "Register"
+
+    def get(self, url):
+        self.paginas.append(url)
+
+    def execute_script(self, script, *argumentos):
+        self.scripts.append(script)
+        return self.memoria if "usedJSHeapSize" in script else None
+
+    def delete_all_cookies(self):
+        self.limpezas += 1
+
+    def quit(self):
+        self.encerrado = True
+
+
+@pytest.fixture
+def navegadores(monkeypatch):
+    """Substitui Sessoes.criar_navegador e retorna a lista dos navegadores falsos criados, na ordem de criação."""
+    import Sessoes
+
+    criados = []
+
+    def criar_navegador(*args, **kwargs):
+        criados.append(NavegadorFalso())
+        return criados[-1]
+
+    monkeypatch.setattr(Sessoes, "criar_navegador", criar_navegador)
+    return criados
+
+
+class ElementoFalso:
+    """
+        Elemento falso
+        --------------
+        Registra os textos digitados e os cliques. Um elemento 'select' guarda o valor da opção escolhida; um elemento
+        'removido' deixa de existir na página e lança StaleElementReferenceException em qualquer ação.
+    """
+
+    def __init__(self, tag_name="input", selecionado=False):
+        self.tag_name = tag_name
+        self.textos = []
+        self.cliques = 0
+        self.selecionado = selecionado
+        self.valor = None
+        self.removido = False
+
+    def _verificar(self):
+        if self.removido:
+            from selenium.common.exceptions import StaleElementReferenceException
+            raise StaleElementReferenceException("elemento removido da página")
+
+    def is_displayed(self):
+        self._verificar()
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def is_selected(self):
+        return self.selecionado
+
+    def click(self):
+        self._verificar()
+        self.cliques += 1
+        self.selecionado = True
+
+    def send_keys(self, *textos):
+        self._verificar()
+        self.textos.append("".join(textos))
+
+    def get_dom_attribute(self, nome):
+        return None
+
+    def value_of_css_property(self, nome):
+        return "visible"
+
+    def find_elements(self, by, expressao):
+        import re
+        opcao = ElementoFalso("option")
+        opcao.click = lambda: setattr(self, "valor", re.findall(r'"([^"]*)"', expressao)[-1])
+        return [opcao]
+
+
+class PaginaFalsa:
+    """
+        Página falsa
+        ------------
+        Navegador falso com elementos localizáveis: find_element() conta as consultas e responde pelos elementos
+        adicionados; execute_script() responde à consulta única do módulo Localizadores e registra os demais scripts.
+    """
+
+    def __init__(self):
+        self.elementos = {}
+        self.consultas = []
+        self.scripts = []
+
+    def adicionar(self, localizador: tuple, tag_name="input", selecionado=False):
+        self.elementos[localizador] = ElementoFalso(tag_name, selecionado)
+        return self.elementos[localizador]
+
+    def find_element(self, by, valor):
+        from selenium.common.exceptions import NoSuchElementException
+        self.consultas.append((by, valor))
+        if (by, valor) not in self.elementos:
+            raise NoSuchElementException(f"{by}={valor}")
+        return self.elementos[(by, valor)]
+
+    def execute_script(self, script, *argumentos):
+        from Localizadores import SCRIPT_LOCALIZACAO, localizador_css
+        if script == SCRIPT_LOCALIZACAO:
+            return [self.elementos.get(localizador_css(seletor)) for seletor in argumentos[0]]
+        self.scripts.append((script, argumentos))
+        return None
+
+
+@pytest.fixture
+def pagina():
+    return PaginaFalsa()
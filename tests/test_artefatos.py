@@ -0,0 +1,96 @@
+import json
+import os
+import threading
+import time
+import zipfile
+
+import Artefatos
+from Artefatos import ColetorArtefatos, capturar_falha, coletar_artefatos
+from Resultado import ResultadoRegistro
+
+
+class TelaFalsa:
+    """Navegador falso que só responde às capturas; 'capturas' conta as imagens da tela tiradas."""
+
+    def __init__(self, tela: bytes = b"png"):
+        self.tela = tela
+        self.capturas = 0
+        self.current_url = "http://127.0.0.1/Register.html"
+
+    def get_screenshot_as_png(self):
+        self.capturas += 1
+        return self.tela
+
+    @property
+    def page_source(self):
+        raise RuntimeError("navegador sem resposta")
+
+
+class ColetorRetido(ColetorArtefatos):
+    """Coletor cuja gravação só começa quando 'liberar' é sinalizado."""
+
+    def __init__(self, *args, **kwargs):
+        self.liberar = threading.Event()
+        super().__init__(*args, **kwargs)
+
+    def _gravar(self):
+        self.liberar.wait(10)
+        super()._gravar()
+
+
+def falha(indice: int) -> ResultadoRegistro:
+    return ResultadoRegistro(indice, erro="Erro ao carregar a página inicial.")
+
+
+def test_falha_gravada_com_os_erros_de_captura(tmp_path):
+    coletor = ColetorArtefatos(str(tmp_path))
+    coletor.capturar(TelaFalsa(), falha(3))
+    coletor.encerrar()
+
+    with zipfile.ZipFile(tmp_path / "registro-3.zip") as arquivo_zip:
+        assert sorted(arquivo_zip.namelist()) == ["etapas.json", "tela.png", "url.txt"]
+        etapas = json.loads(arquivo_zip.read("etapas.json"))
+    assert etapas["erro"] == "Erro ao carregar a página inicial."
+    assert "pagina.html" in etapas["erros_captura"]
+    assert coletor.gravados == 1 and coletor.descartados == 0
+
+
+def test_fila_cheia_descarta_sem_capturar(tmp_path):
+    coletor, navegador = ColetorRetido(str(tmp_path), fila_maxima=2), TelaFalsa()
+    for indice in range(4):
+        coletor.capturar(navegador, falha(indice))
+    assert navegador.capturas == 2 and coletor.descartados == 2
+
+    coletor.liberar.set()
+    coletor.encerrar()
+    assert coletor.gravados == 2
+    assert sorted(os.listdir(tmp_path)) == ["registro-0.zip", "registro-1.zip"]
+
+
+def test_limite_de_bytes_conta_gravados_e_pendentes(tmp_path):
+    coletor, navegador = ColetorRetido(str(tmp_path), limite_mb=1500 / 2**20), TelaFalsa(os.urandom(800))
+    coletor.capturar(navegador, falha(0))
+    coletor.capturar(navegador, falha(1))
+    assert coletor.descartados == 1
+
+    coletor.liberar.set()
+    for _ in range(200):
+        if coletor.gravados:
+            break
+        time.sleep(0.01)
+    coletor.capturar(navegador, falha(2))
+    coletor.encerrar()
+    assert (coletor.gravados, coletor.descartados) == (1, 2)
+    assert os.listdir(tmp_path) == ["registro-0.zip"]
+
+
+def test_captura_apenas_com_coletor_ativo_e_registro_com_falha(tmp_path):
+    navegador = TelaFalsa()
+    capturar_falha(navegador, falha(0))
+    with coletar_artefatos(None) as coletor:
+        assert coletor is None
+    with coletar_artefatos(str(tmp_path)) as coletor:
+        capturar_falha(navegador, ResultadoRegistro(0))
+        capturar_falha(navegador, falha(1))
+    assert Artefatos._coletor is None
+    assert navegador.capturas == 1 and coletor.gravados == 1
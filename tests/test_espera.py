@@ -0,0 +1,69 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from Espera import FORMULARIO, GerenciadorEspera, espera, reiniciar_espera
+from Retentativa import Politica
+
+ANO = (By.ID, "yearbox")
+SEM_PAUSA = Politica(espera_inicial=0)
+
+
+def test_elemento_localizado_uma_vez_por_registro(pagina):
+    elemento = pagina.adicionar(ANO)
+    gerenciador = GerenciadorEspera(pagina)
+    assert gerenciador.elemento(ANO) is elemento
+    assert gerenciador.elemento(ANO, EC.visibility_of_element_located) is elemento
+    assert pagina.consultas == [ANO]
+
+    gerenciador.reiniciar()
+    gerenciador.elemento(ANO)
+    assert pagina.consultas == [ANO, ANO]
+
+
+def test_formulario_aguardado_uma_vez_com_os_elementos_fixos(pagina):
+    pagina.adicionar(FORMULARIO)
+    elemento = pagina.adicionar(ANO)
+    gerenciador = GerenciadorEspera(pagina)
+    localizacoes = []
+
+    def localizar_todos():
+        localizacoes.append(1)
+        return {ANO: elemento}
+
+    gerenciador.aguardar_formulario(localizar_todos)
+    gerenciador.aguardar_formulario(localizar_todos)
+    assert gerenciador.elemento(ANO) is elemento
+    assert pagina.consultas == [FORMULARIO]
+    assert localizacoes == [1]
+
+
+def test_elemento_removido_e_localizado_de_novo(pagina):
+    antigo = pagina.adicionar(ANO)
+    gerenciador = GerenciadorEspera(pagina)
+    gerenciador.elemento(ANO)
+
+    antigo.removido = True
+    novo = pagina.adicionar(ANO)
+    gerenciador.usar(ANO, EC.presence_of_element_located, lambda elemento: elemento.send_keys("1990"), SEM_PAUSA)
+    assert novo.textos == ["1990"] and antigo.textos == []
+    assert gerenciador.elemento(ANO) is novo
+
+
+def test_elemento_ausente_esgota_o_tempo_limite(pagina):
+    gerenciador = GerenciadorEspera(pagina, tempo_limite=0.1, intervalo=0.01)
+    with pytest.raises(TimeoutException):
+        gerenciador.elemento(ANO)
+
+
+def test_um_gerenciador_por_navegador(pagina):
+    outra = type(pagina)()
+    assert espera(pagina) is espera(pagina)
+    assert espera(pagina) is not espera(outra)
+
+    pagina.adicionar(ANO)
+    espera(pagina).elemento(ANO)
+    reiniciar_espera(pagina)
+    espera(pagina).elemento(ANO)
+    assert pagina.consultas == [ANO, ANO]
@@ -0,0 +1,71 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from Espera import FORMULARIO
+from Formulario import ACOES, CAMPOS_CADASTRO, ESQUEMA, LOCALIZADORES, executar_campo, preencher_registro
+
+RADIO = (By.CSS_SELECTOR, "input[type='radio'][value='FeMale']")
+CHECKBOX = (By.CSS_SELECTOR, "input[type='checkbox'][value='Movies']")
+LISTA_IDIOMAS = (By.CSS_SELECTOR, "multi-select ul")
+IDIOMA = (By.LINK_TEXT, "English")
+
+
+@pytest.fixture
+def cadastro(pagina):
+    pagina.adicionar(FORMULARIO)
+    for campo in CAMPOS_CADASTRO:
+        for localizador in LOCALIZADORES[campo.nome]:
+            if "{}" not in localizador[1]:
+                pagina.adicionar(localizador, "select" if campo.tipo in ("select", "data") else "input")
+    for localizador in (RADIO, CHECKBOX, IDIOMA):
+        pagina.adicionar(localizador)
+    return pagina
+
+
+def test_acoes_cobrem_todos_os_tipos_do_esquema():
+    assert {campo.tipo for campo in ESQUEMA} == set(ACOES)
+
+
+def test_preenche_a_tela_de_cadastro(cadastro, registro_valido):
+    resultados = preencher_registro(cadastro, registro_valido, CAMPOS_CADASTRO)
+    assert [resultado.campo for resultado in resultados] == [campo.nome for campo in CAMPOS_CADASTRO]
+    assert all(resultado.sucesso for resultado in resultados)
+
+    def elemento(nome, indice=0):
+        return cadastro.elementos[LOCALIZADORES[nome][indice]]
+
+    assert elemento("nome").textos == ["Ana"]
+    assert elemento("senha", 0).textos == elemento("senha", 1).textos == ["Senha123"]
+    assert cadastro.elementos[RADIO].cliques == cadastro.elementos[CHECKBOX].cliques == 1
+    assert cadastro.elementos[IDIOMA].cliques == 1
+    assert elemento("skill").valor == "Python"
+    assert elemento("data", 0).textos == ["1990"]
+    assert (elemento("data", 1).valor, elemento("data", 2).valor) == ("May", "3")
+    assert any(argumentos == (elemento("pais"), "Brasil") for _, argumentos in cadastro.scripts)
+    assert elemento("imagem").textos == [] and elemento("cadastro").cliques == 1
+
+
+def test_elementos_fixos_nao_sao_aguardados_um_a_um(cadastro, registro_valido):
+    preencher_registro(cadastro, registro_valido, CAMPOS_CADASTRO)
+    assert sorted(cadastro.consultas) == sorted([FORMULARIO, RADIO, CHECKBOX, LISTA_IDIOMAS, IDIOMA])
+
+
+def test_falha_interrompe_o_preenchimento(cadastro, registro_valido):
+    cadastro.elementos[CHECKBOX].selecionado = True
+    resultados = preencher_registro(cadastro, registro_valido, CAMPOS_CADASTRO)
+    assert (resultados[-1].campo, resultados[-1].sucesso) == ("hobbies", False)
+    assert "já estava selecionado" in resultados[-1].erro
+    assert cadastro.elementos[LOCALIZADORES["skill"][0]].valor is None
+
+
+def test_valor_invalido_nao_acessa_o_navegador(pagina):
+    resultado = executar_campo(pagina, "telefone", "123")
+    assert not resultado.sucesso and resultado.erro == "Formato inválido. Insira 10 dígitos."
+    assert pagina.consultas == []
+
+
+def test_tela_de_login_nao_aguarda_o_formulario(pagina):
+    email = pagina.adicionar(LOCALIZADORES["login"][0])
+    assert executar_campo(pagina, "login", "ana@email.com").sucesso
+    assert email.textos == ["ana@email.com"]
+    assert pagina.consultas == [LOCALIZADORES["login"][0]]
@@ -0,0 +1,46 @@
+from selenium.webdriver.common.by import By
+
+from Espera import FORMULARIO, espera
+from Formulario import ESQUEMA
+from Localizadores import SCRIPT_LOCALIZACAO, localizador_css, localizadores_fixos, montar_registro, resolver_todos
+
+
+def test_localizador_preferido():
+    assert localizador_css("#yearbox") == (By.ID, "yearbox")
+    assert localizador_css("#eid input[type='email']") == (By.CSS_SELECTOR, "#eid input[type='email']")
+    registro = montar_registro(ESQUEMA)
+    assert registro["data"] == ((By.ID, "yearbox"), (By.CSS_SELECTOR, "select[placeholder='Month']"), (By.ID, "daybox"))
+
+
+def test_fixos_apenas_da_tela_de_cadastro_e_sem_valores_do_registro():
+    seletores = set(localizadores_fixos(ESQUEMA).values())
+    assert {"#yearbox", "#msdd", "#submitbtn", "#firstpassword", "#secondpassword"} <= seletores
+    assert "#email" not in seletores and "multi-select ul" not in seletores
+    assert not any("{}" in seletor for seletor in seletores)
+
+
+def test_resolver_todos_em_uma_consulta(pagina):
+    fixos = localizadores_fixos(ESQUEMA)
+    ano, dia = pagina.adicionar((By.ID, "yearbox")), pagina.adicionar((By.ID, "daybox"))
+    assert resolver_todos(pagina, fixos) == {(By.ID, "yearbox"): ano, (By.ID, "daybox"): dia}
+    assert pagina.consultas == []
+
+
+def test_elementos_resolvidos_dispensam_a_espera(pagina):
+    fixos = localizadores_fixos(ESQUEMA)
+    pagina.adicionar(FORMULARIO)
+    ano = pagina.adicionar((By.ID, "yearbox"))
+    espera(pagina).aguardar_formulario(lambda: resolver_todos(pagina, fixos))
+    assert espera(pagina).elemento((By.ID, "yearbox")) is ano
+    assert pagina.consultas == [FORMULARIO]
+
+
+def test_script_recebe_os_seletores_na_ordem_dos_localizadores():
+    class Pagina:
+        def execute_script(self, script, seletores):
+            self.chamada = (script, seletores)
+            return [None] * len(seletores)
+
+    pagina, fixos = Pagina(), localizadores_fixos(ESQUEMA)
+    assert resolver_todos(pagina, fixos) == {}
+    assert pagina.chamada == (SCRIPT_LOCALIZACAO, list(fixos.values()))
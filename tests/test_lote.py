@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+
+import pytest
+
+import Lote
+import Sessoes
+from Resultado import ResultadoRegistro
+
+
+def test_falha_sessao_tem_as_mesmas_chaves_do_resultado():
+    falha = Lote._falha_sessao(3, "Nenhuma sessão ativa.", sessao=1)
+    assert set(falha) == set(ResultadoRegistro(3).como_dict()) | {"sessao"}
+    assert falha["status"] == "falha" and falha["retentativas"] == 0
+
+
+@pytest.fixture
+def sem_chrome(monkeypatch):
+    def criar_navegador(*args, **kwargs):
+        raise RuntimeError("Chrome indisponível")
+
+    monkeypatch.setattr(Sessoes, "criar_navegador", criar_navegador)
+    monkeypatch.setattr(Lote, "resolver_driver", lambda: "chromedriver")
+
+
+@pytest.fixture
+def arquivo_registros(tmp_path, registro_valido):
+    def criar(quantidade: int):
+        caminho = tmp_path / "registros.jsonl"
+        caminho.write_text((json.dumps(registro_valido) + "\n") * quantidade, encoding="utf-8")
+        return str(caminho)
+
+    return criar
+
+
+def ler_resultados(caminho) -> list:
+    with open(caminho, encoding="utf-8") as arquivo:
+        return [json.loads(linha) for linha in arquivo]
+
+
+@pytest.mark.parametrize("executar", [Lote.executar_paralelo, Lote.executar_assincrono])
+def test_sem_sessoes_todos_os_registros_sao_gravados_como_falha(tmp_path, sem_chrome, arquivo_registros, executar):
+    saida = str(tmp_path / "resultados.jsonl")
+    resumo = executar(arquivo_registros(3), saida, sessoes=2)
+    assert resumo == {"ok": 0, "falha": 3, "retentativas": 0}
+    assert sorted(resultado["indice"] for resultado in ler_resultados(saida)) == [0, 1, 2]
+
+
+def test_assincrono_mantem_todas_as_sessoes_ocupadas(tmp_path, monkeypatch, navegadores, arquivo_registros):
+    sessoes = min(32, (os.cpu_count() or 1) + 4) + 2
+    todas = threading.Barrier(sessoes, timeout=10)
+
+    def preencher(navegador, registro, pular_login):
+        todas.wait()
+        return []
+
+    monkeypatch.setitem(Lote.MODOS, "rapido", preencher)
+    monkeypatch.setattr(Lote, "resolver_driver", lambda: "chromedriver")
+    saida = str(tmp_path / "resultados.jsonl")
+    resumo = Lote.executar_assincrono(arquivo_registros(sessoes), saida, sessoes=sessoes, modo="rapido")
+    assert resumo["ok"] == sessoes
+    assert {resultado["sessao"] for resultado in ler_resultados(saida)} == set(range(sessoes))
+
+
+def test_gravador_resultados_acumula_e_grava(tmp_path):
+    saida = str(tmp_path / "resultados.jsonl")
+    with Lote.GravadorResultados(saida) as gravador:
+        gravador.gravar(dict(ResultadoRegistro(0).como_dict(), retentativas=2))
+        gravador.gravar(Lote._falha_sessao(1, "Nenhuma sessão ativa."))
+    assert gravador.resumo == {"ok": 1, "falha": 1, "retentativas": 2}
+    assert gravador.falhas == [{"indice": 1, "erro": "Nenhuma sessão ativa."}]
+    assert [resultado["indice"] for resultado in ler_resultados(saida)] == [0, 1]
+
+
+@pytest.mark.parametrize("executar", [Lote.executar_lote, Lote.executar_paralelo, Lote.executar_assincrono])
+def test_invalidos_sao_gravados_antes_de_abrir_o_navegador(tmp_path, monkeypatch, sem_chrome, registro_valido, executar):
+    entrada, saida = tmp_path / "registros.jsonl", str(tmp_path / "resultados.jsonl")
+    registros = [registro_valido, registro_valido, dict(registro_valido, email="x")]
+    entrada.write_text("".join(json.dumps(registro) + "\n" for registro in registros), encoding="utf-8")
+    gravados_ao_abrir = []
+
+    def resolver_driver():
+        gravados_ao_abrir.append([resultado["indice"] for resultado in ler_resultados(saida)])
+        return "chromedriver"
+
+    def obter_navegador(*args, **kwargs):
+        resolver_driver()
+        raise RuntimeError("Chrome indisponível")
+
+    monkeypatch.setattr(Lote, "resolver_driver", resolver_driver)
+    monkeypatch.setattr(Lote.TesteAutomatizado, "obter_navegador", obter_navegador)
+    kwargs = {} if executar is Lote.executar_lote else {"sessoes": 2}
+    resumo = executar(str(entrada), saida, **kwargs)
+    assert resumo["falha"] == 3
+    assert gravados_ao_abrir[0] == [2]
+
+
+def test_cli_validate_aceita_os_aliases_em_portugues(tmp_path, registro_valido):
+    entrada, validos = tmp_path / "registros.jsonl", tmp_path / "validos.jsonl"
+    entrada.write_text(json.dumps(registro_valido) + "\n" + json.dumps(dict(registro_valido, email="x")) + "\n", encoding="utf-8")
+    assert Lote.executar_cli(["validate", "--entrada", str(entrada), "--validos", str(validos)]) == 1
+    assert ler_resultados(validos) == [registro_valido]
+
+
+def test_cli_run_rejeita_opcoes_incompativeis(tmp_path, arquivo_registros, capsys):
+    with pytest.raises(SystemExit) as saida:
+        Lote.executar_cli(["run", "--entrada", arquivo_registros(1), "--sessoes", "1", "--reciclar-apos", "10"])
+    assert saida.value.code == 2
+    assert "registros por sessão" in capsys.readouterr().err
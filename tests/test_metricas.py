@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from Metricas import ColetorMetricas, coletar, medir, notificar, notificar_retentativas, percentil
+
+
+@pytest.mark.parametrize("p, esperado", [(0, 1), (10, 1), (50, 5), (95, 10), (100, 10)])
+def test_percentil_posto_mais_proximo(p, esperado):
+    assert percentil(list(range(1, 11)), p) == esperado
+
+
+def test_percentil_lista_vazia_ou_unica():
+    assert percentil([], 95) == 0.0
+    assert percentil([3.5], 50) == 3.5
+
+
+def test_coletor_resumo():
+    coletor = ColetorMetricas()
+    for tempo in (0.3, 0.1, 0.2):
+        coletor("campo", tempo, "ok")
+    coletor("campo", 0.4, "falha")
+    coletor.retentativas("campo", 2)
+    resumo = coletor.resumo()["campo"]
+    assert resumo["quantidade"] == 4
+    assert resumo["falhas"] == 1
+    assert resumo["retentativas"] == 2
+    assert resumo["p50"] == 0.2
+    assert resumo["max"] == 0.4
+
+
+def test_coletar_grava_o_relatorio(tmp_path):
+    caminho = str(tmp_path / "metricas.json")
+    with coletar(caminho):
+        with medir("etapa"):
+            pass
+        notificar("registro", 1.0, "falha")
+        notificar_retentativas("registro", 3)
+    with open(caminho, encoding="utf-8") as arquivo:
+        etapas = json.load(arquivo)["etapas"]
+    assert etapas["etapa"]["quantidade"] == 1
+    assert etapas["registro"]["falhas"] == 1
+    assert etapas["registro"]["retentativas"] == 3
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+import Navegador
+from Navegador import ler_cache, resolver_driver, salvar_cache
+
+
+class GerenciadorFalso:
+    """
+        ChromeDriverManager falso
+        -------------------------
+        Conta as instalações e, com 'erro', simula a falta de rede.
+    """
+
+    instalacoes = 0
+    erro = None
+    caminho = None
+
+    def install(self):
+        GerenciadorFalso.instalacoes += 1
+        if GerenciadorFalso.erro:
+            raise GerenciadorFalso.erro
+        return GerenciadorFalso.caminho
+
+
+@pytest.fixture
+def gerenciador(tmp_path, monkeypatch):
+    monkeypatch.setenv(Navegador.VARIAVEL_CACHE, str(tmp_path / "cache"))
+    monkeypatch.delenv(Navegador.VARIAVEL_DRIVER, raising=False)
+    monkeypatch.setattr(Navegador, "versao_chrome", lambda: "120.0")
+    monkeypatch.setattr(Navegador, "ChromeDriverManager", GerenciadorFalso)
+    monkeypatch.setattr(GerenciadorFalso, "instalacoes", 0)
+    monkeypatch.setattr(GerenciadorFalso, "erro", None)
+    monkeypatch.setattr(GerenciadorFalso, "caminho", criar_driver(tmp_path / "novo"))
+    return GerenciadorFalso
+
+
+def criar_driver(pasta) -> str:
+    pasta.mkdir(parents=True)
+    driver = pasta / "chromedriver"
+    driver.write_text("")
+    return str(driver)
+
+
+def test_cache_da_versao_dispensa_o_gerenciador(tmp_path, gerenciador):
+    driver = criar_driver(tmp_path / "120")
+    salvar_cache("120.0", driver)
+    assert resolver_driver() == driver
+    assert gerenciador.instalacoes == 0
+
+
+def test_versao_nova_instala_e_grava_o_cache(gerenciador):
+    assert resolver_driver() == gerenciador.caminho
+    assert ler_cache()["120.0"]["caminho"] == gerenciador.caminho
+    assert resolver_driver() == gerenciador.caminho
+    assert gerenciador.instalacoes == 1
+
+
+def test_cache_com_driver_apagado_instala_novamente(tmp_path, gerenciador):
+    salvar_cache("120.0", str(tmp_path / "apagado" / "chromedriver"))
+    assert resolver_driver() == gerenciador.caminho
+    assert gerenciador.instalacoes == 1
+
+
+def test_sem_rede_usa_o_driver_mais_recente_do_cache(tmp_path, gerenciador):
+    antigo, recente = criar_driver(tmp_path / "118"), criar_driver(tmp_path / "119")
+    cache = {"119.0": {"caminho": recente, "atualizado": 2}, "118.0": {"caminho": antigo, "atualizado": 1}}
+    (tmp_path / "cache").mkdir()
+    (tmp_path / "cache" / "chromedriver.json").write_text(json.dumps(cache), encoding="utf-8")
+    gerenciador.erro = ConnectionError("sem rede")
+    assert resolver_driver() == recente
+
+
+def test_sem_rede_e_sem_cache_propaga_o_erro(gerenciador):
+    gerenciador.erro = ConnectionError("sem rede")
+    with pytest.raises(ConnectionError):
+        resolver_driver()
+
+
+def test_caminho_explicito_inexistente(tmp_path, gerenciador):
+    with pytest.raises(FileNotFoundError):
+        resolver_driver(str(tmp_path / "chromedriver"))
+    assert gerenciador.instalacoes == 0
@@ -0,0 +1,113 @@
+import importlib.util
+import io
+
+import pytest
+
+from Palindromo import Palindromo
+
+
+requer_numpy = pytest.mark.skipif(importlib.util.find_spec("numpy") is None, reason="NumPy não instalado")
+
+
+@requer_numpy
+@pytest.mark.parametrize("palavras", [["ovo", ""], ["", ""], [""], ["Arara", "casa", "", "Radar"]])
+def test_verificar_lote_um_resultado_por_palavra(palavras):
+    esperado = [Palindromo.verificar(palavra) for palavra in palavras]
+    assert Palindromo.verificar_lote(palavras).tolist() == esperado
+    validos = [Palindromo.verificar(palavra) and Palindromo.entrada_valida(palavra) for palavra in palavras]
+    assert Palindromo.verificar_lote(palavras, validar=True).tolist() == validos
+
+
+@requer_numpy
+def test_verificar_lote_vazio():
+    assert Palindromo.verificar_lote([]).tolist() == []
+    assert Palindromo.verificar_lote(b"").tolist() == []
+
+
+@requer_numpy
+def test_verificar_lote_bytes_ignora_apenas_a_quebra_final():
+    assert Palindromo.verificar_lote(b"ovo\ncasa\n").tolist() == [True, False]
+    assert Palindromo.verificar_lote(b"ovo\n\n", validar=True).tolist() == [True, False]
+
+
+@requer_numpy
+def test_verificar_lote_lista_usa_as_regras_de_verificar():
+    palavras = ["a\na", "a\nb", " ovo", "ovo "]
+    assert Palindromo.verificar_lote(palavras).tolist() == [Palindromo.verificar(palavra) for palavra in palavras]
+    assert Palindromo.verificar_lote(iter(["ovo", "casa"])).tolist() == [True, False]
+
+
+@requer_numpy
+def test_verificar_lote_bytes_agrupados_por_tamanho():
+    palavras = ["", "a", "Ab", "abA", "abcd", "abBA", "x" * 300, "x" * 299 + "y", "Reviver", "ovo1ovo", "ÄrÄ", "Ärä", "a b a"]
+    dados = ("\n".join(palavras) + "\n").encode("utf-8")
+    assert Palindromo.verificar_lote(dados).tolist() == [Palindromo.verificar(palavra) for palavra in palavras]
+    validos = [Palindromo.verificar(palavra) and Palindromo.entrada_valida(palavra) for palavra in palavras]
+    assert Palindromo.verificar_lote(dados, validar=True).tolist() == validos
+
+
+@requer_numpy
+def test_verificar_lote_igual_a_verificar():
+    palavras = ["", "a", "Ab", "abBA", "ovo1ovo", "ÄrÄ", "Ärä", "x y x", "Reviver", "casa", "ab" * 40 + "ba" * 40]
+    assert Palindromo.verificar_lote(palavras).tolist() == [Palindromo.verificar(p) for p in palavras]
+    validos = [Palindromo.verificar(p) and Palindromo.entrada_valida(p) for p in palavras]
+    assert Palindromo.verificar_lote(palavras, validar=True).tolist() == validos
+
+
+@pytest.mark.parametrize("palavra, esperado", [
+    ("", True), ("a", True), ("Arara", True), ("Radar", True), ("casa", False), ("Ab", False),
+    ("ab" * 40 + "ba" * 40, True), ("ab" * 40 + "bc" * 40, False),
+])
+def test_verificar(palavra, esperado):
+    assert Palindromo.verificar(palavra) is esperado
+
+
+@pytest.mark.parametrize("palavra", ["", "a", "Arara", "Ab", "ÄrÄ", "ab" * 40 + "BA" * 40, "ab" * 40 + "bc" * 40, "abcxcbA"])
+def test_verificar_extremos_igual_a_verificar(palavra):
+    assert Palindromo.verificar_extremos(palavra) is Palindromo.verificar(palavra)
+
+
+def test_verificar_extremos_com_pares():
+    assert Palindromo.verificar_extremos("abXcba", pares=2)
+    assert not Palindromo.verificar_extremos("abXcba")
+    assert not Palindromo.verificar_extremos("xbcba", pares=1)
+
+
+def test_verificar_palavras_preserva_a_ordem():
+    assert list(Palindromo.verificar_palavras(iter(["ovo", "casa", "Reviver"]))) == [True, False, True]
+
+
+@pytest.mark.parametrize("entrada, esperado", [("Arara", True), ("", False), ("ovo1", False), ("x y", False), (None, False)])
+def test_entrada_valida(entrada, esperado):
+    assert Palindromo.entrada_valida(entrada) is esperado
+
+
+TEXTO = "ovo\n  casa \n\nArara\nab1\nRadar\n" * 50
+
+
+@pytest.mark.parametrize("veredictos", [False, True])
+def test_varrer(veredictos):
+    saida = io.StringIO()
+    resumo = Palindromo.varrer(io.StringIO(TEXTO), saida, veredictos=veredictos)
+    assert (resumo["palavras"], resumo["palindromos"], resumo["invalidas"]) == (250, 150, 50)
+    linhas = saida.getvalue().splitlines()
+    if veredictos:
+        assert linhas[:5] == ["ovo\tpalindromo", "casa\tnao_palindromo", "Arara\tpalindromo", "ab1\tinvalida", "Radar\tpalindromo"]
+    else:
+        assert linhas[:3] == ["ovo", "Arara", "Radar"]
+
+
+@pytest.mark.parametrize("veredictos", [False, True])
+def test_varrer_arquivo_igual_a_varrer(tmp_path, veredictos):
+    caminho = tmp_path / "palavras.txt"
+    caminho.write_bytes(TEXTO.encode("utf-8"))
+
+    esperado = io.StringIO()
+    resumo_esperado = Palindromo.varrer(io.StringIO(TEXTO), esperado, veredictos=veredictos)
+    saida = io.StringIO()
+    resumo = Palindromo.varrer_arquivo(str(caminho), saida, veredictos=veredictos, processos=2, tamanho_bloco=64)
+
+    assert saida.getvalue() == esperado.getvalue()
+    for chave in ("palavras", "palindromos", "invalidas"):
+        assert resumo[chave] == resumo_esperado[chave]
+
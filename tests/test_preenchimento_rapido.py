@@ -0,0 +1,59 @@
+import pytest
+
+import PreenchimentoRapido
+from Formulario import CAMPOS_CADASTRO, CAMPOS_LOGIN
+from PreenchimentoRapido import _etapas, montar_entradas, preencher_formulario_rapido
+from Resultado import ResultadoCampo
+
+
+def test_entradas_no_formato_do_script(registro_valido):
+    entradas = {entrada["seletores"][0]: entrada for entrada in montar_entradas(registro_valido)}
+    assert [entrada["tipo"] for entrada in entradas.values()] == [
+        "texto", "texto", "texto", "texto", "texto", "radio", "checkbox", "select", "select", "data", "texto",
+    ]
+    assert entradas["input[type='radio'][value='{}']"]["valor"] == "FeMale"
+    assert entradas["input[type='checkbox'][value='{}']"]["valor"] == ["Movies"]
+    assert entradas["#yearbox"]["valor"] == ["1990", "May", "3"]
+    assert entradas["#firstpassword"]["seletores"] == ["#firstpassword", "#secondpassword"]
+    assert entradas["#countries"]["criarOpcao"] and not entradas["#Skills"]["criarOpcao"]
+
+
+@pytest.fixture
+def chamadas(monkeypatch):
+    chamadas = []
+
+    def registrar(nome):
+        def etapa(*args):
+            chamadas.append((nome, args[1:]))
+            return ResultadoCampo(nome, "ok", 0.0)
+        return etapa
+
+    monkeypatch.setattr(PreenchimentoRapido, "preencher_campos", registrar("script"))
+    monkeypatch.setattr(PreenchimentoRapido, "selecionar_idiomas_lote", registrar("idiomas"))
+    monkeypatch.setattr(PreenchimentoRapido, "executar_campo", registrar("motor"))
+    return chamadas
+
+
+def test_etapas_agrupam_os_campos_rapidos_em_um_script(registro_valido, chamadas):
+    for etapa in _etapas(object(), registro_valido, CAMPOS_CADASTRO):
+        etapa()
+    assert [(nome, args[0] if nome == "motor" else args) for nome, args in chamadas] == [
+        ("script", (registro_valido,)),
+        ("idiomas", (["English"],)),
+        ("motor", next(campo for campo in CAMPOS_CADASTRO if campo.nome == "imagem")),
+        ("motor", next(campo for campo in CAMPOS_CADASTRO if campo.nome == "cadastro")),
+    ]
+
+
+def test_etapas_da_tela_de_login_usam_o_motor(registro_valido, chamadas):
+    for etapa in _etapas(object(), registro_valido, CAMPOS_LOGIN):
+        etapa()
+    assert [(nome, args[0].nome, args[1]) for nome, args in chamadas] == [
+        ("motor", "login", "ana@email.com"), ("motor", "confirmar_login", None),
+    ]
+
+
+def test_registro_invalido_nao_acessa_o_navegador(registro_valido, chamadas):
+    resultados = preencher_formulario_rapido(object(), dict(registro_valido, telefone="123"))
+    assert [(resultado.campo, resultado.sucesso) for resultado in resultados] == [("validacao", False)]
+    assert chamadas == []
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from Retentativa import (Politica, configurar_retentativas, contar_retentativas, orcamento_registro, politica,
+                         repetir, tempo_restante, verificar_orcamento)
+
+
+RAPIDA = Politica(tentativas=3, espera_inicial=0.001, espera_maxima=0.001)
+
+
+def acao_instavel(falhas: int):
+    chamadas = []
+
+    def acao():
+        chamadas.append(1)
+        if len(chamadas) <= falhas:
+            raise StaleElementReferenceException("elemento recriado")
+        return "ok"
+
+    return acao, chamadas
+
+
+def test_repetir_ate_o_sucesso():
+    acao, chamadas = acao_instavel(2)
+    with contar_retentativas() as contador:
+        assert repetir(acao, RAPIDA) == "ok"
+    assert len(chamadas) == 3
+    assert contador[0] == 2
+
+
+def test_repetir_propaga_a_ultima_excecao():
+    acao, chamadas = acao_instavel(5)
+    with pytest.raises(StaleElementReferenceException):
+        repetir(acao, RAPIDA)
+    assert len(chamadas) == RAPIDA.tentativas
+
+
+def test_repetir_nao_repete_excecoes_fora_da_politica():
+    chamadas = []
+
+    def acao():
+        chamadas.append(1)
+        raise ValueError("erro do registro")
+
+    with pytest.raises(ValueError):
+        repetir(acao, RAPIDA)
+    assert len(chamadas) == 1
+
+
+def test_pausa_exponencial_limitada():
+    politica_acao = Politica(espera_inicial=0.1, fator=2, espera_maxima=0.3)
+    assert [politica_acao.pausa(tentativa) for tentativa in (1, 2, 3, 4)] == pytest.approx([0.1, 0.2, 0.3, 0.3])
+
+
+def test_configurar_retentativas_substitui_as_tentativas():
+    with configurar_retentativas(tentativas=7):
+        assert politica("botao").tentativas == 7
+    assert politica("botao").tentativas == 4
+    with pytest.raises(ValueError):
+        with configurar_retentativas(tentativas=0):
+            pass
+
+
+def test_orcamento_registro():
+    assert tempo_restante(5) == 5
+    with orcamento_registro(10):
+        assert 0 < tempo_restante() <= 10
+        assert tempo_restante(1) == 1
+    assert tempo_restante() is None
+
+    with orcamento_registro(0.01):
+        time.sleep(0.02)
+        assert tempo_restante() == 0
+        with pytest.raises(TimeoutError):
+            verificar_orcamento()
+
+
+def test_orcamento_padrao_de_configurar_retentativas():
+    with configurar_retentativas(orcamento=10), orcamento_registro():
+        assert 0 < tempo_restante() <= 10
+    with orcamento_registro():
+        assert tempo_restante() is None
+
+
+def test_repetir_respeita_o_orcamento():
+    acao, chamadas = acao_instavel(5)
+    lenta = Politica(tentativas=5, espera_inicial=1, espera_maxima=1)
+    inicio = time.perf_counter()
+    with orcamento_registro(0.5), pytest.raises(StaleElementReferenceException):
+        repetir(acao, lenta)
+    assert len(chamadas) == 1
+    assert time.perf_counter() - inicio < 0.5
@@ -0,0 +1,85 @@
+import pytest
+
+import Sessoes
+from Sessoes import PoolSessoes
+
+URL = "http://127.0.0.1/Register.html"
+
+
+def test_sessao_reutilizada_e_limpa_entre_registros(navegadores):
+    pool = PoolSessoes(1, url=URL)
+    assert pool.aquecer() == 1
+    for _ in range(3):
+        with pool.sessao() as sessao:
+            assert sessao.navegador is navegadores[0]
+    pool.encerrar()
+
+    assert len(navegadores) == 1
+    assert navegadores[0].limpezas == 3
+    assert navegadores[0].paginas == [URL] * 4
+    assert Sessoes.SCRIPT_LIMPEZA in navegadores[0].scripts
+    assert navegadores[0].encerrado
+
+
+def test_reciclagem_por_numero_de_registros(navegadores):
+    pool = PoolSessoes(1, url=URL, registros_por_sessao=2)
+    pool.aquecer()
+    usados = []
+    for _ in range(3):
+        with pool.sessao() as sessao:
+            usados.append(sessao.navegador)
+    pool.encerrar()
+
+    assert usados == [navegadores[0], navegadores[0], navegadores[1]]
+    assert navegadores[0].encerrado and navegadores[0].limpezas == 1
+
+
+def test_reciclagem_por_memoria(navegadores):
+    pool = PoolSessoes(1, url=URL, memoria_maxima=100)
+    pool.aquecer()
+    navegadores[0].memoria = 150 * 2**20
+    with pool.sessao():
+        pass
+    with pool.sessao() as sessao:
+        assert sessao.navegador is navegadores[1]
+    pool.encerrar()
+    assert navegadores[0].encerrado
+
+
+def test_navegador_sem_resposta_reaberto_no_emprestimo(navegadores):
+    pool = PoolSessoes(2, url=URL)
+    pool.aquecer()
+    for navegador in navegadores:
+        navegador.ativo = False
+    sessoes = [pool.emprestar(), pool.emprestar()]
+    assert {sessao.navegador for sessao in sessoes} == set(navegadores[2:])
+    assert all(navegador.encerrado for navegador in navegadores[:2])
+    pool.encerrar()
+
+
+def test_sessao_que_nao_reabre_e_descartada(navegadores, monkeypatch):
+    pool = PoolSessoes(1, url=URL)
+    pool.aquecer()
+    navegadores[0].ativo = False
+
+    def criar_navegador(*args, **kwargs):
+        raise RuntimeError("Chrome indisponível")
+
+    monkeypatch.setattr(Sessoes, "criar_navegador", criar_navegador)
+    with pytest.raises(RuntimeError, match="Nenhuma sessão ativa"):
+        pool.emprestar()
+
+
+def test_aquecimento_descarta_as_sessoes_que_falham(navegadores, monkeypatch):
+    criar = Sessoes.criar_navegador
+
+    def criar_navegador(*args, sessao=None, **kwargs):
+        if sessao == 1:
+            raise RuntimeError("Chrome indisponível")
+        return criar(*args, sessao=sessao, **kwargs)
+
+    monkeypatch.setattr(Sessoes, "criar_navegador", criar_navegador)
+    pool = PoolSessoes(3, url=URL, lancamentos=1)
+    assert pool.aquecer() == 2
+    assert sorted(pool.emprestar().numero for _ in range(2)) == [0, 2]
+    pool.encerrar()
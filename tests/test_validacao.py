@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from Lote import ler_registros, normalizar_registro
+from Validacao import CAMPOS_VALIDADOS_CADASTRO, LinhaInvalida, erros_registro, separar_registros, validar_arquivo
+
+
+def test_registro_valido_sem_erros(registro_valido):
+    assert erros_registro(registro_valido) == []
+
+
+def test_todos_os_erros_do_registro(registro_valido):
+    registro = dict(registro_valido, email_login="ana", telefone="123", sobrenome="")
+    campos = {campo for campo, _ in erros_registro(registro)}
+    assert campos == {"login", "telefone", "sobrenome"}
+
+
+def test_cadastro_dispensa_email_login(registro_valido):
+    registro = dict(registro_valido)
+    del registro["email_login"]
+    assert erros_registro(registro)
+    assert erros_registro(registro, CAMPOS_VALIDADOS_CADASTRO) == []
+
+
+@pytest.mark.parametrize("ano, mensagem", [
+    ("-1", "Insira um ano entre 1916 e 2015."),
+    ("abc", "Insira o ano, o mês e o dia como números inteiros."),
+    (" ", "Os campos de ano, mês e dia não podem estar vazios."),
+])
+def test_normalizacao_preserva_o_motivo_do_erro_da_data(registro_valido, ano, mensagem):
+    registro = normalizar_registro(dict(registro_valido, ano=ano, mes="05", dia="3"))
+    assert (registro["mes"], registro["dia"]) == (5, 3)
+    assert erros_registro(registro) == [("data", mensagem)]
+
+
+def test_data_rejeita_booleanos(registro_valido):
+    registro = dict(registro_valido, dia=True)
+    assert erros_registro(registro) == [("data", "Insira o ano, o mês e o dia como números inteiros.")]
+
+
+def test_linhas_malformadas_viram_registros_invalidos(tmp_path, registro_valido):
+    arquivo = tmp_path / "registros.jsonl"
+    linhas = [json.dumps(registro_valido), "{quebrado", "", "[1, 2]", json.dumps(registro_valido)]
+    arquivo.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+
+    registros = list(ler_registros(str(arquivo)))
+    assert [type(registro) for registro in registros] == [dict, LinhaInvalida, LinhaInvalida, dict]
+    assert [registro.linha for registro in registros if isinstance(registro, LinhaInvalida)] == [2, 4]
+
+    separados = list(separar_registros(registros))
+    assert [bool(erros) for _, _, erros in separados] == [False, True, True, False]
+    assert separados[1][2][0][0] == "arquivo"
+
+
+def test_validar_arquivo_grava_os_validos(tmp_path, registro_valido):
+    entrada, validos = tmp_path / "registros.jsonl", tmp_path / "validos.jsonl"
+    linhas = [json.dumps(registro_valido), json.dumps(dict(registro_valido, email="x"))]
+    entrada.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+
+    invalidos = validar_arquivo(str(entrada), str(validos))
+    assert [indice for indice, _ in invalidos] == [1]
+    assert validos.read_text(encoding="utf-8").count("\n") == 1